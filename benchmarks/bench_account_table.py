@@ -0,0 +1,78 @@
+"""
+Allocations and time spent resolving account indices while parsing.
+
+Compares the cached 'Transaction.account_table' against rebuilding the
+combined account list on every access, as 'all_accounts' used to do.
+
+    python benchmarks/bench_account_table.py [--size N]
+"""
+
+import argparse
+import sys
+
+from common import corpus, timeit
+
+import soltxs
+from soltxs.normalizer.models import Transaction
+
+_built = {"count": 0, "bytes": 0}
+
+
+def _legacy_all_accounts(self: Transaction):
+    combined = list(self.message.accountKeys)
+    combined.extend(self.loadedAddresses.writable)
+    combined.extend(self.loadedAddresses.readonly)
+    _built["count"] += 1
+    _built["bytes"] += sys.getsizeof(combined)
+    return combined
+
+
+def _cached_all_accounts(self: Transaction):
+    if self._account_table is None:
+        _built["count"] += 1
+        _built["bytes"] += sys.getsizeof(self.account_table.keys)
+    return self.account_table.keys
+
+
+def _measure(txs, accessor):
+    """
+    Parses every transaction with 'all_accounts' served by 'accessor'.
+
+    Returns:
+        The best parse time and the lists built during one pass.
+    """
+
+    def run():
+        for tx in txs:
+            tx._account_table = None
+            soltxs.parse(tx)
+
+    original = Transaction.all_accounts
+    Transaction.all_accounts = property(accessor)
+    try:
+        _built.update(count=0, bytes=0)
+        run()
+        built = dict(_built)
+        return timeit(run), built
+    finally:
+        Transaction.all_accounts = original
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size", type=int, default=5_000)
+    args = ap.parse_args()
+
+    txs = [soltxs.normalize(p) for p in corpus(args.size)]
+
+    print(f"{'mode':>8} {'tx/s':>12} {'lists/tx':>9} {'bytes/tx':>9}")
+    for name, accessor in (("legacy", _legacy_all_accounts), ("cached", _cached_all_accounts)):
+        elapsed, built = _measure(txs, accessor)
+        print(
+            f"{name:>8} {args.size / elapsed:>12,.0f} "
+            f"{built['count'] / args.size:>9.2f} {built['bytes'] / args.size:>9,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Cold-start cost: importing soltxs and processing the first transaction.
+
+Every measurement runs in a fresh interpreter, like a newly spawned worker
+or a serverless handler. Reports the median over '--runs' processes of the
+time to 'import soltxs', then to process one PumpFun payload (which loads
+the registered resolvers and the parsers they need), and the same with
+entry point discovery disabled. '--importtime' prints the slowest modules
+from 'python -X importtime' instead.
+
+    python benchmarks/bench_import.py [--runs N] [--importtime]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from common import DATA_DIR, ROOT
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import soltxs
+imported = time.perf_counter()
+if {disable_plugins}:
+    soltxs.plugins.disable()
+soltxs.process(json.loads(open({payload!r}).read()))
+done = time.perf_counter()
+loaded = sorted(m for m in sys.modules if m.startswith("soltxs.parser.parsers."))
+print(json.dumps({{"import": imported - start, "first": done - imported, "parsers": loaded}}))
+"""
+
+
+def _run(disable_plugins: bool) -> dict:
+    script = _SCRIPT.format(disable_plugins=disable_plugins, payload=str(DATA_DIR / "pumpfun_buy_rpc.json"))
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def _importtime(top: int):
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import soltxs"], cwd=ROOT, capture_output=True, text=True
+    )
+    rows = []
+    for line in out.stderr.splitlines()[1:]:
+        head, cumulative_us, name = line.split("|")
+        rows.append((int(cumulative_us), int(head.split(":")[1]), name.strip()))
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  (self {self_us / 1000:>6.1f} ms)  {name}")
+
+
+def main():
+    args = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args.add_argument("--runs", type=int, default=10)
+    args.add_argument("--importtime", action="store_true")
+    args.add_argument("--top", type=int, default=20)
+    opts = args.parse_args()
+
+    if opts.importtime:
+        _importtime(opts.top)
+        return
+
+    for label, disable_plugins in (("entry points", False), ("no entry points", True)):
+        runs = [_run(disable_plugins) for _ in range(opts.runs)]
+        imported = statistics.median(r["import"] for r in runs) * 1000
+        first = statistics.median(r["first"] for r in runs) * 1000
+        print(f"{label}:")
+        print(f"  import soltxs:     {imported:>8.1f} ms")
+        print(f"  first process:     {first:>8.1f} ms")
+        print(f"  parser modules:    {', '.join(m.rsplit('.', 1)[-1] for m in runs[0]['parsers'])}")
+
+
+if __name__ == "__main__":
+    main()
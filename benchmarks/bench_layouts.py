@@ -0,0 +1,112 @@
+"""
+Per-instruction decode cost of fixed-layout payloads: qborsh schema vs 'Layout'.
+
+Each case decodes the same bytes through the generic qborsh schema path
+(plus the 'int(...)' wrapping the parsers used to apply) and through the
+precompiled 'struct' layout the parsers use now.
+
+    python benchmarks/bench_layouts.py [--number N]
+"""
+
+import argparse
+import os
+import struct
+import time
+
+import common  # noqa: F401  (puts the repository root on sys.path)
+import qborsh
+
+from soltxs.parser.parsers import pumpfun, raydiumAMM, systemProgram, tokenProgram
+
+
+@qborsh.schema
+class TradeEvent:
+    mint: qborsh.PubKey
+    sol_amount: qborsh.U64
+    token_amount: qborsh.U64
+    is_buy: qborsh.Bool
+    user: qborsh.PubKey
+    timestamp: qborsh.I64
+    virtual_sol_reserves: qborsh.U64
+    virtual_token_reserves: qborsh.U64
+
+
+@qborsh.schema
+class SystemTransfer:
+    discriminator: qborsh.Padding[qborsh.U32]
+    lamports: qborsh.U64
+
+
+@qborsh.schema
+class AmountPair:
+    discriminator: qborsh.Padding[qborsh.U8]
+    first: qborsh.U64
+    second: qborsh.U64
+
+
+@qborsh.schema
+class TokenTransfer:
+    discriminator: qborsh.Padding[qborsh.U8]
+    amount: qborsh.U64
+
+
+def _cases():
+    trade = os.urandom(32) + struct.pack("<QQ?", 5, 7, True) + os.urandom(32) + struct.pack("<qQQ", 1, 2, 3)
+    event = b"\x00" * pumpfun.SWAP_EVENT_OFFSET + trade
+    system_transfer = struct.pack("<IQ", 2, 1_000_000)
+    raydium_swap = struct.pack("<BQQ", 9, 1_000, 900)
+    token_transfer = struct.pack("<BQ", 3, 500)
+
+    def borsh_event():
+        data = TradeEvent.decode(event[16:])
+        return str(data["mint"]), str(data["user"]), int(data["sol_amount"]), int(data["token_amount"])
+
+    def layout_event():
+        mint, sol_amount, token_amount, _, user, *_ = pumpfun.SwapData.unpack(event, pumpfun.SWAP_EVENT_OFFSET)
+        return mint, user, sol_amount, token_amount
+
+    return [
+        ("PumpFun TradeEvent", borsh_event, layout_event),
+        (
+            "System Transfer",
+            lambda: int(SystemTransfer.decode(system_transfer)["lamports"]),
+            lambda: systemProgram.TransferData.unpack(system_transfer)[0],
+        ),
+        (
+            "Raydium Swap",
+            lambda: tuple(AmountPair.decode(raydium_swap).values()),
+            lambda: tuple(raydiumAMM.SwapData.unpack(raydium_swap)),
+        ),
+        (
+            "Token Transfer",
+            lambda: TokenTransfer.decode(token_transfer)["amount"],
+            lambda: tokenProgram.TransferData.unpack(token_transfer)[0],
+        ),
+    ]
+
+
+def _per_call_ns(fn, number: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def main():
+    args = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args.add_argument("--number", type=int, default=100_000)
+    opts = args.parse_args()
+
+    print(f"{'instruction':<20} {'qborsh ns':>10} {'layout ns':>10} {'speedup':>8}")
+    for name, borsh, layout in _cases():
+        assert borsh() == layout(), name
+        borsh_ns = _per_call_ns(borsh, opts.number)
+        layout_ns = _per_call_ns(layout, opts.number)
+        print(f"{name:<20} {borsh_ns:>10.0f} {layout_ns:>10.0f} {borsh_ns / layout_ns:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Throughput of rejecting uninteresting transactions before normalization.
+
+Builds a mixed feed where '--interesting' of the payloads are PumpFun or
+Raydium swaps and the rest are failed transactions or transactions of
+other programs, then compares processing every payload against running
+'Prefilter' first. Also reports the Bloom filter watchlist check.
+
+    python benchmarks/bench_prefilter.py [--size N] [--interesting F] [--wallets N]
+"""
+
+import argparse
+import copy
+import os
+
+import qbase58 as base58
+from common import corpus, timeit
+
+import soltxs
+from soltxs.parser.parsers.pumpfun import PumpFunParser
+from soltxs.parser.parsers.raydiumAMM import RaydiumAMMParser
+from soltxs.prefilter import Prefilter
+
+_PROGRAMS = (PumpFunParser.program_id, RaydiumAMMParser.program_id)
+_RPC = ["pumpfun_buy_rpc", "pumpfun_sell_rpc", "raydium_amm_v4_rpc"]
+
+
+def _other_program(payload: dict) -> dict:
+    payload = copy.deepcopy(payload)
+    message = payload["result"]["transaction"]["message"]
+    other = base58.encode(os.urandom(32))
+    message["accountKeys"] = [other if k in _PROGRAMS else k for k in message["accountKeys"]]
+    return payload
+
+
+def _failed(payload: dict) -> dict:
+    payload = copy.deepcopy(payload)
+    payload["result"]["meta"]["err"] = {"InstructionError": [0, "Custom"]}
+    return payload
+
+
+def _feed(size: int, interesting: float):
+    swaps = corpus(size, _RPC)
+    cut = int(size * interesting)
+    noise = [_other_program(p) if i % 2 else _failed(p) for i, p in enumerate(swaps[cut:])]
+    return swaps[:cut] + noise
+
+
+def main():
+    args = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args.add_argument("--size", type=int, default=3_000)
+    args.add_argument("--interesting", type=float, default=0.1)
+    args.add_argument("--wallets", type=int, default=300_000)
+    opts = args.parse_args()
+
+    feed = _feed(opts.size, opts.interesting)
+    prefilter = Prefilter()
+
+    def process_all():
+        for payload in feed:
+            soltxs.process(payload)
+
+    def process_filtered():
+        for payload in feed:
+            if prefilter.check(payload):
+                soltxs.process(payload)
+
+    baseline = timeit(process_all)
+    filtered = timeit(process_filtered)
+    print(f"{len(feed)} payloads, {opts.interesting:.0%} interesting")
+    print(f"  process all:       {len(feed) / baseline:>10,.0f} tx/s")
+    print(f"  prefilter+process: {len(feed) / filtered:>10,.0f} tx/s  ({baseline / filtered:.1f}x)")
+    print(f"  filter stats:      {prefilter.stats()}")
+
+    watchlist = [base58.encode(os.urandom(32)) for _ in range(opts.wallets)]
+    for bloom in (False, True):
+        wallets = Prefilter(programs=[], wallets=watchlist, bloom=bloom)
+        elapsed = timeit(lambda: [wallets.check(p) for p in feed])
+        kind = "bloom" if bloom else "set"
+        print(f"  {opts.wallets:,} wallets ({kind}): {len(feed) / elapsed:>10,.0f} tx/s")
+
+
+if __name__ == "__main__":
+    main()
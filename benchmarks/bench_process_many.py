@@ -0,0 +1,38 @@
+"""
+Throughput of 'soltxs.process_many' as the number of worker processes grows.
+
+    python benchmarks/bench_process_many.py [--size N] [--chunksize N]
+"""
+
+import argparse
+import os
+
+from common import corpus, timeit
+
+import soltxs
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size", type=int, default=20_000)
+    ap.add_argument("--chunksize", type=int, default=256)
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+
+    payloads = corpus(args.size)
+
+    baseline = None
+    print(f"{'workers':>7} {'tx/s':>12} {'speedup':>8} {'efficiency':>10}")
+    for workers in range(1, args.max_workers + 1):
+        elapsed = timeit(
+            lambda: sum(1 for _ in soltxs.process_many(payloads, workers=workers, chunksize=args.chunksize)),
+            repeat=1,
+        )
+        rate = args.size / elapsed
+        baseline = baseline or rate
+        speedup = rate / baseline
+        print(f"{workers:>7} {rate:>12,.0f} {speedup:>7.2f}x {speedup / workers:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
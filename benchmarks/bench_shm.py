@@ -0,0 +1,50 @@
+"""
+Throughput of the shared-memory batch transport against the pickling one.
+
+Runs 'process_many' over the same corpus given as decoded dicts and as raw
+JSON bytes, with the default pickle transport and with '--transport shm',
+plus 'shm.process_batches' consumed as record batches (no result objects
+built in the parent).
+
+    python benchmarks/bench_shm.py [--size N] [--workers N] [--chunksize N]
+"""
+
+import argparse
+import json
+import os
+
+from common import corpus, timeit
+
+import soltxs
+from soltxs import shm
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size", type=int, default=20_000)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--chunksize", type=int, default=256)
+    args = ap.parse_args()
+
+    raw = [json.dumps(p).encode() for p in corpus(args.size)]
+    # Distinct dicts, so pickling a chunk cannot just reference repeated fixtures.
+    payloads = [json.loads(r) for r in raw]
+    opts = {"workers": max(args.workers, 2), "chunksize": args.chunksize}
+
+    runs = {
+        "pickle, dicts": lambda: sum(1 for _ in soltxs.process_many(payloads, **opts)),
+        "pickle, bytes": lambda: sum(1 for _ in soltxs.process_many(raw, **opts)),
+        "shm, bytes": lambda: sum(1 for _ in soltxs.process_many(raw, transport="shm", **opts)),
+        "shm, records": lambda: sum(len(b) for b in shm.process_batches(raw, **opts)),
+    }
+
+    print(f"{args.size} payloads, {opts['workers']} workers, chunks of {args.chunksize}")
+    baseline = None
+    for label, run in runs.items():
+        rate = args.size / timeit(run, repeat=1)
+        baseline = baseline or rate
+        print(f"  {label:<14} {rate:>10,.0f} tx/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
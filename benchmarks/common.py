@@ -0,0 +1,48 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are plain scripts, run from the repository root:
+
+    python benchmarks/<script>.py
+"""
+
+import json
+import sys
+import time
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "tests" / ".data"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def load_fixtures() -> Dict[str, dict]:
+    """
+    Loads every JSON payload in tests/.data, keyed by file stem.
+    """
+    return {path.stem: json.loads(path.read_text()) for path in sorted(DATA_DIR.glob("*.json"))}
+
+
+def corpus(size: int, names: List[str] = None) -> List[dict]:
+    """
+    Builds a synthetic corpus of 'size' payloads by cycling over the fixtures.
+    """
+    fixtures = load_fixtures()
+    payloads = [fixtures[n] for n in names] if names else list(fixtures.values())
+    return list(islice(cycle(payloads), size))
+
+
+def timeit(fn: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Returns the best wall-clock time, in seconds, of 'repeat' runs of 'fn'.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,192 @@
+"""
+Offline benchmark suite for normalize / parse / resolve / process.
+
+Corpora are built from the tests/.data fixtures, grouped by input format
+(RPC vs Geyser) and program mix, and scaled up by repetition. For every
+corpus and stage the suite reports throughput, p50/p99 per-transaction
+latency and peak traced memory.
+
+    python benchmarks/suite.py [--size N] [--repeat N] [--json PATH]
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --baseline baseline.json [--threshold 0.2]
+
+With '--baseline', the run exits with status 1 if any stage's throughput
+dropped by more than 'threshold' (a fraction) relative to the baseline.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from itertools import cycle, islice
+from typing import Callable, Dict, List
+
+from common import load_fixtures
+
+import soltxs
+
+STAGES = ("normalize", "parse", "resolve", "process")
+
+
+def build_corpora(size: int) -> Dict[str, List[dict]]:
+    """
+    Groups fixtures by '<format>/<program>' plus an all-fixture mix, each scaled to 'size' payloads.
+    """
+    groups: Dict[str, List[dict]] = {}
+    for name, payload in load_fixtures().items():
+        program, fmt = name.split("_")[0], name.rsplit("_", 1)[1]
+        groups.setdefault(f"{fmt}/{program}", []).append(payload)
+        groups.setdefault(f"{fmt}/mixed", []).append(payload)
+        groups.setdefault("all/mixed", []).append(payload)
+
+    return {key: list(islice(cycle(payloads), size)) for key, payloads in sorted(groups.items())}
+
+
+def _stage(stage: str, payloads: List[dict]) -> tuple[Callable, Callable[[], list]]:
+    """
+    Returns the function under test and a factory for fresh inputs.
+
+    Inputs are rebuilt for every run, so per-transaction caches (decoded
+    instruction data, account tables) never carry over between runs.
+    """
+    if stage == "normalize":
+        return soltxs.normalize, lambda: payloads
+    if stage == "parse":
+        return soltxs.parse, lambda: [soltxs.normalize(p) for p in payloads]
+    if stage == "resolve":
+        return soltxs.resolve, lambda: [soltxs.parse(soltxs.normalize(p)) for p in payloads]
+    if stage == "process":
+        return soltxs.process, lambda: payloads
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def measure(fn: Callable, make_inputs: Callable[[], list], repeat: int) -> Dict[str, float]:
+    """
+    Measures throughput, latency percentiles and peak memory of 'fn' over its inputs.
+    """
+    best_total = float("inf")
+    best_latencies: List[int] = []
+    clock = time.perf_counter_ns
+
+    # Warm up interpreter caches before timing.
+    for item in make_inputs()[:100]:
+        fn(item)
+
+    for _ in range(repeat):
+        inputs = make_inputs()
+        latencies = []
+        append = latencies.append
+        start = clock()
+        for item in inputs:
+            t0 = clock()
+            fn(item)
+            append(clock() - t0)
+        total = clock() - start
+        if total < best_total:
+            best_total, best_latencies = total, latencies
+
+    # Peak memory is traced in a separate run, as tracing skews timings.
+    inputs = make_inputs()
+    tracemalloc.start()
+    outputs = [fn(item) for item in inputs]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del outputs
+
+    best_latencies.sort()
+    return {
+        "tx_per_s": len(best_latencies) / (best_total / 1e9),
+        "p50_us": _percentile(best_latencies, 0.50) / 1e3,
+        "p99_us": _percentile(best_latencies, 0.99) / 1e3,
+        "peak_kib": peak / 1024,
+    }
+
+
+def run(size: int, repeat: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for corpus_name, payloads in build_corpora(size).items():
+        results[corpus_name] = {}
+        for stage in STAGES:
+            fn, make_inputs = _stage(stage, payloads)
+            results[corpus_name][stage] = measure(fn, make_inputs, repeat)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Returns a description of every stage whose throughput regressed beyond 'threshold'.
+    """
+    regressions = []
+    for corpus_name, stages in baseline.items():
+        for stage, base in stages.items():
+            current = results.get(corpus_name, {}).get(stage)
+            if current is None:
+                continue
+            change = current["tx_per_s"] / base["tx_per_s"] - 1
+            if change < -threshold:
+                regressions.append(
+                    f"{corpus_name} {stage}: {base['tx_per_s']:,.0f} -> {current['tx_per_s']:,.0f} tx/s ({change:+.1%})"
+                )
+    return regressions
+
+
+def report(results: dict, baseline: dict = None):
+    header = f"{'corpus':<16} {'stage':<10} {'tx/s':>10} {'p50 us':>8} {'p99 us':>8} {'peak KiB':>9}"
+    if baseline:
+        header += f" {'vs base':>8}"
+    print(header)
+
+    for corpus_name, stages in results.items():
+        for stage, m in stages.items():
+            line = (
+                f"{corpus_name:<16} {stage:<10} {m['tx_per_s']:>10,.0f} "
+                f"{m['p50_us']:>8.1f} {m['p99_us']:>8.1f} {m['peak_kib']:>9,.1f}"
+            )
+            base = (baseline or {}).get(corpus_name, {}).get(stage)
+            if base:
+                line += f" {m['tx_per_s'] / base['tx_per_s'] - 1:>+8.1%}"
+            print(line)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size", type=int, default=2_000, help="Payloads per corpus.")
+    ap.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the best is kept.")
+    ap.add_argument("--json", help="Write the results to this path.")
+    ap.add_argument("--save", help="Write the results as a new baseline to this path.")
+    ap.add_argument("--baseline", help="Compare against the baseline stored at this path.")
+    ap.add_argument("--threshold", type=float, default=0.2, help="Allowed throughput drop, as a fraction.")
+    args = ap.parse_args()
+
+    results = run(args.size, args.repeat)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    report(results, baseline)
+
+    payload = {"size": args.size, "python": sys.version.split()[0], "results": results}
+    for path in filter(None, (args.json, args.save)):
+        with open(path, "w") as f:
+            json.dump(payload, f, indent=2)
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressed beyond {args.threshold:.0%}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
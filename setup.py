@@ -30,5 +30,5 @@ setup(
         "qborsh==1.0.1",
         "qbase58==1.0.4",
     ],
-    extras_require={"dev": ["pytest"]},
+    extras_require={"dev": ["pytest"], "json": ["orjson"], "numpy": ["numpy"], "arrow": ["pyarrow"]},
 )
@@ -1,16 +1,54 @@
-from soltxs.normalizer import normalize
+import importlib
+from typing import Iterable, Optional
+
+from soltxs.normalizer import normalize, normalize_block
 from soltxs.parser import parse
 from soltxs.resolver import resolve
 
-from soltxs import normalizer, parser, resolver
+from soltxs import normalizer, parser, pipeline, resolver
+
+# Exports imported on first access: 'batch' and 'streaming' pull in multiprocessing and asyncio.
+_LAZY = {
+    "process_many": "soltxs.batch",
+    "process_stream": "soltxs.streaming",
+    "Deduplicator": "soltxs.dedup",
+    "Prefilter": "soltxs.prefilter",
+}
+
 
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = globals()[name] = getattr(importlib.import_module(module), name)
+    return value
 
-def process(tx: dict) -> resolver.models.Resolve:
+
+def process(
+    tx: dict,
+    programs: Optional[Iterable[str]] = None,
+    tolerant: bool = False,
+) -> resolver.models.Resolve:
     """
     Resolves a Solana transaction.
+
+    Notes:
+        By default only the programs whose instructions a resolver reads are
+        parsed (see 'pipeline.plan'); everything else is skipped without
+        being decoded. Instructions of skipped programs therefore never
+        raise here, even when their parser would fail on them (e.g. an
+        unknown Token Program discriminator). To parse every instruction,
+        as 'parse' does, call 'resolve(parse(normalize(tx)))'.
+
+    Args:
+        tx: A raw RPC or Geyser transaction payload.
+        programs: Program IDs to parse, overriding the resolvers' parse plan.
+        tolerant: Never raise. Instructions that fail to parse are skipped
+            (as 'ParseError' records) so the rest of the transaction still
+            resolves, and a payload that fails outright resolves to a
+            'ProcessError'.
     """
-    normalized = normalize(tx)
-    parsed = parse(normalized)
-    resolved = resolve(parsed)
+    if programs is None:
+        programs = pipeline.plan()
 
-    return resolved
+    return pipeline.run(tx, programs, tolerant)
@@ -0,0 +1,126 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Deque, FrozenSet, Iterable, Iterator, List, Optional
+
+from soltxs import parser, pipeline, resolver
+
+# How chunks reach the workers: pickled payloads and results, or shared memory (see 'soltxs.shm').
+TRANSPORTS = ("pickle", "shm")
+
+
+def _warm() -> None:
+    """
+    Worker initializer.
+
+    Parsers and resolvers are imported on first use, so loading every
+    registered one here makes sure a spawned worker pays that cost once,
+    before its first chunk.
+    """
+    resolver.required_types()
+    for handler in parser.id_to_handler.values():
+        handler.desc_map
+
+
+def _process_chunk(
+    chunk: List[dict],
+    programs: Optional[FrozenSet[str]],
+    tolerant: bool = False,
+) -> List[resolver.models.Resolve]:
+    """
+    Runs normalize -> parse -> resolve over a chunk of raw payloads.
+
+    Only the raw payloads and the resolved objects cross the process
+    boundary; normalized transactions and parsed instructions stay local
+    to the worker.
+    """
+    return [pipeline.run(tx, programs, tolerant) for tx in chunk]
+
+
+def _chunks(payloads: Iterable[dict], chunksize: int) -> Iterator[List[dict]]:
+    it = iter(payloads)
+    while chunk := list(islice(it, chunksize)):
+        yield chunk
+
+
+def process_many(
+    payloads: Iterable[dict],
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    max_in_flight: Optional[int] = None,
+    programs: Optional[Iterable[str]] = None,
+    tolerant: bool = False,
+    transport: str = "pickle",
+) -> Iterator[resolver.models.Resolve]:
+    """
+    Resolves many Solana transactions, optionally across worker processes.
+
+    Notes:
+        Results are yielded in input order. At most 'max_in_flight' chunks
+        are submitted to the pool at any time, so memory stays bounded even
+        when 'payloads' is an unbounded stream. With 'workers' set to 0 or 1
+        everything runs in the calling process.
+
+    Args:
+        payloads: Raw RPC or Geyser transaction payloads.
+        workers: Number of worker processes. Defaults to 'os.cpu_count()'.
+        chunksize: Number of payloads sent to a worker per task.
+        max_in_flight: Maximum number of pending chunks. Defaults to twice
+            the number of workers.
+        programs: Program IDs to parse. Defaults to the resolvers' parse plan,
+            as in 'soltxs.process'.
+        tolerant: Yield a 'ProcessError' for payloads that fail instead of
+            raising, see 'soltxs.process'.
+        transport: 'pickle' sends payloads and results through the pool's
+            pipes. 'shm' writes raw payload bytes into a shared-memory ring
+            and gets results back as fixed-size records, which is cheaper
+            for raw bytes payloads; see 'soltxs.shm.process_batches'. Only
+            applies with more than one worker: with 'workers' set to 0 or 1
+            nothing crosses a process boundary and either transport runs in
+            the calling process.
+
+    Returns:
+        An iterator over the resolved transactions.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport '{transport}', expected one of: {', '.join(TRANSPORTS)}.")
+
+    if programs is None:
+        programs = pipeline.plan()
+    if programs is not None:
+        programs = frozenset(programs)
+    run = partial(_process_chunk, programs=programs, tolerant=tolerant)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for chunk in _chunks(payloads, chunksize):
+            yield from run(chunk)
+        return
+
+    if transport == "shm":
+        from soltxs import shm
+
+        for records in shm.process_batches(payloads, workers, chunksize, max_in_flight, programs, tolerant):
+            yield from records
+        return
+
+    max_in_flight = max_in_flight or workers * 2
+    pending: Deque[Future] = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm) as pool:
+        try:
+            for chunk in _chunks(payloads, chunksize):
+                if len(pending) >= max_in_flight:
+                    yield from pending.popleft().result()
+                pending.append(pool.submit(run, chunk))
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,100 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from soltxs import normalizer, parser
+from soltxs.constants import BUY, SELL, TREAT_AS_SOL
+from soltxs.normalizer.models import Transaction
+from soltxs.parser.parsers import pumpfun, raydiumAMM
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Parsed instruction types that become swap rows.
+SWAP_TYPES = (pumpfun.Buy, pumpfun.Sell, raydiumAMM.Swap)
+
+STRING_COLUMNS = ("signature", "program", "instruction", "who", "from_token", "to_token")
+INT_COLUMNS = {
+    "slot": "int64",
+    "from_amount_raw": "uint64",
+    "to_amount_raw": "uint64",
+    "minimum_amount_out_raw": "uint64",
+    "from_decimals": "uint8",
+    "to_decimals": "uint8",
+}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Columnar output requires numpy: pip install 'soltxs[numpy]'.")
+
+
+def swaps(txs: Iterable[Any], programs: Optional[Iterable[str]] = None) -> Dict[str, "np.ndarray"]:
+    """
+    Parses a batch of transactions into struct-of-arrays swap columns.
+
+    Notes:
+        There is one row per PumpFun Buy/Sell and Raydium Swap instruction.
+        Amounts stay raw integers while rows are collected; 'type' and the
+        UI amounts ('from_amount', 'to_amount', 'minimum_amount_out') are
+        then computed for the whole batch in single vectorized passes, with
+        the same rules as the PumpFun and Raydium resolvers. String columns
+        use object dtype, so 'pandas.DataFrame(columns)' works directly.
+
+    Args:
+        txs: Raw payloads (anything 'normalize' accepts) or normalized transactions.
+        programs: Program IDs to parse. Defaults to the programs producing swaps.
+
+    Returns:
+        A dict of equally long NumPy arrays, keyed by column name.
+    """
+    _require_numpy()
+
+    if programs is None:
+        programs = parser.plan(SWAP_TYPES)
+
+    rows: Dict[str, List[Any]] = {name: [] for name in (*STRING_COLUMNS, *INT_COLUMNS)}
+    for tx in txs:
+        if not isinstance(tx, Transaction):
+            tx = normalizer.normalize(tx)
+
+        for instr in parser.parse(tx, programs=programs):
+            if not isinstance(instr, SWAP_TYPES):
+                continue
+            rows["signature"].append(tx.signatures[0] if tx.signatures else None)
+            rows["slot"].append(tx.slot)
+            rows["program"].append(instr.program_name)
+            rows["instruction"].append(instr.instruction_name)
+            rows["who"].append(instr.who)
+            rows["from_token"].append(instr.from_token)
+            rows["to_token"].append(instr.to_token)
+            rows["from_amount_raw"].append(instr.from_token_amount)
+            rows["to_amount_raw"].append(instr.to_token_amount)
+            rows["minimum_amount_out_raw"].append(getattr(instr, "minimum_amount_out", 0))
+            rows["from_decimals"].append(instr.from_token_decimals)
+            rows["to_decimals"].append(instr.to_token_decimals)
+
+    columns = {name: np.array(rows[name], dtype=object) for name in STRING_COLUMNS}
+    columns.update({name: np.array(rows[name], dtype=dtype) for name, dtype in INT_COLUMNS.items()})
+
+    # Same direction rule as the resolvers: SOL received => sell, otherwise buy.
+    to_token = columns["to_token"]
+    if normalizer.pubkey.enabled:
+        to_token = np.array([normalizer.pubkey.text(t) for t in to_token], dtype=object)
+    columns["type"] = np.where(np.isin(to_token, TREAT_AS_SOL), SELL, BUY).astype(object)
+
+    from_scale = 10.0 ** columns["from_decimals"]
+    to_scale = 10.0 ** columns["to_decimals"]
+    columns["from_amount"] = columns["from_amount_raw"] / from_scale
+    columns["to_amount"] = columns["to_amount_raw"] / to_scale
+    columns["minimum_amount_out"] = columns["minimum_amount_out_raw"] / to_scale
+
+    return columns
+
+
+def to_records(columns: Dict[str, "np.ndarray"]) -> "np.ndarray":
+    """
+    Packs columns into a single NumPy structured array.
+    """
+    _require_numpy()
+    return np.rec.fromarrays(list(columns.values()), names=list(columns))
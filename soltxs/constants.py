@@ -3,6 +3,8 @@ WSOL_MINT = "So11111111111111111111111111111111111111112"    # Wrapped SOL (comm
 
 SOL_DECIMALS = 9
 
+VOTE_PROGRAM_ID = "Vote111111111111111111111111111111111111111"
+
 TREAT_AS_SOL = [SOL_MINT, WSOL_MINT]
 
 BUY = "buy"
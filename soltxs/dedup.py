@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from soltxs import instrumentation, normalizer
+from soltxs.instrumentation import Histogram
+
+
+class SourceStats:
+    """
+    Delivery statistics of one source.
+
+    Notes:
+        'lag' holds, for every duplicate this source delivered, how long
+        after the first copy (from any source) it arrived.
+    """
+
+    __slots__ = ("first", "duplicates", "lag")
+
+    def __init__(self):
+        self.first = 0
+        self.duplicates = 0
+        self.lag = Histogram()
+
+    def summary(self) -> Dict[str, object]:
+        return {"first": self.first, "duplicates": self.duplicates, "lag": self.lag.summary()}
+
+
+class Deduplicator:
+    """
+    Drops repeated deliveries of the same transaction from several sources.
+
+    Notes:
+        Transactions are keyed by their first signature, which is read
+        straight from the payload (decoded dict or Yellowstone message), so
+        duplicates are rejected before any normalization. Raw JSON bytes or
+        serialized updates are decoded first; pass decoded payloads to avoid
+        decoding them again in 'process'. The window is
+        bounded both by count ('max_size', oldest first) and by slot: once
+        a transaction from slot 's' is seen, signatures from slots older
+        than 's - slot_horizon' are forgotten.
+
+    Example:
+        dedup = Deduplicator()
+        for source, payload in updates:
+            if dedup.check(payload, source):
+                soltxs.process(payload)
+        dedup.stats()
+    """
+
+    def __init__(self, max_size: int = 200_000, slot_horizon: Optional[int] = 150):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        self.max_size = max_size
+        self.slot_horizon = slot_horizon
+        self.sources: Dict[Hashable, SourceStats] = {}
+
+        # Signature -> (slot, first source, arrival time), oldest first.
+        self._seen: "OrderedDict[str, Tuple[int, Hashable, int]]" = OrderedDict()
+        self._max_slot = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, signature: str) -> bool:
+        return signature in self._seen
+
+    def check(self, payload: Any, source: Hashable = None) -> bool:
+        """
+        Records a delivery and tells whether it is the first copy of its transaction.
+
+        Args:
+            payload: An RPC/Geyser payload, decoded or as JSON bytes/str, or a
+                Yellowstone update, as a message or serialized.
+            source: Any label for the endpoint the payload came from.
+
+        Returns:
+            True for the first delivery of a transaction, False for duplicates.
+        """
+        payload = normalizer.load(payload)
+        module = normalizer.detect(payload)
+        return self.record(module.first_signature(payload), module.slot(payload), source)
+
+    def record(self, signature: str, slot: int, source: Hashable = None) -> bool:
+        """
+        Same as 'check', for a signature and slot that are already known.
+
+        Returns:
+            True if 'signature' was not seen before (it is now recorded), False for duplicates.
+        """
+        now = instrumentation.clock()
+        stats = self.sources.get(source)
+        if stats is None:
+            stats = self.sources[source] = SourceStats()
+
+        entry = self._seen.get(signature)
+        if entry is not None:
+            stats.duplicates += 1
+            stats.lag.add(now - entry[2])
+            return False
+
+        stats.first += 1
+        self._seen[signature] = (slot, source, now)
+        if slot > self._max_slot:
+            self._max_slot = slot
+        self._evict()
+        return True
+
+    def first_source(self, signature: str) -> Optional[Hashable]:
+        """
+        Returns the source that delivered 'signature' first, if it is still remembered.
+        """
+        entry = self._seen.get(signature)
+        return None if entry is None else entry[1]
+
+    def stats(self) -> Dict[Hashable, Dict[str, object]]:
+        """
+        Returns the first-delivery and duplicate counts and the duplicate lag of every source.
+        """
+        return {source: stats.summary() for source, stats in self.sources.items()}
+
+    def _evict(self):
+        seen = self._seen
+        while len(seen) > self.max_size:
+            seen.popitem(last=False)
+
+        if self.slot_horizon is None:
+            return
+        # Arrival order is close to slot order, so stale entries sit at the front.
+        cutoff = self._max_slot - self.slot_horizon
+        while seen and next(iter(seen.values()))[0] < cutoff:
+            seen.popitem(last=False)
@@ -0,0 +1,104 @@
+"""
+Optional per-stage and per-parser instrumentation.
+
+Instrumentation is disabled by default. Every hook is guarded by a single
+check of the module-level 'enabled' flag, so the disabled cost is one
+attribute lookup per hook.
+
+    from soltxs import instrumentation
+
+    metrics = instrumentation.enable(sink=print)
+    soltxs.process(tx)
+    metrics.snapshot()
+
+The aggregation classes live in 'soltxs.metrics', imported when
+instrumentation is first enabled (or they are first accessed here).
+"""
+
+import importlib
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from soltxs.metrics import Event, Metrics
+
+# Event stages.
+NORMALIZE = "normalize"
+PARSE = "parse"
+DECODE = "decode"
+ROUTE = "route"
+RESOLVE = "resolve"
+RESOLVER = "resolver"
+UNKNOWN_PROGRAM = "unknown_program"
+UNKNOWN_DISCRIMINATOR = "unknown_discriminator"
+
+enabled: bool = False
+
+clock = time.perf_counter_ns
+
+_sink: Optional[Callable[["Event"], None]] = None
+
+# Aggregation classes and the process-wide aggregate, imported from 'soltxs.metrics' on first use.
+_LAZY = ("Event", "Histogram", "Metrics", "metrics")
+
+
+def _aggregation():
+    module = importlib.import_module("soltxs.metrics")
+    for name in _LAZY:
+        globals()[name] = getattr(module, name)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    _aggregation()
+    return globals()[name]
+
+
+def enable(sink: Optional[Callable[["Event"], None]] = None) -> "Metrics":
+    """
+    Turns instrumentation on.
+
+    Args:
+        sink: Optional callback invoked with every 'Event', in addition to
+            the built-in aggregation.
+
+    Returns:
+        The process-wide 'Metrics' aggregate.
+    """
+    global enabled, _sink
+    if "metrics" not in globals():
+        _aggregation()
+    _sink = sink
+    enabled = True
+    return metrics
+
+
+def disable():
+    """
+    Turns instrumentation off. Aggregated metrics are kept until 'metrics.reset()'.
+    """
+    global enabled, _sink
+    enabled = False
+    _sink = None
+
+
+def discriminator_label(discriminator: object) -> str:
+    if isinstance(discriminator, (bytes, bytearray)):
+        return discriminator.hex()
+    return str(discriminator)
+
+
+def record(stage: str, name: str, elapsed_ns: Optional[int] = None, discriminator: object = None):
+    """
+    Records one event. Callers should check 'enabled' first.
+    """
+    event = Event(
+        stage=stage,
+        name=name,
+        discriminator=None if discriminator is None else discriminator_label(discriminator),
+        elapsed_ns=elapsed_ns,
+    )
+    metrics.record(event)
+    if _sink is not None:
+        _sink(event)
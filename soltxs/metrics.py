@@ -0,0 +1,100 @@
+"""
+Aggregation of instrumentation events into counters and latency histograms.
+
+Imported by 'instrumentation' on first use, so that processes which never
+enable instrumentation do not pay for it.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(slots=True)
+class Event:
+    stage: str
+    name: str
+    discriminator: Optional[str]
+    elapsed_ns: Optional[int]
+
+
+class Histogram:
+    """
+    Latency histogram with power-of-two nanosecond buckets.
+    """
+
+    __slots__ = ("count", "total_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, elapsed_ns: int):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        bucket = elapsed_ns.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, q: float) -> int:
+        """
+        Returns the upper bound, in nanoseconds, of the bucket holding the q-th quantile.
+        """
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return 1 << bucket
+        return 1 << max(self.buckets)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "p50_us": self.percentile(0.50) / 1e3,
+            "p99_us": self.percentile(0.99) / 1e3,
+        }
+
+
+class Metrics:
+    """
+    Aggregates events into counters and latency histograms.
+
+    Keys are '(stage, name, discriminator)' tuples; 'discriminator' is None
+    for events that are not tied to one.
+    """
+
+    def __init__(self):
+        self.counters: Dict[Tuple[str, str, Optional[str]], int] = {}
+        self.histograms: Dict[Tuple[str, str, Optional[str]], Histogram] = {}
+
+    def record(self, event: Event):
+        key = (event.stage, event.name, event.discriminator)
+        self.counters[key] = self.counters.get(key, 0) + 1
+        if event.elapsed_ns is not None:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.add(event.elapsed_ns)
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Returns the counters and histogram summaries keyed by 'stage/name[/discriminator]'.
+        """
+
+        def label(key: Tuple[str, str, Optional[str]]) -> str:
+            return "/".join(k for k in key if k is not None)
+
+        return {
+            "counters": {label(k): v for k, v in self.counters.items()},
+            "histograms": {label(k): h.summary() for k, h in self.histograms.items()},
+        }
+
+
+metrics = Metrics()
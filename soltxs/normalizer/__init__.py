@@ -1,13 +1,79 @@
-from soltxs.normalizer import models, normalizers
+from types import ModuleType
+from typing import Any, Iterator
 
+from soltxs import instrumentation
+from soltxs.normalizer import decoders, interning, models, normalizers, pubkey
 
-def normalize(data: dict) -> models.Transaction:
+
+def _is_json(data: decoders.Payload) -> bool:
+    if isinstance(data, str):
+        return True
+    return bytes(data[:16]).lstrip()[:1] == b"{"
+
+
+def load(data: Any) -> Any:
     """
-    Standardizes a Solana transaction response.
+    Decodes a raw payload: JSON bytes/str with the backend chosen in
+    'decoders', serialized Yellowstone updates with 'yellowstone.from_bytes'.
+    Decoded payloads and messages are returned unchanged.
     """
-    if "jsonrpc" in data and "result" in data:
-        return normalizers.rpc.normalize(data)
-    elif "transaction" in data and "transaction" in data["transaction"]:
-        return normalizers.geyser.normalize(data)
+    if isinstance(data, (bytes, bytearray, memoryview, str)):
+        return decoders.decode(data) if _is_json(data) else normalizers.yellowstone.from_bytes(data)
+    return data
+
 
+def detect(data: Any) -> ModuleType:
+    """
+    Returns the normalizer module for a decoded payload or Yellowstone message.
+
+    Raises:
+        ValueError: If the payload is in none of the supported formats.
+    """
+    if not isinstance(data, dict):
+        if not normalizers.yellowstone.is_update(data):
+            raise ValueError("Unrecognized Solana transaction format.")
+        return normalizers.yellowstone
+    if "jsonrpc" in data and "result" in data:
+        if normalizers.rpc.is_block(data):
+            raise ValueError("Got a 'getBlock' response; use 'normalize_block' for blocks.")
+        return normalizers.wire if normalizers.rpc.is_wire(data) else normalizers.rpc
+    if "transaction" in data and "transaction" in data["transaction"]:
+        return normalizers.geyser
     raise ValueError("Unrecognized Solana transaction format.")
+
+
+def normalize(data: Any, lazy: bool = False) -> models.Transaction:
+    """
+    Standardizes a Solana transaction response.
+
+    Args:
+        data: A raw RPC or Geyser transaction payload, either decoded or as
+            JSON bytes/str (decoded with the backend chosen in 'decoders'),
+            or a Yellowstone protobuf update, as a message or serialized.
+        lazy: Return a view that only builds each part of the transaction
+            on first access, instead of building all of it up front.
+    """
+    data = load(data)
+    source = detect(data)
+    if lazy:
+        return normalizers.lazy.view(data, source)
+    if instrumentation.enabled:
+        start = instrumentation.clock()
+        tx = source.normalize(data)
+        name = source.__name__.rsplit(".", 1)[-1]
+        instrumentation.record(instrumentation.NORMALIZE, name, instrumentation.clock() - start)
+        return tx
+    return source.normalize(data)
+
+
+def normalize_block(data: Any, slot: int) -> Iterator[models.Transaction]:
+    """
+    Standardizes the transactions of a 'getBlock' response, yielding them one at a time.
+
+    Args:
+        data: A 'getBlock' response (or its 'result'), decoded or as JSON bytes/str.
+        slot: The slot the block was requested for.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview, str)):
+        data = decoders.decode(data)
+    return normalizers.block.normalize(data, slot)
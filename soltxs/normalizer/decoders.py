@@ -0,0 +1,71 @@
+import json
+from typing import Callable, Dict, Optional, Union
+
+Payload = Union[bytes, bytearray, memoryview, str]
+
+# Decoder used for raw payloads, or None for the fastest installed backend, chosen on first decode.
+loads: Optional[Callable[[Payload], dict]] = None
+
+
+def _json_loads(data: Payload) -> dict:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def backends() -> Dict[str, Callable[[Payload], dict]]:
+    """
+    Returns the installed JSON backends by name, fastest first.
+
+    Notes:
+        Backends are imported on each call, not when soltxs is imported, so
+        a backend installed (or patched in) later in the process is found.
+    """
+    found = {}
+
+    try:
+        import orjson
+
+        found["orjson"] = orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        found["msgspec"] = msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+
+    found["json"] = _json_loads
+    return found
+
+
+def set_decoder(decoder: Union[None, str, Callable[[Payload], dict]]):
+    """
+    Selects the JSON decoder used for raw payloads.
+
+    Args:
+        decoder: The name of an installed backend ('orjson', 'msgspec' or
+            'json'), any callable taking bytes/str and returning a dict, or
+            None to use the fastest installed backend, chosen again on the
+            next decode.
+    """
+    global loads
+    if isinstance(decoder, str):
+        available = backends()
+        if decoder not in available:
+            raise ValueError(f"JSON decoder '{decoder}' is not installed.")
+        decoder = available[decoder]
+    loads = decoder
+
+
+def decode(data: Payload) -> dict:
+    """
+    Decodes a raw JSON transaction payload with the selected backend.
+    """
+    global loads
+    decoder = loads
+    if decoder is None:
+        decoder = loads = next(iter(backends().values()))
+    return decoder(data)
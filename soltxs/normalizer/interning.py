@@ -0,0 +1,181 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+
+class Interner:
+    """
+    Bounded table of canonical address strings.
+
+    Notes:
+        Every distinct address maps to one shared 'str' instance, so
+        transactions kept in memory stop holding their own copies of hot
+        addresses (programs, WSOL, popular mints). The table keeps at most
+        'max_size' addresses and evicts the least recently used one beyond
+        that. With 'ids' enabled, each address also gets a compact integer
+        ID. IDs are never reused; the ID of an evicted address no longer
+        resolves. Lookups and evictions hold a lock, so one table can be
+        shared by several threads.
+    """
+
+    def __init__(self, max_size: int = 1_000_000, ids: bool = False):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        self.max_size = max_size
+        self.ids = ids
+        self.hits = 0
+        self.misses = 0
+
+        self._table: "OrderedDict[str, str]" = OrderedDict()
+        self._ids: Dict[str, int] = {}
+        self._by_id: Dict[int, str] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._table
+
+    def intern(self, address: str) -> str:
+        """
+        Returns the canonical instance of 'address'.
+        """
+        with self._lock:
+            return self._intern(address)
+
+    def _intern(self, address: str) -> str:
+        table = self._table
+        canonical = table.get(address)
+        if canonical is not None:
+            self.hits += 1
+            table.move_to_end(address)
+            return canonical
+
+        self.misses += 1
+        table[address] = address
+        if self.ids:
+            self._ids[address] = self._next_id
+            self._by_id[self._next_id] = address
+            self._next_id += 1
+
+        if len(table) > self.max_size:
+            evicted, _ = table.popitem(last=False)
+            evicted_id = self._ids.pop(evicted, None)
+            if evicted_id is not None:
+                del self._by_id[evicted_id]
+
+        return address
+
+    def intern_all(self, addresses: List[str]) -> List[str]:
+        """
+        Returns a list of the canonical instances of 'addresses'.
+        """
+        intern = self._intern
+        with self._lock:
+            return [intern(a) for a in addresses]
+
+    def id_of(self, address: str) -> int:
+        """
+        Interns 'address' and returns its integer ID.
+        """
+        if not self.ids:
+            raise ValueError("Integer IDs are disabled for this interner.")
+        with self._lock:
+            return self._ids[self._intern(address)]
+
+    def address(self, address_id: int) -> Optional[str]:
+        """
+        Returns the address with the given ID, or None if it is unknown or was evicted.
+        """
+        return self._by_id.get(address_id)
+
+
+# Process-wide interner used by the normalizers, if enabled.
+interner: Optional[Interner] = None
+
+# Interner installed by 'scope' for the current thread or task, used when no process-wide one is enabled.
+_scoped: ContextVar[Optional[Interner]] = ContextVar("soltxs_interner", default=None)
+# Number of scopes open in any thread; the context variable is only read while some are.
+_scopes = 0
+_scopes_lock = threading.Lock()
+
+
+def enable(max_size: int = 1_000_000, ids: bool = False) -> Interner:
+    """
+    Makes the normalizers deduplicate address strings through a process-wide table.
+
+    Returns:
+        The new process-wide interner.
+    """
+    global interner
+    interner = Interner(max_size=max_size, ids=ids)
+    return interner
+
+
+def disable():
+    """
+    Stops interning. Already normalized transactions keep their strings.
+    """
+    global interner
+    interner = None
+
+
+def intern(address: Optional[str]) -> Optional[str]:
+    """
+    Returns the canonical instance of 'address', or 'address' itself when
+    interning is disabled or it is None.
+    """
+    table = interner
+    if table is None and _scopes:
+        table = _scoped.get()
+    if table is None or address is None:
+        return address
+    return table.intern(address)
+
+
+def intern_all(addresses: List[str]) -> List[str]:
+    """
+    Interns a list of addresses. Returns the list unchanged when interning is disabled.
+    """
+    table = interner
+    if table is None and _scopes:
+        table = _scoped.get()
+    if table is None:
+        return addresses
+    return table.intern_all(addresses)
+
+
+@contextmanager
+def scope(table: Interner) -> Iterator[Interner]:
+    """
+    Interns through 'table' inside the block, unless a process-wide interner is already enabled.
+
+    Notes:
+        The table is installed in a context variable, so it only applies to
+        the current thread (or asyncio task); other threads keep interning
+        through the process-wide interner, if any, or not at all. Code in a
+        generator should not keep a scope open across 'yield', since the
+        caller runs in the same context until the generator finishes.
+
+    Yields:
+        The interner in effect.
+    """
+    global _scopes
+    if interner is not None:
+        yield interner
+        return
+
+    with _scopes_lock:
+        _scopes += 1
+    token = _scoped.set(table)
+    try:
+        yield table
+    finally:
+        _scoped.reset(token)
+        with _scopes_lock:
+            _scopes -= 1
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import qbase58 as base58
 
 
 @dataclass(slots=True)
@@ -16,6 +18,64 @@ class Instruction:
     accounts: List[int]
     stackHeight: Optional[int]
 
+    _decoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def decoded_data(self) -> bytes:
+        """
+        Returns the base58-decoded instruction data.
+
+        Notes:
+            Decoding happens on first access and the bytes are cached on the
+            instruction, so every parser that reads them shares one decode.
+        """
+        if self._decoded is None:
+            self._decoded = base58.decode(self.data)
+        return self._decoded
+
+
+class RawInstruction(Instruction):
+    """
+    An 'Instruction' built from raw instruction bytes, e.g. from protobuf.
+
+    The decoded data is known up front, so 'decoded_data' never decodes and
+    'data' is only base58-encoded if something reads it. Compares equal to
+    an 'Instruction' carrying the same data.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, programIdIndex: int, raw: bytes, accounts: List[int], stackHeight: Optional[int]):
+        self.programIdIndex = programIdIndex
+        self.accounts = accounts
+        self.stackHeight = stackHeight
+        self._decoded = raw
+        self._data: Optional[str] = None
+
+    @property
+    def data(self) -> str:
+        if self._data is None:
+            from soltxs.normalizer.normalizers import shared
+
+            self._data = shared.b58encode(self._decoded)
+        return self._data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Instruction):
+            return NotImplemented
+        return (self.programIdIndex, self.accounts, self.stackHeight, self._decoded) == (
+            other.programIdIndex,
+            other.accounts,
+            other.stackHeight,
+            other.decoded_data,
+        )
+
+
+@dataclass(slots=True)
+class InnerInstructions:
+    index: int
+    instructions: List[Instruction]
+
 
 @dataclass(slots=True)
 class Message:
@@ -42,6 +102,42 @@ class TokenBalance:
     uiTokenAmount: TokenAmount
 
 
+class TokenBalanceIndex:
+    """
+    Lookup tables over a transaction's pre- and post-token balances.
+
+    Maps each mint to its decimals and each account index to its
+    (pre, post) balance pair, so parsers can look balances up instead of
+    scanning both lists.
+    """
+
+    __slots__ = ("decimals", "balances")
+
+    def __init__(self, pre: List[TokenBalance], post: List[TokenBalance]):
+        self.decimals: Dict[str, int] = {}
+        self.balances: Dict[int, Tuple[Optional[TokenBalance], Optional[TokenBalance]]] = {}
+
+        for tb in pre:
+            self.decimals.setdefault(tb.mint, tb.uiTokenAmount.decimals)
+            self.balances[tb.accountIndex] = (tb, None)
+        for tb in post:
+            self.decimals.setdefault(tb.mint, tb.uiTokenAmount.decimals)
+            self.balances[tb.accountIndex] = (self.balances.get(tb.accountIndex, (None, None))[0], tb)
+
+    def mint_decimals(self, mint: str) -> Optional[int]:
+        """
+        Returns the decimals of 'mint', or None if no balance references it.
+        """
+        return self.decimals.get(mint)
+
+    def latest(self, account_index: int) -> Optional[TokenBalance]:
+        """
+        Returns the post-balance of a token account, falling back to its pre-balance.
+        """
+        pre, post = self.balances.get(account_index, (None, None))
+        return post if post is not None else pre
+
+
 @dataclass(slots=True)
 class Meta:
     fee: int
@@ -49,12 +145,45 @@ class Meta:
     postBalances: List[int]
     preTokenBalances: List[TokenBalance]
     postTokenBalances: List[TokenBalance]
-    innerInstructions: List[Dict[str, Any]]
+    innerInstructions: List[InnerInstructions]
     logMessages: List[str]
     err: Optional[Any]
     status: Dict[str, Any]
     computeUnitsConsumed: Optional[int]
 
+    _inner_index: Optional[Dict[int, List[Instruction]]] = field(default=None, init=False, repr=False, compare=False)
+    _token_index: Optional[TokenBalanceIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def token_index(self) -> TokenBalanceIndex:
+        """
+        Returns the token balance lookup tables, built on first access.
+        """
+        if self._token_index is None:
+            self._token_index = TokenBalanceIndex(self.preTokenBalances, self.postTokenBalances)
+        return self._token_index
+
+    def inner_instructions_for(self, instruction_index: int) -> List[Instruction]:
+        """
+        Returns the inner instructions invoked by a top-level instruction.
+
+        Notes:
+            The index keyed by top-level instruction index is built on first
+            call and cached, so each subsequent lookup is O(1).
+
+        Args:
+            instruction_index: Index of the top-level instruction.
+
+        Returns:
+            The inner instructions, or an empty list if there are none.
+        """
+        if self._inner_index is None:
+            index: Dict[int, List[Instruction]] = {}
+            for group in self.innerInstructions:
+                index.setdefault(group.index, group.instructions)
+            self._inner_index = index
+        return self._inner_index.get(instruction_index, [])
+
 
 @dataclass(slots=True)
 class LoadedAddresses:
@@ -62,6 +191,67 @@ class LoadedAddresses:
     readonly: List[str]
 
 
+class AccountTable:
+    """
+    Immutable, indexable table of every account a transaction references.
+
+    Indexing maps an account index to its address in O(1), and 'index_of'
+    maps an address back to its index through a reverse map that is built
+    the first time it is needed.
+    """
+
+    __slots__ = ("keys", "_index")
+
+    def __init__(self, keys: Tuple[str, ...]):
+        self.keys = keys
+        self._index: Optional[Dict[str, int]] = None
+
+    def __getitem__(self, index: int) -> str:
+        return self.keys[index]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self.index
+
+    def __repr__(self) -> str:
+        return f"AccountTable({self.keys!r})"
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """
+        Returns the address -> account index reverse map.
+
+        Notes:
+            An address listed more than once maps to its first index, like
+            'list.index' would return.
+        """
+        if self._index is None:
+            index: Dict[str, int] = {}
+            for i, address in enumerate(self.keys):
+                index.setdefault(address, i)
+            self._index = index
+        return self._index
+
+    def index_of(self, address: str) -> Optional[int]:
+        """
+        Returns the account index of 'address', or None if it is not referenced.
+        """
+        return self.index.get(address)
+
+    def get(self, index: int, default: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the address at 'index', or 'default' if it is out of range.
+        """
+        if 0 <= index < len(self.keys):
+            return self.keys[index]
+        return default
+
+
 @dataclass(slots=True)
 class Transaction:
     slot: int
@@ -71,10 +261,12 @@ class Transaction:
     meta: Meta
     loadedAddresses: LoadedAddresses
 
+    _account_table: Optional[AccountTable] = field(default=None, init=False, repr=False, compare=False)
+
     @property
-    def all_accounts(self) -> List[str]:
+    def account_table(self) -> AccountTable:
         """
-        Returns a unified list of account addresses, combining:
+        Returns the transaction's account table, combining:
 
           1) message.accountKeys
           2) loadedAddresses.writable
@@ -82,8 +274,57 @@ class Transaction:
 
         This is useful for instructions that reference account indices
         beyond the range of message.accountKeys due to address table lookups.
+
+        Notes:
+            The table is built on first access and cached on the transaction,
+            so account keys should not be mutated after it has been read.
+        """
+        if self._account_table is None:
+            self._account_table = AccountTable(
+                (*self.message.accountKeys, *self.loadedAddresses.writable, *self.loadedAddresses.readonly)
+            )
+        return self._account_table
+
+    def predecode(self) -> "Transaction":
+        """
+        Decodes the data of every top-level and inner instruction in one pass.
+
+        Useful to pay the decoding cost up front (e.g. in a worker) instead of
+        lazily during parsing. Instructions that were already decoded are skipped.
+
+        Returns:
+            The transaction itself.
+        """
+        pending = [i for i in self.message.instructions if i._decoded is None]
+        for group in self.meta.innerInstructions:
+            pending.extend(i for i in group.instructions if i._decoded is None)
+
+        for instr, decoded in zip(pending, map(base58.decode, [i.data for i in pending])):
+            instr._decoded = decoded
+
+        return self
+
+    def token_balance(self, address: str) -> Optional[TokenBalance]:
+        """
+        Returns the latest token balance (and so the mint and owner) of a token account.
+
+        Args:
+            address: The token account address.
+
+        Returns:
+            The post-balance, falling back to the pre-balance, or None if the
+            address has no token balance in this transaction.
+        """
+        index = self.account_table.index_of(address)
+        if index is None:
+            return None
+        return self.meta.token_index.latest(index)
+
+    @property
+    def all_accounts(self) -> Tuple[str, ...]:
+        """
+        Returns the unified, immutable tuple of account addresses.
+
+        See 'account_table' for the ordering.
         """
-        combined = list(self.message.accountKeys)
-        combined.extend(self.loadedAddresses.writable)
-        combined.extend(self.loadedAddresses.readonly)
-        return combined
+        return self.account_table.keys
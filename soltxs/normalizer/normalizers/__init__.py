@@ -1 +1,12 @@
+import importlib
+
 from soltxs.normalizer.normalizers import geyser, rpc, shared
+
+# Normalizers imported on first access: formats (and protobuf/base64 helpers) most processes never meet.
+_LAZY = ("block", "lazy", "wire", "yellowstone")
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    return importlib.import_module(f"{__name__}.{name}")
@@ -0,0 +1,59 @@
+from typing import Iterator, Optional
+
+from soltxs.normalizer import interning, models
+from soltxs.normalizer.normalizers import rpc, shared, wire
+
+
+def _transaction(entry: dict, slot: int, block_time: Optional[int]) -> models.Transaction:
+    raw_tx = entry["transaction"]
+    if isinstance(raw_tx, list):
+        buf = wire.decode(raw_tx)
+        tx_signatures, offset = wire.read_signatures(buf)
+        message = wire.read_message(buf, offset)
+    else:
+        tx_signatures = raw_tx["signatures"]
+        message = shared.message(raw_tx["message"])
+
+    raw_meta = entry["meta"]
+    return models.Transaction(
+        slot=slot,
+        blockTime=block_time,
+        signatures=tx_signatures,
+        message=message,
+        meta=rpc.build_meta(raw_meta),
+        loadedAddresses=rpc.build_loaded_addresses(raw_meta),
+    )
+
+
+def normalize(data: dict, slot: int, interner_size: int = 65_536) -> Iterator[models.Transaction]:
+    """
+    Standardizes the transactions of a 'getBlock' response, one at a time.
+
+    Notes:
+        Works with the JSON and base64 transaction encodings, and
+        '"transactionDetails": "full"'. The block's slot and block time are
+        shared by all its transactions. Unless a process-wide interner is
+        enabled, addresses are interned in a table local to the block, so
+        repeated programs, mints and owners are only kept once.
+
+    Args:
+        data: A 'getBlock' response, or its 'result'.
+        slot: The slot the block was requested for; responses do not include it.
+        interner_size: Size of the block-local interning table.
+
+    Yields:
+        Standardized transactions, in block order.
+    """
+    result = data.get("result", data)
+    if result is None:
+        raise ValueError(f"Slot {slot} has no block (skipped or not available).")
+    if "transactions" not in result:
+        raise ValueError("Block response has no transactions; request it with 'transactionDetails': 'full'.")
+
+    block_time = result.get("blockTime")
+    table = interning.Interner(max_size=interner_size)
+    for entry in result["transactions"]:
+        # The table is only installed while a transaction is built, never across a yield.
+        with interning.scope(table):
+            tx = _transaction(entry, slot, block_time)
+        yield tx
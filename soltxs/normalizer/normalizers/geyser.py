@@ -1,81 +1,114 @@
-from typing import List
+from typing import List, Optional
 
 from soltxs.normalizer import models
 from soltxs.normalizer.normalizers import shared
 
+# Builders of each 'Meta' field from the raw status metadata.
+META_FIELDS = shared.json_meta_fields(default_status={"Ok": None})
 
-def normalize(tx: dict) -> models.Transaction:
+
+def slot(tx: dict) -> int:
     """
-    Standardizes a Geyser-style transaction response.
+    Returns the slot of a Geyser-style transaction response.
+    """
+    return tx["transaction"]["slot"]
 
-    Notes:
-        This Geyser-style transaction uses a modified version of the
-        YellowStone Geyser Protobuf format. For standard Geyser Protobuf,
-        as defined in the YellowStone-gRPC repo, a new normalizer will
-        be required.
 
-    Args:
-        tx: A Geyser-style transaction response.
+def block_time(tx: dict) -> Optional[int]:
+    """
+    Returns the block time of a Geyser-style transaction response, if known.
+    """
+    # Geyser doesn't have a block_time.
+    return None
 
-    Returns:
-        A standardized transaction.
+
+def signatures(tx: dict) -> List[str]:
+    """
+    Returns the base58 signatures of a Geyser-style transaction response.
     """
-    txn_container = tx["transaction"]
-    slot = txn_container["slot"]
-    geyser_txn = txn_container["transaction"]
-    geyser_meta = geyser_txn["meta"]
+    return tx["transaction"]["transaction"]["transaction"]["signatures"]
 
-    real_txn = geyser_txn["transaction"]
-    signatures = real_txn["signatures"]
-    message = real_txn["message"]
 
-    # Consolidate loadedAddresses.
-    loaded_addresses = models.LoadedAddresses(
-        writable=geyser_meta.get("loadedWritableAddresses", []),
-        readonly=geyser_meta.get("loadedReadonlyAddresses", []),
+def first_signature(tx: dict) -> str:
+    """
+    Returns the first signature of a Geyser-style transaction response, without building the others.
+    """
+    return tx["transaction"]["transaction"]["transaction"]["signatures"][0]
+
+
+def raw_keys(tx: dict) -> List[str]:
+    """
+    Static and loaded account keys, read from the payload without building anything.
+    """
+    geyser_tx = tx["transaction"]["transaction"]
+    geyser_meta = geyser_tx["meta"]
+    return (
+        geyser_tx["transaction"]["message"]["accountKeys"]
+        + geyser_meta.get("loadedWritableAddresses", [])
+        + geyser_meta.get("loadedReadonlyAddresses", [])
     )
 
-    # Geyser doesn't have a block_time.
-    block_time = None
 
-    # Instructions
-    raw_instructions = message["instructions"]
-    instructions: List[models.Instruction] = [shared.instructions(i) for i in raw_instructions]
+def failed(tx: dict) -> bool:
+    """
+    Whether a Geyser-style transaction response carries an error status, read without building the metadata.
+    """
+    return tx["transaction"]["transaction"]["meta"].get("err") is not None
+
+
+def message(tx: dict) -> models.Message:
+    """
+    Standardizes the message of a Geyser-style transaction response.
+    """
+    return shared.message(tx["transaction"]["transaction"]["transaction"]["message"])
+
+
+def raw_meta(tx: dict) -> dict:
+    """
+    Returns the raw status metadata of a Geyser-style transaction response.
+    """
+    return tx["transaction"]["transaction"]["meta"]
+
+
+def meta(tx: dict) -> models.Meta:
+    """
+    Standardizes the status metadata of a Geyser-style transaction response.
+    """
+    return shared.build_meta(raw_meta(tx), META_FIELDS)
+
+
+def loaded_addresses(tx: dict) -> models.LoadedAddresses:
+    """
+    Consolidates the addresses loaded through address table lookups.
+    """
+    geyser_meta = tx["transaction"]["transaction"]["meta"]
+    return models.LoadedAddresses(
+        writable=shared.addresses(geyser_meta.get("loadedWritableAddresses", [])),
+        readonly=shared.addresses(geyser_meta.get("loadedReadonlyAddresses", [])),
+    )
 
-    # Address Table Lookups
-    raw_lookups = message.get("addressTableLookups", [])
-    address_table_lookups: List[models.AddressTableLookup] = [shared.address_lookup(lu) for lu in raw_lookups]
 
-    # Unify system program IDs in accountKeys
-    account_keys = shared.program_id(message["accountKeys"])
+def normalize(tx: dict) -> models.Transaction:
+    """
+    Standardizes a Geyser-style transaction response.
 
-    # Token balances
-    raw_pre_tb = geyser_meta.get("preTokenBalances", [])
-    raw_post_tb = geyser_meta.get("postTokenBalances", [])
-    pre_token_balances = [shared.token_balance(tb) for tb in raw_pre_tb]
-    post_token_balances = [shared.token_balance(tb) for tb in raw_post_tb]
+    Notes:
+        This Geyser-style transaction uses a modified version of the
+        YellowStone Geyser Protobuf format. Standard Geyser Protobuf, as
+        defined in the YellowStone-gRPC repo, is handled by the
+        'yellowstone' normalizer.
 
+    Args:
+        tx: A Geyser-style transaction response.
+
+    Returns:
+        A standardized transaction.
+    """
     return models.Transaction(
-        slot=slot,
-        blockTime=block_time,
-        signatures=signatures,
-        message=models.Message(
-            accountKeys=account_keys,
-            recentBlockhash=message["recentBlockhash"],
-            instructions=instructions,
-            addressTableLookups=address_table_lookups,
-        ),
-        meta=models.Meta(
-            fee=geyser_meta.get("fee", 0),
-            preBalances=geyser_meta.get("preBalances", []),
-            postBalances=geyser_meta.get("postBalances", []),
-            preTokenBalances=pre_token_balances,
-            postTokenBalances=post_token_balances,
-            innerInstructions=geyser_meta.get("innerInstructions", []),
-            logMessages=geyser_meta.get("logMessages", []),
-            err=geyser_meta.get("err"),
-            status=geyser_meta.get("status", {"Ok": None}),
-            computeUnitsConsumed=geyser_meta.get("computeUnitsConsumed"),
-        ),
-        loadedAddresses=loaded_addresses,
+        slot=slot(tx),
+        blockTime=block_time(tx),
+        signatures=signatures(tx),
+        message=message(tx),
+        meta=meta(tx),
+        loadedAddresses=loaded_addresses(tx),
     )
@@ -0,0 +1,158 @@
+from dataclasses import fields
+from types import ModuleType
+from typing import Any, Callable, Dict
+
+from soltxs.normalizer import models
+
+
+def _compared(cls: type) -> tuple:
+    return tuple(f.name for f in fields(cls) if f.compare)
+
+
+class _Section:
+    """
+    Descriptor that builds a section of a view from its raw data on first
+    access (through the view's '_build') and caches it on the view.
+    """
+
+    def __init__(self, builder: str):
+        self.builder = builder
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, obj: "LazyTransaction", objtype: type = None) -> Any:
+        if obj is None:
+            return self
+        cache = obj._sections
+        if self.name not in cache:
+            cache[self.name] = obj._build(self.builder)
+        return cache[self.name]
+
+    def __set__(self, obj: "LazyTransaction", value: Any):
+        obj._sections[self.name] = value
+
+
+class LazyMeta(models.Meta):
+    """
+    A 'Meta' backed by the raw status metadata, building each field on first access.
+
+    Notes:
+        Reading 'fee' or 'err' does not build the token balances, inner
+        instructions or log messages. Fields are built by the source's
+        'META_FIELDS', like the eager path. Compares equal to a 'Meta'
+        holding the same values.
+    """
+
+    __slots__ = ("_raw", "_fields", "_sections")
+
+    fee = _Section("fee")
+    preBalances = _Section("preBalances")
+    postBalances = _Section("postBalances")
+    preTokenBalances = _Section("preTokenBalances")
+    postTokenBalances = _Section("postTokenBalances")
+    innerInstructions = _Section("innerInstructions")
+    logMessages = _Section("logMessages")
+    err = _Section("err")
+    status = _Section("status")
+    computeUnitsConsumed = _Section("computeUnitsConsumed")
+
+    def __init__(self, raw: Any, meta_fields: Dict[str, Callable[[Any], Any]]):
+        self._raw = raw
+        self._fields = meta_fields
+        self._sections: Dict[str, Any] = {}
+        self._inner_index = None
+        self._token_index = None
+
+    def _build(self, name: str) -> Any:
+        return self._fields[name](self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, models.Meta):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _compared(models.Meta))
+
+    def materialize(self) -> models.Meta:
+        """
+        Builds every remaining field and returns a plain 'Meta'.
+        """
+        return models.Meta(**{name: getattr(self, name) for name in self._fields})
+
+
+class LazyTransaction(models.Transaction):
+    """
+    A 'Transaction' backed by the raw payload it was normalized from.
+
+    Notes:
+        Each section ('message', 'meta', 'loadedAddresses', ...) is only
+        built, by the same normalizer functions as the eager path, the first
+        time it is read; 'meta' is itself a 'LazyMeta', built field by field.
+        Sections that are never read are never built, which makes this cheap
+        for transactions that are dropped early. Built sections share lists
+        with the raw payload, so the payload should not be mutated while the
+        view is in use.
+
+        A view compares equal to a plain 'Transaction' with the same
+        contents (e.g. 'normalize(tx, lazy=True) == normalize(tx)'), which
+        builds every section.
+    """
+
+    __slots__ = ("_raw", "_source", "_sections")
+
+    slot = _Section("slot")
+    blockTime = _Section("block_time")
+    signatures = _Section("signatures")
+    message = _Section("message")
+    meta = _Section("meta")
+    loadedAddresses = _Section("loaded_addresses")
+
+    def __init__(self, raw: dict, source: ModuleType):
+        self._raw = raw
+        self._source = source
+        self._sections: Dict[str, Any] = {}
+        self._account_table = None
+
+    def _build(self, name: str) -> Any:
+        if name == "meta":
+            return LazyMeta(self._source.raw_meta(self._raw), self._source.META_FIELDS)
+        return getattr(self._source, name)(self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, models.Transaction):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _compared(models.Transaction))
+
+    @property
+    def raw(self) -> dict:
+        """
+        Returns the raw payload backing this view.
+        """
+        return self._raw
+
+    def materialize(self) -> models.Transaction:
+        """
+        Builds every remaining section and returns a plain 'Transaction'.
+        """
+        meta = self.meta
+        return models.Transaction(
+            slot=self.slot,
+            blockTime=self.blockTime,
+            signatures=self.signatures,
+            message=self.message,
+            meta=meta.materialize() if isinstance(meta, LazyMeta) else meta,
+            loadedAddresses=self.loadedAddresses,
+        )
+
+
+def view(tx: dict, source: ModuleType) -> LazyTransaction:
+    """
+    Wraps a raw transaction payload in a lazily normalized view.
+
+    Args:
+        tx: A raw transaction payload.
+        source: The normalizer module that understands the payload format.
+
+    Returns:
+        A transaction view whose sections are built on first access.
+    """
+    return LazyTransaction(tx, source)
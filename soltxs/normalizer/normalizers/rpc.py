@@ -1,70 +1,132 @@
-from typing import List
+from typing import List, Optional
 
 from soltxs.normalizer import models
 from soltxs.normalizer.normalizers import shared
 
+# Builders of each 'Meta' field from the raw status metadata.
+META_FIELDS = shared.json_meta_fields(default_status={})
 
-def normalize(tx: dict) -> models.Transaction:
+
+def is_block(data: dict) -> bool:
     """
-    Parses an RPC transaction response into a StandardizedTransaction.
+    Whether 'data' is a 'getBlock' response, or its 'result', rather than a transaction.
+    """
+    result = data.get("result", data)
+    return isinstance(result, dict) and "transactions" in result and "blockhash" in result
 
-    Args:
-        tx: An RPC transaction response.
 
-    Returns:
-        A standardized transaction.
+def is_wire(tx: dict) -> bool:
     """
-    result = tx["result"]
+    Whether an RPC response carries its transaction as an encoded '[data, encoding]' pair, see 'wire'.
+    """
+    return isinstance(tx["result"]["transaction"], list)
 
-    slot = result["slot"]
-    block_time = result.get("blockTime")
-    transaction_dict = result["transaction"]
-    meta = result["meta"]
 
-    # Consolidate loadedAddresses
-    loaded_addresses = models.LoadedAddresses(
-        writable=meta.get("loadedAddresses", {}).get("writable", []),
-        readonly=meta.get("loadedAddresses", {}).get("readonly", []),
-    )
+def slot(tx: dict) -> int:
+    """
+    Returns the slot of an RPC transaction response.
+    """
+    return tx["result"]["slot"]
+
+
+def block_time(tx: dict) -> Optional[int]:
+    """
+    Returns the block time of an RPC transaction response, if known.
+    """
+    return tx["result"].get("blockTime")
+
+
+def signatures(tx: dict) -> List[str]:
+    """
+    Returns the base58 signatures of an RPC transaction response.
+    """
+    return tx["result"]["transaction"]["signatures"]
+
+
+def first_signature(tx: dict) -> str:
+    """
+    Returns the first signature of an RPC transaction response, without building the others.
+    """
+    return tx["result"]["transaction"]["signatures"][0]
+
+
+def raw_keys(tx: dict) -> List[str]:
+    """
+    Static and loaded account keys, read from the payload without building anything.
+    """
+    keys = tx["result"]["transaction"]["message"]["accountKeys"]
+    loaded = tx["result"]["meta"].get("loadedAddresses") or {}
+    return keys + loaded.get("writable", []) + loaded.get("readonly", [])
+
+
+def failed(tx: dict) -> bool:
+    """
+    Whether an RPC transaction response carries an error status, read without building the metadata.
+    """
+    return tx["result"]["meta"].get("err") is not None
 
-    # Instructions
-    raw_instructions = transaction_dict["message"]["instructions"]
-    instructions: List[models.Instruction] = [shared.instructions(i) for i in raw_instructions]
 
-    # Address Table Lookups
-    raw_lookups = transaction_dict["message"].get("addressTableLookups", [])
-    address_table_lookups: List[models.AddressTableLookup] = [shared.address_lookup(lu) for lu in raw_lookups]
+def message(tx: dict) -> models.Message:
+    """
+    Standardizes the message of an RPC transaction response.
+    """
+    return shared.message(tx["result"]["transaction"]["message"])
+
+
+def raw_meta(tx: dict) -> dict:
+    """
+    Returns the raw status metadata of an RPC transaction response.
+    """
+    return tx["result"]["meta"]
+
+
+def meta(tx: dict) -> models.Meta:
+    """
+    Standardizes the status metadata of an RPC transaction response.
+    """
+    return build_meta(raw_meta(tx))
+
+
+def build_meta(raw_meta: dict) -> models.Meta:
+    """
+    Standardizes RPC status metadata, as found in transaction and block responses.
+    """
+    return shared.build_meta(raw_meta, META_FIELDS)
+
+
+def loaded_addresses(tx: dict) -> models.LoadedAddresses:
+    """
+    Consolidates the addresses loaded through address table lookups.
+    """
+    return build_loaded_addresses(tx["result"]["meta"])
+
+
+def build_loaded_addresses(raw_meta: dict) -> models.LoadedAddresses:
+    """
+    Consolidates the loaded addresses of RPC status metadata.
+    """
+    raw_loaded = raw_meta.get("loadedAddresses", {})
+    return models.LoadedAddresses(
+        writable=shared.addresses(raw_loaded.get("writable", [])),
+        readonly=shared.addresses(raw_loaded.get("readonly", [])),
+    )
+
 
-    # Unify system program IDs in accountKeys
-    account_keys = shared.program_id(transaction_dict["message"]["accountKeys"])
+def normalize(tx: dict) -> models.Transaction:
+    """
+    Parses an RPC transaction response into a StandardizedTransaction.
 
-    # Token balances
-    raw_pre_tb = meta.get("preTokenBalances", [])
-    raw_post_tb = meta.get("postTokenBalances", [])
-    pre_token_balances = [shared.token_balance(tb) for tb in raw_pre_tb]
-    post_token_balances = [shared.token_balance(tb) for tb in raw_post_tb]
+    Args:
+        tx: An RPC transaction response.
 
+    Returns:
+        A standardized transaction.
+    """
     return models.Transaction(
-        slot=slot,
-        blockTime=block_time,
-        signatures=transaction_dict["signatures"],
-        message=models.Message(
-            accountKeys=account_keys,
-            recentBlockhash=transaction_dict["message"]["recentBlockhash"],
-            instructions=instructions,
-            addressTableLookups=address_table_lookups,
-        ),
-        meta=models.Meta(
-            fee=meta.get("fee", 0),
-            preBalances=meta.get("preBalances", []),
-            postBalances=meta.get("postBalances", []),
-            preTokenBalances=pre_token_balances,
-            postTokenBalances=post_token_balances,
-            innerInstructions=meta.get("innerInstructions", []),
-            logMessages=meta.get("logMessages", []),
-            err=meta.get("err"),
-            status=meta.get("status", {}),
-            computeUnitsConsumed=meta.get("computeUnitsConsumed"),
-        ),
-        loadedAddresses=loaded_addresses,
+        slot=slot(tx),
+        blockTime=block_time(tx),
+        signatures=signatures(tx),
+        message=message(tx),
+        meta=meta(tx),
+        loadedAddresses=loaded_addresses(tx),
     )
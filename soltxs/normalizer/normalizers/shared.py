@@ -1,8 +1,14 @@
-from typing import List
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
+import qbase58 as base58
+
+from soltxs.normalizer import interning, pubkey
 from soltxs.normalizer.models import (
     AddressTableLookup,
+    InnerInstructions,
     Instruction,
+    Message,
+    Meta,
     TokenAmount,
     TokenBalance,
 )
@@ -20,12 +26,68 @@ def instructions(instr: dict) -> Instruction:
     )
 
 
+def message(raw_message: dict) -> Message:
+    """
+    Convert a raw JSON transaction message to a typed message.
+    """
+    return Message(
+        # Unify system program IDs in accountKeys
+        accountKeys=account_keys(raw_message["accountKeys"]),
+        recentBlockhash=raw_message["recentBlockhash"],
+        instructions=[instructions(i) for i in raw_message["instructions"]],
+        addressTableLookups=[address_lookup(lu) for lu in raw_message.get("addressTableLookups", [])],
+    )
+
+
+def inner_instructions(group: dict) -> InnerInstructions:
+    """
+    Convert a raw inner-instruction group to typed instructions.
+    """
+    return InnerInstructions(
+        index=group["index"],
+        instructions=[instructions(i) for i in group["instructions"]],
+    )
+
+
+def json_meta_fields(default_status: dict) -> Dict[str, Callable[[dict], Any]]:
+    """
+    Builders of each 'Meta' field from JSON status metadata (RPC and Geyser-style payloads).
+
+    Notes:
+        Each field is built on its own, so a lazy transaction view only
+        builds the fields that are read.
+
+    Args:
+        default_status: Status to use when the metadata has none. Copied on
+            every use.
+    """
+    return {
+        "fee": lambda m: m.get("fee", 0),
+        "preBalances": lambda m: m.get("preBalances", []),
+        "postBalances": lambda m: m.get("postBalances", []),
+        "preTokenBalances": lambda m: [token_balance(tb) for tb in m.get("preTokenBalances", [])],
+        "postTokenBalances": lambda m: [token_balance(tb) for tb in m.get("postTokenBalances", [])],
+        "innerInstructions": lambda m: [inner_instructions(group) for group in m.get("innerInstructions", [])],
+        "logMessages": lambda m: m.get("logMessages", []),
+        "err": lambda m: m.get("err"),
+        "status": lambda m: m.get("status") if "status" in m else dict(default_status),
+        "computeUnitsConsumed": lambda m: m.get("computeUnitsConsumed"),
+    }
+
+
+def build_meta(raw_meta: Any, fields: Dict[str, Callable[[Any], Any]]) -> Meta:
+    """
+    Builds every 'Meta' field of raw status metadata with a source's field builders.
+    """
+    return Meta(**{name: build(raw_meta) for name, build in fields.items()})
+
+
 def address_lookup(lookup: dict) -> AddressTableLookup:
     """
     Ensure address table lookup has 'readonlyIndexes' and 'writableIndexes' as lists.
     """
     return AddressTableLookup(
-        accountKey=lookup["accountKey"],
+        accountKey=address(lookup["accountKey"]),
         readonlyIndexes=lookup.get("readonlyIndexes", []),
         writableIndexes=lookup.get("writableIndexes", []),
     )
@@ -37,9 +99,9 @@ def token_balance(tb: dict) -> TokenBalance:
     """
     return TokenBalance(
         accountIndex=tb["accountIndex"],
-        mint=tb["mint"],
-        owner=tb["owner"],
-        programId=tb.get("programId"),
+        mint=address(tb["mint"]),
+        owner=address(tb["owner"]),
+        programId=address(tb.get("programId")),
         uiTokenAmount=TokenAmount(
             amount=tb["uiTokenAmount"]["amount"],
             decimals=tb["uiTokenAmount"]["decimals"],
@@ -57,8 +119,12 @@ def program_id(keys: List[str]) -> List[str]:
         keys: List of program keys.
 
     Returns:
-        List of program keys with 33-ones key converted to 32-ones.
+        List of program keys with 33-ones key converted to 32-ones. The
+        input list is returned as-is when there is nothing to convert.
     """
+    if "111111111111111111111111111111111" not in keys:
+        return keys
+
     unified = []
     for k in keys:
         if k == "111111111111111111111111111111111":
@@ -66,3 +132,65 @@ def program_id(keys: List[str]) -> List[str]:
         else:
             unified.append(k)
     return unified
+
+
+def account_keys(keys: List[str]) -> List[pubkey.Address]:
+    """
+    Unify system program IDs in account keys and standardize them, see 'addresses'.
+    """
+    return addresses(program_id(keys))
+
+
+def address(text: Optional[str]) -> Optional[pubkey.Address]:
+    """
+    Standardize a base58 address: a 'Pubkey' if enabled, otherwise the
+    string itself, interned if interning is enabled.
+    """
+    if text is None:
+        return None
+    if pubkey.enabled:
+        return pubkey.Pubkey.from_str(text)
+    return interning.intern(text)
+
+
+def addresses(texts: List[str]) -> List[pubkey.Address]:
+    """
+    Standardize a list of base58 addresses, see 'address'.
+
+    Notes:
+        Always returns a new list, so a normalized transaction never shares
+        its address lists with the payload it was built from.
+    """
+    if pubkey.enabled:
+        return [pubkey.Pubkey.from_str(t) for t in texts]
+    standardized = interning.intern_all(texts)
+    return list(texts) if standardized is texts else standardized
+
+
+def raw_address(raw: bytes) -> pubkey.Address:
+    """
+    Standardize a raw 32-byte address, see 'pubkey.from_raw'.
+    """
+    return pubkey.from_raw(raw)
+
+
+def raw_addresses(raws: Iterable[bytes]) -> List[pubkey.Address]:
+    """
+    Standardize raw 32-byte addresses, see 'raw_address'.
+    """
+    if pubkey.enabled:
+        return [pubkey.Pubkey.from_bytes(r) for r in raws]
+    return interning.intern_all([b58encode(r) for r in raws])
+
+
+def b58encode(raw: bytes) -> str:
+    """
+    Base58-encode raw bytes, such as a 32-byte public key.
+
+    Notes:
+        qbase58 renders an all-zero input with one '1' too many (e.g. the
+        system program as 33 ones), which this corrects.
+    """
+    if not raw.strip(b"\x00"):
+        return "1" * len(raw)
+    return base58.encode(raw)
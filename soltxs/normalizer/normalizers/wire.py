@@ -0,0 +1,221 @@
+import base64
+from typing import List, Optional, Tuple, Union
+
+from soltxs.normalizer import models
+from soltxs.normalizer.normalizers import rpc, shared
+
+_SIGNATURE_SIZE = 64
+_KEY_SIZE = 32
+_VERSION_PREFIX = 0x80
+
+
+def _compact_u16(buf: memoryview, offset: int) -> Tuple[int, int]:
+    """
+    Reads a compact-u16 (1-3 byte little-endian base-128) length prefix.
+
+    Returns:
+        The value and the offset right after it.
+    """
+    value = 0
+    for shift in (0, 7, 14):
+        byte = buf[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+    return value, offset
+
+
+def _bytes(buf: memoryview, offset: int) -> Tuple[memoryview, int]:
+    """
+    Reads a compact-u16 length-prefixed byte array as a slice of 'buf'.
+    """
+    length, offset = _compact_u16(buf, offset)
+    return buf[offset : offset + length], offset + length
+
+
+def _keys(buf: memoryview, offset: int) -> Tuple[List[str], int]:
+    count, offset = _compact_u16(buf, offset)
+    end = offset + count * _KEY_SIZE
+    return shared.raw_addresses(bytes(buf[o : o + _KEY_SIZE]) for o in range(offset, end, _KEY_SIZE)), end
+
+
+def _wire(tx: dict) -> memoryview:
+    return decode(tx["result"]["transaction"])
+
+
+def decode(encoded: List[str]) -> memoryview:
+    """
+    Decodes a '[data, "base64"]' pair into the serialized transaction.
+    """
+    data, encoding = encoded
+    if encoding != "base64":
+        raise ValueError(f"Unsupported transaction encoding: {encoding}")
+    return memoryview(base64.b64decode(data))
+
+
+def slot(tx: dict) -> int:
+    """
+    Returns the slot of a base64-encoded RPC transaction response.
+    """
+    return tx["result"]["slot"]
+
+
+def block_time(tx: dict) -> Optional[int]:
+    """
+    Returns the block time of a base64-encoded RPC transaction response, if known.
+    """
+    return tx["result"].get("blockTime")
+
+
+def signatures(tx: dict) -> List[str]:
+    """
+    Returns the base58 signatures of a base64-encoded RPC transaction response.
+    """
+    return read_signatures(_wire(tx))[0]
+
+
+def first_signature(tx: dict) -> str:
+    """
+    Returns the first signature of a base64-encoded RPC transaction response, without building the others.
+    """
+    # Only decode the length prefix (up to 3 bytes) and the first signature: 69 bytes, 92 base64 characters.
+    data, encoding = tx["result"]["transaction"]
+    if encoding != "base64":
+        raise ValueError(f"Unsupported transaction encoding: {encoding}")
+    buf = base64.b64decode(data[:92])
+    _, offset = _compact_u16(buf, 0)
+    return shared.b58encode(buf[offset : offset + _SIGNATURE_SIZE])
+
+
+def raw_keys(tx: dict) -> List[Union[bytes, str]]:
+    """
+    Static account keys as raw bytes, followed by the loaded addresses as base58 text.
+    """
+    buf = _wire(tx)
+    count, offset = _compact_u16(buf, 0)
+    offset += count * _SIGNATURE_SIZE
+    if buf[offset] & _VERSION_PREFIX:
+        offset += 1
+
+    # Skip the 3-byte header.
+    count, offset = _compact_u16(buf, offset + 3)
+    keys: List[Union[bytes, str]] = [
+        bytes(buf[o : o + _KEY_SIZE]) for o in range(offset, offset + count * _KEY_SIZE, _KEY_SIZE)
+    ]
+
+    loaded = tx["result"]["meta"].get("loadedAddresses") or {}
+    return keys + loaded.get("writable", []) + loaded.get("readonly", [])
+
+
+def message(tx: dict) -> models.Message:
+    """
+    Standardizes the message of a base64-encoded RPC transaction response.
+    """
+    buf = _wire(tx)
+    return read_message(buf, read_signatures(buf)[1])
+
+
+def read_signatures(buf: memoryview) -> Tuple[List[str], int]:
+    """
+    Reads the signatures of a serialized transaction.
+
+    Returns:
+        The signatures and the offset of the message.
+    """
+    count, offset = _compact_u16(buf, 0)
+    end = offset + count * _SIGNATURE_SIZE
+    return [shared.b58encode(bytes(buf[o : o + _SIGNATURE_SIZE])) for o in range(offset, end, _SIGNATURE_SIZE)], end
+
+
+def read_message(buf: memoryview, offset: int) -> models.Message:
+    """
+    Decodes the message of a legacy or v0 serialized transaction.
+
+    Notes:
+        Layout: optional version prefix, 3-byte header, account keys,
+        recent blockhash, instructions and, for v0, address table lookups.
+        Arrays are compact-u16 length-prefixed and are read as slices of
+        the decoded buffer, so only the final values are copied out.
+    """
+    versioned = buf[offset] & _VERSION_PREFIX
+    if versioned:
+        version = buf[offset] & ~_VERSION_PREFIX
+        if version != 0:
+            raise ValueError(f"Unsupported transaction version: {version}")
+        offset += 1
+
+    # Header: required signatures, readonly signed, readonly unsigned.
+    offset += 3
+
+    account_keys, offset = _keys(buf, offset)
+    recent_blockhash = shared.b58encode(bytes(buf[offset : offset + _KEY_SIZE]))
+    offset += _KEY_SIZE
+
+    instructions: List[models.Instruction] = []
+    count, offset = _compact_u16(buf, offset)
+    for _ in range(count):
+        program_id_index = buf[offset]
+        accounts, offset = _bytes(buf, offset + 1)
+        data, offset = _bytes(buf, offset)
+        instructions.append(
+            models.RawInstruction(
+                programIdIndex=program_id_index,
+                raw=bytes(data),
+                accounts=accounts.tolist(),
+                stackHeight=None,
+            )
+        )
+
+    address_table_lookups: List[models.AddressTableLookup] = []
+    if versioned:
+        count, offset = _compact_u16(buf, offset)
+        for _ in range(count):
+            account_key = shared.raw_address(bytes(buf[offset : offset + _KEY_SIZE]))
+            writable, offset = _bytes(buf, offset + _KEY_SIZE)
+            readonly, offset = _bytes(buf, offset)
+            address_table_lookups.append(
+                models.AddressTableLookup(
+                    accountKey=account_key,
+                    readonlyIndexes=readonly.tolist(),
+                    writableIndexes=writable.tolist(),
+                )
+            )
+
+    return models.Message(
+        accountKeys=account_keys,
+        recentBlockhash=recent_blockhash,
+        instructions=instructions,
+        addressTableLookups=address_table_lookups,
+    )
+
+
+# Status metadata is JSON in every encoding.
+META_FIELDS = rpc.META_FIELDS
+raw_meta = rpc.raw_meta
+meta = rpc.meta
+loaded_addresses = rpc.loaded_addresses
+failed = rpc.failed
+
+
+def normalize(tx: dict) -> models.Transaction:
+    """
+    Standardizes an RPC transaction response fetched with '"encoding": "base64"'.
+
+    Args:
+        tx: An RPC transaction response whose transaction is a '[data, "base64"]' pair.
+
+    Returns:
+        A standardized transaction, identical to the one for the JSON encoding.
+    """
+    buf = _wire(tx)
+    tx_signatures, offset = read_signatures(buf)
+
+    return models.Transaction(
+        slot=slot(tx),
+        blockTime=block_time(tx),
+        signatures=tx_signatures,
+        message=read_message(buf, offset),
+        meta=meta(tx),
+        loadedAddresses=loaded_addresses(tx),
+    )
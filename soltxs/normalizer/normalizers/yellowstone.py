@@ -0,0 +1,246 @@
+from typing import Any, Dict, List, Optional
+
+from soltxs.normalizer import models
+from soltxs.normalizer.normalizers import shared
+
+# Protobuf class used to parse serialized updates, see 'set_message_class'.
+_message_class: Optional[type] = None
+
+
+def set_message_class(cls: type):
+    """
+    Registers the generated 'SubscribeUpdate' (or 'SubscribeUpdateTransaction')
+    protobuf class used to parse serialized updates.
+    """
+    global _message_class
+    _message_class = cls
+
+
+def from_bytes(data: bytes) -> Any:
+    """
+    Parses a serialized Yellowstone update into its protobuf message.
+
+    Notes:
+        soltxs does not ship generated protobuf code. Either register the
+        class generated from Yellowstone's 'geyser.proto' with
+        'set_message_class', or make it importable as 'geyser_pb2'.
+    """
+    global _message_class
+    if _message_class is None:
+        try:
+            from geyser_pb2 import SubscribeUpdate
+        except ImportError:
+            raise ValueError(
+                "Parsing serialized Yellowstone updates needs the generated protobuf classes; "
+                "register them with soltxs.normalizer.normalizers.yellowstone.set_message_class()."
+            ) from None
+        _message_class = SubscribeUpdate
+
+    return _message_class.FromString(bytes(data))
+
+
+def is_update(msg: Any) -> bool:
+    """
+    Whether 'msg' looks like a 'SubscribeUpdate' or 'SubscribeUpdateTransaction' message.
+    """
+    return hasattr(msg, "transaction") and not isinstance(msg, dict)
+
+
+def _has(msg: Any, name: str) -> bool:
+    has_field = getattr(msg, "HasField", None)
+    if has_field is not None:
+        return has_field(name)
+    return getattr(msg, name, None) is not None
+
+
+def _update(msg: Any) -> Any:
+    # SubscribeUpdate wraps SubscribeUpdateTransaction, which carries the slot.
+    return msg.transaction if hasattr(msg.transaction, "slot") else msg
+
+
+def _info(msg: Any) -> Any:
+    return _update(msg).transaction
+
+
+def _instruction(instr: Any, stack_height: Optional[int] = None) -> models.Instruction:
+    return models.RawInstruction(
+        programIdIndex=instr.program_id_index,
+        raw=instr.data,
+        accounts=list(instr.accounts),
+        stackHeight=stack_height,
+    )
+
+
+def _token_balance(tb: Any) -> models.TokenBalance:
+    amount = tb.ui_token_amount
+    return models.TokenBalance(
+        accountIndex=tb.account_index,
+        mint=shared.address(tb.mint),
+        owner=shared.address(tb.owner),
+        programId=shared.address(tb.program_id or None),
+        uiTokenAmount=models.TokenAmount(
+            amount=amount.amount,
+            decimals=amount.decimals,
+            # Protobuf has no null doubles; a zero amount stands for none.
+            uiAmount=amount.ui_amount or None,
+            uiAmountString=amount.ui_amount_string,
+        ),
+    )
+
+
+def slot(msg: Any) -> int:
+    """
+    Returns the slot of a Yellowstone transaction update.
+    """
+    return _update(msg).slot
+
+
+def block_time(msg: Any) -> Optional[int]:
+    """
+    Returns the block time of a Yellowstone transaction update, if known.
+    """
+    # Geyser doesn't have a block_time.
+    return None
+
+
+def signatures(msg: Any) -> List[str]:
+    """
+    Returns the base58 signatures of a Yellowstone transaction update.
+    """
+    return [shared.b58encode(s) for s in _info(msg).transaction.signatures]
+
+
+def first_signature(msg: Any) -> str:
+    """
+    Returns the first signature of a Yellowstone transaction update, without building the others.
+    """
+    return shared.b58encode(_info(msg).transaction.signatures[0])
+
+
+def raw_keys(msg: Any) -> List[bytes]:
+    """
+    Static and loaded account keys as raw bytes, read without building anything.
+    """
+    info = _info(msg)
+    raw_meta = info.meta
+    return [
+        *info.transaction.message.account_keys,
+        *raw_meta.loaded_writable_addresses,
+        *raw_meta.loaded_readonly_addresses,
+    ]
+
+
+def failed(msg: Any) -> bool:
+    """
+    Whether a Yellowstone transaction update carries an error status, read without building the metadata.
+    """
+    return _has(_info(msg).meta, "err")
+
+
+def message(msg: Any) -> models.Message:
+    """
+    Standardizes the message of a Yellowstone transaction update.
+    """
+    raw_message = _info(msg).transaction.message
+
+    return models.Message(
+        accountKeys=shared.raw_addresses(raw_message.account_keys),
+        recentBlockhash=shared.b58encode(raw_message.recent_blockhash),
+        instructions=[_instruction(i) for i in raw_message.instructions],
+        addressTableLookups=[
+            models.AddressTableLookup(
+                accountKey=shared.raw_address(lu.account_key),
+                readonlyIndexes=list(lu.readonly_indexes),
+                writableIndexes=list(lu.writable_indexes),
+            )
+            for lu in raw_message.address_table_lookups
+        ],
+    )
+
+
+def _inner_instructions(raw_meta: Any) -> List[models.InnerInstructions]:
+    return [
+        models.InnerInstructions(
+            index=group.index,
+            instructions=[
+                _instruction(i, i.stack_height if _has(i, "stack_height") else None) for i in group.instructions
+            ],
+        )
+        for group in raw_meta.inner_instructions
+    ]
+
+
+def _err(raw_meta: Any) -> Optional[bytes]:
+    # The error is kept as the raw bincode-serialized 'TransactionError'.
+    return raw_meta.err.err if _has(raw_meta, "err") else None
+
+
+def _status(raw_meta: Any) -> Dict[str, Any]:
+    err = _err(raw_meta)
+    return {"Ok": None} if err is None else {"Err": err}
+
+
+# Builders of each 'Meta' field from the raw 'TransactionStatusMeta'.
+META_FIELDS = {
+    "fee": lambda m: m.fee,
+    "preBalances": lambda m: list(m.pre_balances),
+    "postBalances": lambda m: list(m.post_balances),
+    "preTokenBalances": lambda m: [_token_balance(tb) for tb in m.pre_token_balances],
+    "postTokenBalances": lambda m: [_token_balance(tb) for tb in m.post_token_balances],
+    "innerInstructions": _inner_instructions,
+    "logMessages": lambda m: list(m.log_messages),
+    "err": _err,
+    "status": _status,
+    "computeUnitsConsumed": lambda m: m.compute_units_consumed if _has(m, "compute_units_consumed") else None,
+}
+
+
+def raw_meta(msg: Any) -> Any:
+    """
+    Returns the raw 'TransactionStatusMeta' of a Yellowstone transaction update.
+    """
+    return _info(msg).meta
+
+
+def meta(msg: Any) -> models.Meta:
+    """
+    Standardizes the status metadata of a Yellowstone transaction update.
+    """
+    return shared.build_meta(raw_meta(msg), META_FIELDS)
+
+
+def loaded_addresses(msg: Any) -> models.LoadedAddresses:
+    """
+    Consolidates the addresses loaded through address table lookups.
+    """
+    raw_meta = _info(msg).meta
+    return models.LoadedAddresses(
+        writable=shared.raw_addresses(raw_meta.loaded_writable_addresses),
+        readonly=shared.raw_addresses(raw_meta.loaded_readonly_addresses),
+    )
+
+
+def normalize(msg: Any) -> models.Transaction:
+    """
+    Standardizes a standard Yellowstone Geyser protobuf transaction update.
+
+    Notes:
+        Reads 'SubscribeUpdate' / 'SubscribeUpdateTransaction' messages as
+        defined in the Yellowstone-gRPC repo. Instruction data is kept as
+        the raw protobuf bytes, so it is never base58-encoded or decoded;
+        only addresses and signatures are rendered as base58 text.
+
+    Args:
+        msg: A Yellowstone transaction update message.
+
+    Returns:
+        A standardized transaction.
+    """
+    return models.Transaction(
+        slot=slot(msg),
+        blockTime=block_time(msg),
+        signatures=signatures(msg),
+        message=message(msg),
+        meta=meta(msg),
+        loadedAddresses=loaded_addresses(msg),
+    )
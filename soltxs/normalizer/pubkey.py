@@ -0,0 +1,147 @@
+from functools import total_ordering
+from typing import Any, Dict, Optional, Union
+
+import qbase58 as base58
+
+from soltxs.normalizer import interning
+from soltxs.normalizer.normalizers import shared
+
+_KEY_SIZE = 32
+
+# Whether the normalizers produce 'Pubkey' addresses instead of base58 strings, see 'enable'.
+enabled = False
+
+
+@total_ordering
+class Pubkey:
+    """
+    A 32-byte Solana address, rendered as base58 text only when needed.
+
+    Notes:
+        A key built from raw bytes (Yellowstone, base64 wire format, Borsh
+        event data) keeps just the bytes until it is rendered with 'str()'.
+        A key built from text keeps the text and only decodes it when its
+        bytes are asked for. Both forms are cached once computed.
+
+        Keys compare, order and hash by their bytes, so a key built from
+        text is decoded once when hashed or compared with a key built from
+        bytes. A key never equals a plain string; convert it with 'str()'
+        to compare it with base58 text.
+    """
+
+    __slots__ = ("_raw", "_text")
+
+    def __init__(self, raw: Optional[bytes] = None, text: Optional[str] = None):
+        if raw is None and text is None:
+            raise ValueError("Pubkey needs either raw bytes or base58 text.")
+        if raw is not None and len(raw) != _KEY_SIZE:
+            raise ValueError(f"Pubkey must be exactly {_KEY_SIZE} bytes, got {len(raw)}.")
+
+        self._raw = raw
+        self._text = text
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "Pubkey":
+        return cls(raw=bytes(raw))
+
+    @classmethod
+    def from_str(cls, text: str) -> "Pubkey":
+        return cls(text=text)
+
+    @property
+    def raw(self) -> bytes:
+        """
+        The 32 bytes of the key.
+        """
+        if self._raw is None:
+            # qbase58 handles the all-ones (all-zero bytes) key correctly when decoding.
+            self._raw = base58.decode(self._text)
+        return self._raw
+
+    def __bytes__(self) -> bytes:
+        return self.raw
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = shared.b58encode(self._raw)
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"Pubkey('{self}')"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Pubkey):
+            return NotImplemented
+        if self._text is not None and other._text is not None:
+            return self._text == other._text
+        return self.raw == other.raw
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Pubkey):
+            return NotImplemented
+        return self.raw < other.raw
+
+    def __hash__(self) -> int:
+        return hash(self.raw)
+
+
+# An address as carried through transactions: base58 text, or a 'Pubkey' when enabled.
+Address = Union[str, Pubkey]
+
+# Base58 constant -> its 'Pubkey', see 'constant'.
+_constants: Dict[str, Pubkey] = {}
+
+
+def text(address: Optional[Address]) -> Optional[str]:
+    """
+    Returns the base58 text of an address, whichever form it is carried in.
+
+    Notes:
+        Use it to compare an address with base58 constants (program IDs,
+        mints), since a 'Pubkey' never equals a string.
+    """
+    if address is None or isinstance(address, str):
+        return address
+    return str(address)
+
+
+def constant(address: str) -> Address:
+    """
+    Returns a base58 constant (e.g. the WSOL mint) in the form addresses are carried in.
+
+    Notes:
+        Parsers emit constants through it, so that results never mix
+        strings and 'Pubkey's. The 'Pubkey' of each constant is built once.
+    """
+    if not enabled:
+        return address
+    key = _constants.get(address)
+    if key is None:
+        key = _constants[address] = Pubkey.from_str(address)
+    return key
+
+
+def from_raw(raw: bytes) -> Address:
+    """
+    Standardizes a raw 32-byte address: a 'Pubkey' if enabled, otherwise
+    its base58 string, interned if interning is enabled.
+    """
+    if enabled:
+        return Pubkey.from_bytes(raw)
+    return interning.intern(shared.b58encode(bytes(raw)))
+
+
+def enable():
+    """
+    Makes the normalizers and parsers carry addresses as 'Pubkey' instead of base58 strings.
+    """
+    global enabled
+    enabled = True
+
+
+def disable():
+    """
+    Goes back to plain base58 string addresses.
+    """
+    global enabled
+    enabled = False
@@ -1,29 +1,93 @@
-from typing import Dict, List
+from typing import FrozenSet, Iterable, List, Optional, Type, Union
 
+from soltxs import instrumentation, plugins
 from soltxs.normalizer.models import Transaction
 from soltxs.parser import models, parsers
+from soltxs.parser.registry import BUILTIN, ProgramRegistry
 
-id_to_handler: Dict[str, models.Program] = {
-    parsers.systemProgram.SystemProgramParser.program_id: parsers.systemProgram.SystemProgramParser,
-    parsers.computeBudget.ComputeBudgetParser.program_id: parsers.computeBudget.ComputeBudgetParser,
-    parsers.tokenProgram.TokenProgramParser.program_id: parsers.tokenProgram.TokenProgramParser,
-    parsers.raydiumAMM.RaydiumAMMParser.program_id: parsers.raydiumAMM.RaydiumAMMParser,
-    parsers.pumpfun.PumpFunParser.program_id: parsers.pumpfun.PumpFunParser,
-}
+# Program ID -> parser. Parsers are imported the first time their program ID is looked up.
+id_to_handler = ProgramRegistry(BUILTIN, entry_point_group=plugins.PARSERS_GROUP)
 
 
-def parse(tx: Transaction) -> List[models.ParsedInstruction]:
+def register(program_id: str, handler: Union[models.Program, str]) -> Union[models.Program, str]:
+    """
+    Adds a program to the default registry. See 'ProgramRegistry.register'.
+    """
+    return id_to_handler.register(program_id, handler)
+
+
+def plan(types: Iterable[Type[models.ParsedInstruction]]) -> Optional[FrozenSet[str]]:
+    """
+    Builds a parse plan: the program IDs needed to produce the given instruction types.
+
+    Args:
+        types: Parsed instruction types the caller is interested in.
+
+    Returns:
+        The program IDs to parse, or None if some type is not produced by any
+        known program and every instruction must be parsed.
+    """
+    programs = set()
+    for wanted in types:
+        producers = id_to_handler.producers(wanted)
+        if not producers:
+            return None
+        programs.update(producers)
+    return frozenset(programs)
+
+
+def parse(
+    tx: Transaction,
+    programs: Optional[Iterable[str]] = None,
+    tolerant: bool = False,
+) -> List[models.ParsedInstruction]:
     """
     Parses a standardized Solana transaction object.
+
+    Args:
+        tx: The standardized transaction.
+        programs: Optional program IDs to parse. Instructions of any other
+            program are skipped without decoding their data.
+        tolerant: Instead of raising, record each instruction that fails to
+            parse in a known way (see 'models.Program.route') as a
+            'models.ParseError' in its place and keep going. Unexpected
+            parser errors still raise.
     """
+    if programs is not None and not isinstance(programs, (set, frozenset)):
+        programs = frozenset(programs)
+
+    if instrumentation.enabled:
+        start = instrumentation.clock()
+        actions = _parse(tx, programs, tolerant)
+        instrumentation.record(instrumentation.PARSE, "parse", instrumentation.clock() - start)
+        return actions
 
+    return _parse(tx, programs, tolerant)
+
+
+def _parse(tx: Transaction, programs: Optional[FrozenSet[str]], tolerant: bool) -> List[models.ParsedInstruction]:
     actions: List[models.ParsedInstruction] = []
 
+    keys = tx.message.accountKeys
     for idx, instruction in enumerate(tx.message.instructions):
-        program_id = tx.message.accountKeys[instruction.programIdIndex]
+        if tolerant and instruction.programIdIndex >= len(keys):
+            reason = f"Program ID index {instruction.programIdIndex} is out of range ({len(keys)} accounts)"
+            unknown = parsers.unknown.UnknownProgramParser
+            actions.append(unknown.parse_error(idx, None, models.ACCOUNT_OUT_OF_RANGE, reason))
+            continue
+
+        program_id = keys[instruction.programIdIndex]
+        if not isinstance(program_id, str):
+            # Pubkey addresses: registries and plans are keyed by base58 text.
+            program_id = str(program_id)
+        if programs is not None and program_id not in programs:
+            continue
 
-        router = id_to_handler.get(program_id, parsers.unknown.UnknownProgramParser)
-        action = router.route(tx, idx)
-        actions.append(action)
+        router = id_to_handler.get(program_id)
+        if router is None:
+            router = parsers.unknown.UnknownProgramParser
+            if instrumentation.enabled:
+                instrumentation.record(instrumentation.UNKNOWN_PROGRAM, program_id)
+        actions.append(router.route(tx, idx, tolerant))
 
     return actions
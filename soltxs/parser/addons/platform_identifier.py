@@ -1,5 +1,6 @@
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
+from soltxs.normalizer import pubkey
 from soltxs.normalizer.models import Transaction
 
 PLATFORM = {
@@ -8,6 +9,18 @@ PLATFORM = {
     "AVUCZyuT35YSuj4RH7fwiyPu82Djn2Hfg7y2ND2XcnZH": "Photon",
 }
 
+_PUBKEYS: Optional[Dict[pubkey.Pubkey, str]] = None
+
+
+def _pubkeys() -> Dict[pubkey.Pubkey, str]:
+    """
+    Returns the platform addresses as 'Pubkey', to look them up in tables of 'Pubkey' addresses.
+    """
+    global _PUBKEYS
+    if _PUBKEYS is None:
+        _PUBKEYS = {pubkey.Pubkey.from_str(address): name for address, name in PLATFORM.items()}
+    return _PUBKEYS
+
 
 def enrich(tx: Transaction) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -16,8 +29,12 @@ def enrich(tx: Transaction) -> Tuple[Optional[str], Optional[str]]:
     Returns:
         A tuple of the platform address and the platform name.
     """
-    for address in tx.all_accounts:
-        if address in PLATFORM:
-            return address, PLATFORM[address]
+    table = tx.account_table
+    keys = PLATFORM if not table.keys or isinstance(table.keys[0], str) else _pubkeys()
+    found = [(table.index_of(key), str(key)) for key in keys if key in table]
+    if not found:
+        return None, None
 
-    return None, None
+    # Report the platform referenced first, in account order.
+    _, address = min(found)
+    return address, PLATFORM[address]
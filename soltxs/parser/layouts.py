@@ -0,0 +1,96 @@
+import struct
+from typing import Any, List, Sequence, Tuple
+
+import qbase58 as base58
+
+from soltxs.normalizer import pubkey
+
+# Field types and their little-endian struct codes.
+FIELD_TYPES = {
+    "u8": "B",
+    "u16": "H",
+    "u32": "I",
+    "u64": "Q",
+    "i64": "q",
+    "f64": "d",
+    "bool": "?",
+    "pubkey": "32s",
+    "padding_u8": "x",
+    "padding_u16": "2x",
+    "padding_u32": "4x",
+    "padding_u64": "8x",
+}
+
+
+class Layout:
+    """
+    Fixed-size little-endian payload layout, decoded with one precompiled 'struct.Struct'.
+
+    Notes:
+        'unpack' reads straight from the instruction data at an offset,
+        without slicing it first, and returns the field values in
+        declaration order (padding excluded), ready to be destructured.
+        'pubkey' fields come back as addresses, like the normalizers
+        produce them. Variable-length payloads (strings, vectors) stay on
+        qborsh schemas.
+
+    Example:
+        TRANSFER = Layout([("discriminator", "padding_u32"), ("lamports", "u64")])
+        (lamports,) = TRANSFER.unpack(data)
+    """
+
+    __slots__ = ("names", "size", "_struct", "_pubkeys")
+
+    def __init__(self, fields: Sequence[Tuple[str, str]]):
+        unknown = [kind for _, kind in fields if kind not in FIELD_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown field types: {', '.join(unknown)}.")
+
+        self._struct = struct.Struct("<" + "".join(FIELD_TYPES[kind] for _, kind in fields))
+        self.size = self._struct.size
+
+        values = [(name, kind) for name, kind in fields if not kind.startswith("padding")]
+        self.names = tuple(name for name, _ in values)
+        self._pubkeys = tuple(i for i, (_, kind) in enumerate(values) if kind == "pubkey")
+
+    def unpack(self, data: bytes, offset: int = 0) -> Tuple[Any, ...] | List[Any]:
+        """
+        Decodes the field values at 'offset' of 'data'.
+
+        Raises:
+            struct.error: If 'data' is too short for the layout.
+        """
+        values = self._struct.unpack_from(data, offset)
+        if not self._pubkeys:
+            return values
+
+        values = list(values)
+        for i in self._pubkeys:
+            values[i] = pubkey.from_raw(values[i])
+        return values
+
+    def decode(self, data: bytes, offset: int = 0) -> dict:
+        """
+        Decodes the field values at 'offset' of 'data' into a dict keyed by field name.
+        """
+        return dict(zip(self.names, self.unpack(data, offset)))
+
+    def pack_into(self, buffer: Any, offset: int, *values: Any):
+        """
+        Encodes field values (declaration order, padding excluded) at 'offset' of a writable buffer.
+
+        Notes:
+            'pubkey' fields take addresses, as 'unpack' returns them.
+
+        Raises:
+            ValueError: If a 'pubkey' value is not a 32-byte address.
+            struct.error: If a value does not fit its field, or 'buffer' is too short.
+        """
+        if self._pubkeys:
+            values = list(values)
+            for i in self._pubkeys:
+                raw = values[i].raw if isinstance(values[i], pubkey.Pubkey) else base58.decode(values[i])
+                if len(raw) != 32:
+                    raise ValueError(f"Field '{self.names[i]}' is not a 32-byte address.")
+                values[i] = raw
+        self._struct.pack_into(buffer, offset, *values)
@@ -1,9 +1,8 @@
 import abc
 from dataclasses import dataclass
-from typing import Dict, Generic, TypeVar
-
-import qbase58 as base58
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar
 
+from soltxs import instrumentation
 from soltxs.normalizer.models import Instruction, Transaction
 
 
@@ -14,6 +13,30 @@ class ParsedInstruction:
     instruction_name: str
 
 
+# 'ParseError.error' values of the failures parsers detect themselves.
+UNKNOWN_DISCRIMINATOR = "UnknownDiscriminator"
+SHORT_DATA = "ShortData"
+ACCOUNT_OUT_OF_RANGE = "AccountOutOfRange"
+MISSING_DECIMALS = "MissingDecimals"
+MISSING_EVENT = "MissingEvent"
+INVALID_DATA = "InvalidData"
+
+
+@dataclass(slots=True)
+class ParseError(ParsedInstruction):
+    """
+    An instruction that could not be parsed, recorded in its place when parsing tolerantly.
+    """
+
+    instruction_index: Optional[int]
+    discriminator: Optional[str]
+    error: str
+    reason: str
+
+
+# Exceptions strict parsing raises for the failures parsers report as records (ValueError otherwise).
+_STRICT_ERRORS = {UNKNOWN_DISCRIMINATOR: NotImplementedError, ACCOUNT_OUT_OF_RANGE: IndexError}
+
 T = TypeVar("T", bound=ParsedInstruction)
 
 
@@ -21,11 +44,19 @@ class Program(abc.ABC, Generic[T]):
     program_id: str
     program_name: str
 
+    # Instruction types this program can produce.
+    parsed_types: Tuple[Type[T], ...]
+
     # Descriminator information.
     desc: callable
     desc_map: Dict[bytes | int, callable]
 
-    def route(self, tx: Transaction, instruction_index: int) -> T:
+    # Data bytes 'desc' reads, and the minimum (data bytes, accounts) of each
+    # descriminator's instructions; both are checked before parsing.
+    desc_size: int = 0
+    desc_sizes: Dict[bytes | int, Tuple[int, int]] = {}
+
+    def route(self, tx: Transaction, instruction_index: int, tolerant: bool = False) -> T:
         """
         Route the instruction to the correct parser based on the descriminator.
 
@@ -37,19 +68,146 @@ class Program(abc.ABC, Generic[T]):
             parser via 'desc_map', which is a dictionary of descriminators and
             their corresponding parser functions.
 
+            In tolerant mode, known failures come back as 'ParseError'
+            records rather than exceptions: unknown descriminators, data
+            shorter than 'desc_size'/'desc_sizes', account indexes past the
+            account list, and whatever the parser functions report
+            themselves (e.g. a missing token balance, a malformed inner
+            instruction or variable-length payload). The size and account
+            checks of the instruction itself only run in tolerant mode;
+            strict parsing raises wherever the parser trips over them.
+
         Args:
             tx: The transaction object.
             instruction_index: The index of the instruction in the transaction.
+            tolerant: Return a 'ParseError' for known failures instead of
+                raising ('NotImplementedError' for an unknown discriminator,
+                'IndexError' for an account out of range, 'ValueError' for
+                other failures reported by the parser functions).
 
         Returns:
             The parsed instruction object
         """
         instr: Instruction = tx.message.instructions[instruction_index]
+        if instrumentation.enabled:
+            return self._route_instrumented(tx, instruction_index, instr, tolerant)
+
+        decoded_data = instr.decoded_data
+        if tolerant and len(decoded_data) < self.desc_size:
+            return self.parse_error(instruction_index, None, SHORT_DATA, "Instruction has no descriminator")
+        descriminator = self.desc(decoded_data)
+        parser = self.desc_map.get(descriminator)
+        if not parser:
+            return self._unknown_discriminator(instruction_index, descriminator, tolerant)
+
+        if tolerant:
+            invalid = self._check(tx, instr, descriminator, decoded_data)
+            if invalid is not None:
+                return self.parse_error(instruction_index, descriminator, *invalid)
+
+        result = parser(tx, instruction_index, decoded_data)
+        if not tolerant and result.__class__ is ParseError:
+            raise _STRICT_ERRORS.get(result.error, ValueError)(result.reason)
+        return result
+
+    def _route_instrumented(self, tx: Transaction, instruction_index: int, instr: Instruction, tolerant: bool) -> T:
+        """
+        Same as 'route', recording decode and per-discriminator parse timings.
+        """
+        clock = instrumentation.clock
+
+        if instr._decoded is None:
+            start = clock()
+            decoded_data = instr.decoded_data
+            instrumentation.record(instrumentation.DECODE, self.program_name, clock() - start)
+        else:
+            decoded_data = instr.decoded_data
 
-        decoded_data = base58.decode(instr.data)
+        if tolerant and len(decoded_data) < self.desc_size:
+            return self.parse_error(instruction_index, None, SHORT_DATA, "Instruction has no descriminator")
         descriminator = self.desc(decoded_data)
         parser = self.desc_map.get(descriminator)
         if not parser:
-            raise NotImplementedError(f"Unknown {self.__class__.__name__} descriminator: {descriminator}")
+            instrumentation.record(instrumentation.UNKNOWN_DISCRIMINATOR, self.program_name, None, descriminator)
+            return self._unknown_discriminator(instruction_index, descriminator, tolerant)
+
+        if tolerant:
+            invalid = self._check(tx, instr, descriminator, decoded_data)
+            if invalid is not None:
+                return self.parse_error(instruction_index, descriminator, *invalid)
+
+        start = clock()
+        result = parser(tx, instruction_index, decoded_data)
+        instrumentation.record(instrumentation.ROUTE, self.program_name, clock() - start, descriminator)
+        if not tolerant and result.__class__ is ParseError:
+            raise _STRICT_ERRORS.get(result.error, ValueError)(result.reason)
+        return result
 
-        return parser(tx, instruction_index, decoded_data)
+    def _check(
+        self,
+        tx: Transaction,
+        instr: Instruction,
+        descriminator: Any,
+        decoded_data: bytes,
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Returns the error and reason if the instruction cannot be parsed safely, otherwise None.
+
+        Notes:
+            Runs in tolerant mode, see 'route', and on every inner
+            instruction routed by another parser.
+        """
+        accounts = instr.accounts
+        if accounts:
+            count = len(tx.all_accounts)
+            highest = max(accounts)
+            if highest >= count:
+                return ACCOUNT_OUT_OF_RANGE, f"Account index {highest} is out of range ({count} accounts)"
+
+        sizes = self.desc_sizes.get(descriminator)
+        if sizes is not None:
+            data_size, account_count = sizes
+            if len(decoded_data) < data_size:
+                return SHORT_DATA, f"Expected at least {data_size} bytes of data, got {len(decoded_data)}"
+            if len(accounts) < account_count:
+                return ACCOUNT_OUT_OF_RANGE, f"Expected at least {account_count} accounts, got {len(accounts)}"
+        return None
+
+    def _unknown_discriminator(self, instruction_index: int, descriminator: Any, tolerant: bool) -> ParseError:
+        reason = f"Unknown {self.__class__.__name__} descriminator: {descriminator}"
+        if not tolerant:
+            raise NotImplementedError(reason)
+        return self.parse_error(instruction_index, descriminator, UNKNOWN_DISCRIMINATOR, reason)
+
+    def inner_error(
+        self,
+        instruction_index: int,
+        descriminator: Any,
+        position: int,
+        failure: ParseError,
+    ) -> ParseError:
+        """
+        Builds the error record of an instruction of this program whose inner instruction failed.
+        """
+        reason = f"Inner instruction {position} ({failure.program_name}): {failure.reason}"
+        return self.parse_error(instruction_index, descriminator, failure.error, reason)
+
+    def parse_error(
+        self,
+        instruction_index: Optional[int],
+        descriminator: Any,
+        error: str,
+        reason: str,
+    ) -> ParseError:
+        """
+        Builds the error record of an instruction of this program.
+        """
+        return ParseError(
+            program_id=self.program_id,
+            program_name=self.program_name,
+            instruction_name=ParseError.__name__,
+            instruction_index=instruction_index,
+            discriminator=None if descriminator is None else instrumentation.discriminator_label(descriminator),
+            error=error,
+            reason=reason,
+        )
@@ -1 +1,10 @@
-from . import computeBudget, pumpfun, raydiumAMM, systemProgram, tokenProgram, unknown
+import importlib
+
+# Parser modules are imported on first attribute access (e.g. 'parsers.pumpfun'), not with the package.
+_MODULES = ("computeBudget", "pumpfun", "raydiumAMM", "systemProgram", "tokenProgram", "unknown")
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Union
 
 from soltxs.normalizer.models import Transaction
+from soltxs.parser.layouts import Layout
 from soltxs.parser.models import ParsedInstruction, Program
 from soltxs.parser.parsers.constants import (
     INSTR_SET_COMPUTE_UNIT_LIMIT,
@@ -24,6 +25,10 @@ class SetComputeUnitPrice(ParsedInstruction):
 ParsedInstructions = Union[SetComputeUnitLimit, SetComputeUnitPrice]
 
 
+SetComputeUnitLimitData = Layout([("discriminator", "padding_u8"), ("units", "u32")])
+SetComputeUnitPriceData = Layout([("discriminator", "padding_u8"), ("micro_lamports", "u64")])
+
+
 class _ComputeBudgetParser(Program[ParsedInstructions]):
     """
     Solana's Compute Budget program for adjusting compute unit limits and prices.
@@ -32,12 +37,15 @@ class _ComputeBudgetParser(Program[ParsedInstructions]):
     def __init__(self):
         self.program_id = "ComputeBudget111111111111111111111111111111"
         self.program_name = "ComputeBudget"
+        self.parsed_types = (SetComputeUnitLimit, SetComputeUnitPrice)
 
         self.desc = lambda d: d[0]
+        self.desc_size = 1
         self.desc_map = {
             2: self.process_SetComputeUnitLimit,
             3: self.process_SetComputeUnitPrice,
         }
+        self.desc_sizes = {2: (SetComputeUnitLimitData.size, 0), 3: (SetComputeUnitPriceData.size, 0)}
 
     def process_SetComputeUnitLimit(
         self,
@@ -49,7 +57,7 @@ class _ComputeBudgetParser(Program[ParsedInstructions]):
             program_id=self.program_id,
             program_name=self.program_name,
             instruction_name=INSTR_SET_COMPUTE_UNIT_PRICE,
-            compute_unit_limit=int.from_bytes(decoded_data[1:5], byteorder="little", signed=False),
+            compute_unit_limit=SetComputeUnitLimitData.unpack(decoded_data)[0],
         )
 
     def process_SetComputeUnitPrice(
@@ -62,7 +70,7 @@ class _ComputeBudgetParser(Program[ParsedInstructions]):
             program_id=self.program_id,
             program_name=self.program_name,
             instruction_name="SetComputeUnitPrice",
-            micro_lamports=int.from_bytes(decoded_data[1:9], byteorder="little", signed=False),
+            micro_lamports=SetComputeUnitPriceData.unpack(decoded_data)[0],
         )
 
 
@@ -1,12 +1,22 @@
 import hashlib
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Union
 
-import qbase58 as base58
 import qborsh
 
+from soltxs.normalizer import pubkey
 from soltxs.normalizer.models import Instruction, Transaction
-from soltxs.parser.models import ParsedInstruction, Program
+from soltxs.parser.layouts import Layout
+from soltxs.parser.models import (
+    ACCOUNT_OUT_OF_RANGE,
+    INVALID_DATA,
+    MISSING_DECIMALS,
+    MISSING_EVENT,
+    SHORT_DATA,
+    ParsedInstruction,
+    ParseError,
+    Program,
+)
 from soltxs.parser.parsers.constants import (
     INSTR_BUY,
     INSTR_SELL,
@@ -54,16 +64,20 @@ class Sell(ParsedInstruction):
 ParsedInstructions = Union[Create, Buy, Sell]
 
 
-@qborsh.schema
-class SwapData:
-    mint: qborsh.PubKey
-    sol_amount: qborsh.U64
-    token_amount: qborsh.U64
-    is_buy: qborsh.Bool
-    user: qborsh.PubKey
-    timestamp: qborsh.I64
-    virtual_sol_reserves: qborsh.U64
-    virtual_token_reserves: qborsh.U64
+# Anchor 'TradeEvent', emitted as a self-CPI after the 8-byte event tag and 8-byte event discriminator.
+SwapData = Layout(
+    [
+        ("mint", "pubkey"),
+        ("sol_amount", "u64"),
+        ("token_amount", "u64"),
+        ("is_buy", "bool"),
+        ("user", "pubkey"),
+        ("timestamp", "i64"),
+        ("virtual_sol_reserves", "u64"),
+        ("virtual_token_reserves", "u64"),
+    ]
+)
+SWAP_EVENT_OFFSET = 16
 
 
 @qborsh.schema
@@ -73,6 +87,18 @@ class CreateData:
     uri: qborsh.String
 
 
+def _strings_size(data: bytes, count: int) -> Optional[int]:
+    """
+    Returns the size of 'count' u32 length-prefixed strings at the start of 'data', or None if they overrun it.
+    """
+    end = 0
+    for _ in range(count):
+        if end + 4 > len(data):
+            return None
+        end += 4 + int.from_bytes(data[end : end + 4], "little")
+    return end if end <= len(data) else None
+
+
 class _PumpFunParser(Program[ParsedInstructions]):
     """
     Solana's Compute Budget program for adjusting compute unit limits and prices.
@@ -81,6 +107,7 @@ class _PumpFunParser(Program[ParsedInstructions]):
     def __init__(self):
         self.program_id = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
         self.program_name = "PumpFun"
+        self.parsed_types = (Create, Buy, Sell)
 
         calculate_discriminator = lambda x: hashlib.sha256(x.encode("utf-8")).digest()[:8]
         self.desc = lambda d: d[:8]
@@ -89,23 +116,31 @@ class _PumpFunParser(Program[ParsedInstructions]):
             calculate_discriminator("global:sell"): self.parse_Sell,
             calculate_discriminator("global:create"): self.parse_Create,
         }
+        # Create carries three length-prefixed strings.
+        self.desc_sizes = {calculate_discriminator("global:create"): (8 + 3 * 4, 0)}
 
     def parse_Buy(
         self,
         tx: Transaction,
         instruction_index: int,
         decoded_data: bytes,
-    ) -> Buy:
-        swap_list = self._parse_swap(tx, instruction_index)
-
-        data = swap_list[0]
-        from_token = WSOL_MINT
-        to_token = str(data["mint"])
-        who = str(data["user"])
-        from_amount = int(data["sol_amount"])
-        to_amount = int(data["token_amount"])
+    ) -> Union[Buy, ParseError]:
+        swap_list = self._parse_swap(tx, instruction_index, decoded_data)
+        if swap_list.__class__ is ParseError:
+            return swap_list
+        if not swap_list:
+            return self._missing_event(instruction_index, decoded_data)
+
+        mint, sol_amount, token_amount, _, user, *_ = swap_list[0]
+        from_token = pubkey.constant(WSOL_MINT)
+        to_token = mint
+        who = user
+        from_amount = sol_amount
+        to_amount = token_amount
         from_decimals = SOL_DECIMALS
         to_decimals = self._get_token_decimals(tx, to_token)
+        if to_decimals is None:
+            return self._missing_decimals(instruction_index, decoded_data, to_token)
 
         return Buy(
             program_id=self.program_id,
@@ -125,16 +160,22 @@ class _PumpFunParser(Program[ParsedInstructions]):
         tx: Transaction,
         instruction_index: int,
         decoded_data: bytes,
-    ) -> Sell:
-        swap_list = self._parse_swap(tx, instruction_index)
-
-        data = swap_list[0]
-        from_token = str(data["mint"])
-        to_token = WSOL_MINT
-        who = str(data["user"])
-        from_amount = int(data["token_amount"])
-        to_amount = int(data["sol_amount"])
+    ) -> Union[Sell, ParseError]:
+        swap_list = self._parse_swap(tx, instruction_index, decoded_data)
+        if swap_list.__class__ is ParseError:
+            return swap_list
+        if not swap_list:
+            return self._missing_event(instruction_index, decoded_data)
+
+        mint, sol_amount, token_amount, _, user, *_ = swap_list[0]
+        from_token = mint
+        to_token = pubkey.constant(WSOL_MINT)
+        who = user
+        from_amount = token_amount
+        to_amount = sol_amount
         from_decimals = self._get_token_decimals(tx, from_token)
+        if from_decimals is None:
+            return self._missing_decimals(instruction_index, decoded_data, from_token)
         to_decimals = SOL_DECIMALS
 
         return Sell(
@@ -155,66 +196,76 @@ class _PumpFunParser(Program[ParsedInstructions]):
         tx: Transaction,
         instruction_index: int,
         decoded_data: bytes,
-    ) -> Create:
+    ) -> Union[Create, ParseError]:
         raw = decoded_data[8:]
-        create_data = CreateData.decode(raw)
+        if _strings_size(raw, 3) is None:
+            reason = "Name, symbol and uri overrun the instruction data"
+            return self.parse_error(instruction_index, decoded_data[:8], SHORT_DATA, reason)
+        try:
+            create_data = CreateData.decode(raw)
+        except UnicodeDecodeError as e:
+            return self.parse_error(instruction_index, decoded_data[:8], INVALID_DATA, str(e))
 
         instr: Instruction = tx.message.instructions[instruction_index]
-        who = None
-        if len(instr.accounts) > 7:
-            who = tx.all_accounts[instr.accounts[7]]
+        keys = tx.all_accounts
+        accounts = [keys[a] for a in instr.accounts]
+        count = len(accounts)
 
         return Create(
             program_id=self.program_id,
             program_name=self.program_name,
             instruction_name=INSTR_CREATE,
-            who=who,
-            mint=tx.all_accounts[instr.accounts[0]] if len(instr.accounts) > 0 else None,
-            mint_authority=tx.all_accounts[instr.accounts[1]] if len(instr.accounts) > 1 else None,
-            bonding_curve=tx.all_accounts[instr.accounts[2]] if len(instr.accounts) > 2 else None,
-            associated_bonding_curve=tx.all_accounts[instr.accounts[3]] if len(instr.accounts) > 3 else None,
-            mpl_token_metadata=tx.all_accounts[instr.accounts[5]] if len(instr.accounts) > 5 else None,
-            metadata=tx.all_accounts[instr.accounts[6]] if len(instr.accounts) > 6 else None,
+            who=accounts[7] if count > 7 else None,
+            mint=accounts[0] if count > 0 else None,
+            mint_authority=accounts[1] if count > 1 else None,
+            bonding_curve=accounts[2] if count > 2 else None,
+            associated_bonding_curve=accounts[3] if count > 3 else None,
+            mpl_token_metadata=accounts[5] if count > 5 else None,
+            metadata=accounts[6] if count > 6 else None,
             name=create_data["name"],
             symbol=create_data["symbol"],
             uri=create_data["uri"],
         )
 
-    def _parse_swap(self, tx: Transaction, instruction_index: int) -> List[SwapData]:
+    def _parse_swap(
+        self,
+        tx: Transaction,
+        instruction_index: int,
+        decoded_data: bytes,
+    ) -> Union[List[List[Any]], ParseError]:
+        keys = tx.all_accounts
         top_instr = tx.message.instructions[instruction_index]
-        top_prog_id = tx.all_accounts[top_instr.programIdIndex]
-
-        inner_instrs = []
-        for group in tx.meta.innerInstructions:
-            if group["index"] == instruction_index:
-                inner_instrs.extend(group["instructions"])
-                break
+        top_prog_id = keys[top_instr.programIdIndex]
 
         result_list = []
-        for in_instr in inner_instrs:
-            sub_prog_id = tx.all_accounts[in_instr["programIdIndex"]]
+        for position, in_instr in enumerate(tx.meta.inner_instructions_for(instruction_index)):
+            if in_instr.programIdIndex >= len(keys):
+                reason = f"Inner instruction {position}: program index {in_instr.programIdIndex} is out of range"
+                return self.parse_error(instruction_index, self.desc(decoded_data), ACCOUNT_OUT_OF_RANGE, reason)
+            sub_prog_id = keys[in_instr.programIdIndex]
             if sub_prog_id != top_prog_id:
                 continue
 
-            raw_data = base58.decode(in_instr["data"])
-            if len(raw_data) < 16:
+            raw_data = in_instr.decoded_data
+            if len(raw_data) < SWAP_EVENT_OFFSET + SwapData.size:
                 continue
 
-            swap_raw = raw_data[16:]
-            parsed_obj = SwapData.decode(swap_raw)
-            result_list.append(parsed_obj)
+            result_list.append(SwapData.unpack(raw_data, SWAP_EVENT_OFFSET))
 
         return result_list
 
-    def _get_token_decimals(self, tx: Transaction, mint: str) -> int:
-        if mint == WSOL_MINT:
+    def _get_token_decimals(self, tx: Transaction, mint: str) -> Optional[int]:
+        if pubkey.text(mint) == WSOL_MINT:
             return SOL_DECIMALS
+        return tx.meta.token_index.mint_decimals(mint)
 
-        for tb in tx.meta.preTokenBalances + tx.meta.postTokenBalances:
-            if tb.mint == mint:
-                return tb.uiTokenAmount.decimals
+    def _missing_event(self, instruction_index: int, decoded_data: bytes) -> ParseError:
+        reason = "No TradeEvent found in the inner instructions"
+        return self.parse_error(instruction_index, self.desc(decoded_data), MISSING_EVENT, reason)
 
-        raise ValueError(f"Could not find decimals for mint {mint}")
+    def _missing_decimals(self, instruction_index: int, decoded_data: bytes, mint: str) -> ParseError:
+        reason = f"Could not find decimals for mint {mint}"
+        return self.parse_error(instruction_index, self.desc(decoded_data), MISSING_DECIMALS, reason)
 
 
 PumpFunParser = _PumpFunParser()
\ No newline at end of file
@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from typing import Union
 
 from soltxs.parser.parsers.tokenProgram import TokenProgramParser
+from soltxs.normalizer import pubkey
 from soltxs.normalizer.models import Instruction, Transaction
-from soltxs.parser.models import ParsedInstruction, Program
+from soltxs.parser.layouts import Layout
+from soltxs.parser.models import ACCOUNT_OUT_OF_RANGE, ParsedInstruction, ParseError, Program
 from soltxs.parser.parsers.constants import INSTR_SWAP
 
 from soltxs.constants import WSOL_MINT, SOL_DECIMALS
@@ -24,6 +26,9 @@ class Swap(ParsedInstruction):
 ParsedInstructions = Union[Swap]
 
 
+SwapData = Layout([("discriminator", "padding_u8"), ("amount_in", "u64"), ("minimum_amount_out", "u64")])
+
+
 class _RaydiumAMMParser(Program[ParsedInstructions]):
     """
     Raydium's AMM v4 program for token swaps.
@@ -32,56 +37,57 @@ class _RaydiumAMMParser(Program[ParsedInstructions]):
     def __init__(self):
         self.program_id = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
         self.program_name = "RaydiumAMM"
+        self.parsed_types = (Swap,)
 
         # Descriminator information.
         self.desc = lambda d: d[0]
+        self.desc_size = 1
         self.desc_map = {9: self.process_Swap}
+        # The user's source, destination and owner are the last three accounts.
+        self.desc_sizes = {9: (SwapData.size, 3)}
 
     def process_Swap(
         self,
         tx: Transaction,
         instruction_index: int,
         decoded_data: bytes,
-    ) -> Swap:
+    ) -> Union[Swap, ParseError]:
         instr: Instruction = tx.message.instructions[instruction_index]
         accounts = instr.accounts
 
-        amount_in = int.from_bytes(decoded_data[1:9], byteorder="little", signed=False)
-        minimum_amount_out = int.from_bytes(decoded_data[9:17], byteorder="little", signed=False)
+        amount_in, minimum_amount_out = SwapData.unpack(decoded_data)
 
-        user_source = tx.all_accounts[accounts[len(accounts) - 3]]
-        user_destination = tx.all_accounts[accounts[len(accounts) - 2]]
-        who = tx.all_accounts[accounts[len(accounts) - 1]]
+        keys = tx.all_accounts
+        user_source = keys[accounts[len(accounts) - 3]]
+        user_destination = keys[accounts[len(accounts) - 2]]
+        who = keys[accounts[len(accounts) - 1]]
 
-        from_token = WSOL_MINT
+        wsol = pubkey.constant(WSOL_MINT)
+        from_token = wsol
         from_token_decimals = SOL_DECIMALS
-        to_token = WSOL_MINT
+        to_token = wsol
         to_token_decimals = SOL_DECIMALS
 
-        combined_tb = []
-        combined_tb.extend(tx.meta.preTokenBalances)
-        combined_tb.extend(tx.meta.postTokenBalances)
+        source_tb = tx.token_balance(user_source)
+        if source_tb is not None:
+            from_token = source_tb.mint
+            from_token_decimals = source_tb.uiTokenAmount.decimals
 
-        for tb in combined_tb:
-            token_account = tx.all_accounts[tb.accountIndex]
-            if token_account == user_source:
-                from_token = tb.mint
-                from_token_decimals = tb.uiTokenAmount.decimals
-            elif token_account == user_destination:
-                to_token = tb.mint
-                to_token_decimals = tb.uiTokenAmount.decimals
+        destination_tb = tx.token_balance(user_destination) if user_destination != user_source else None
+        if destination_tb is not None:
+            to_token = destination_tb.mint
+            to_token_decimals = destination_tb.uiTokenAmount.decimals
 
         to_token_amount = 0
-        inner_instrs = []
-        for i_group in tx.meta.innerInstructions:
-            if i_group["index"] == instruction_index:
-                inner_instrs.extend(i_group["instructions"])
-                break
-
-        for in_instr in inner_instrs:
-            program_id = tx.all_accounts[in_instr["programIdIndex"]]
-            if program_id == TokenProgramParser.program_id:
+        for position, in_instr in enumerate(tx.meta.inner_instructions_for(instruction_index)):
+            if in_instr.programIdIndex >= len(keys):
+                reason = f"Inner instruction {position}: program index {in_instr.programIdIndex} is out of range"
+                return self.parse_error(instruction_index, decoded_data[0], ACCOUNT_OUT_OF_RANGE, reason)
+            program_id = keys[in_instr.programIdIndex]
+            if pubkey.text(program_id) == TokenProgramParser.program_id:
                 action = TokenProgramParser.route_instruction(tx, in_instr)
+                if action.__class__ is ParseError:
+                    return self.inner_error(instruction_index, decoded_data[0], position, action)
                 if action.instruction_name in ["Transfer", "TransferChecked"] and action.to == user_destination:
                     to_token_amount = action.amount
 
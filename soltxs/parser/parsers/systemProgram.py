@@ -1,10 +1,9 @@
 from dataclasses import dataclass
 from typing import Optional, Union
 
-import qborsh
-
 from soltxs.normalizer.models import Instruction, Transaction
-from soltxs.parser.models import ParsedInstruction, Program
+from soltxs.parser.layouts import Layout
+from soltxs.parser.models import SHORT_DATA, ParsedInstruction, ParseError, Program
 from soltxs.parser.parsers.constants import (
     INSTR_TRANSFER_SOL,
     INSTR_CREATE_ACCOUNT_WITH_SEED,
@@ -32,43 +31,11 @@ class createAccount(ParsedInstruction):
 ParsedInstructions = Union[Transfer, createAccount]
 
 
-class U64String(qborsh.BorshType):
-    """
-    Reads/writes a string with an 8-byte length prefix (uint64 LE).
-    Followed by 'length' UTF-8 bytes.
-    """
-
-    def serialize(self, buf: qborsh.Buffer, value: str):
-        if not isinstance(value, str):
-            raise TypeError("U64String expects a string input.")
-        encoded = value.encode("utf-8")
-        length = len(encoded)
-        buf.write_u64(length)
-        buf.write_fixed_array(encoded)
-
-    def deserialize(self, buf: qborsh.Buffer) -> str:
-        length = buf.read_u64()
-        raw = buf.read_fixed_array(length)
-        return raw.decode("utf-8", errors="replace")
+# CreateAccountWithSeed carries a u64 length-prefixed seed between two fixed-size parts.
+CreateAccountWithSeedHead = Layout([("discriminator", "padding_u32"), ("base", "pubkey"), ("seed_length", "u64")])
+CreateAccountWithSeedTail = Layout([("lamports", "u64"), ("space", "u64"), ("owner", "pubkey")])
 
-    def sizeof(self):
-        return None
-
-
-@qborsh.schema
-class CreateAccountWithSeedData:
-    discriminator: qborsh.Padding[qborsh.U32]
-    base: qborsh.PubKey
-    seed: U64String
-    lamports: qborsh.U64
-    space: qborsh.U64
-    owner: qborsh.PubKey
-
-
-@qborsh.schema
-class TransferData:
-    discriminator: qborsh.Padding[qborsh.U32]
-    lamports: qborsh.U64
+TransferData = Layout([("discriminator", "padding_u32"), ("lamports", "u64")])
 
 
 class _SystemProgramParser(Program[ParsedInstructions]):
@@ -79,12 +46,17 @@ class _SystemProgramParser(Program[ParsedInstructions]):
     def __init__(self):
         self.program_id = "11111111111111111111111111111111"
         self.program_name = "System Program"
+        self.parsed_types = (Transfer, createAccount)
 
         self.desc = lambda d: int.from_bytes(d[0:4], byteorder="little", signed=False)
         self.desc_map = {
             2: self.process_Transfer,
             3: self.process_CreateAccount,
         }
+        self.desc_sizes = {
+            2: (TransferData.size, 0),
+            3: (CreateAccountWithSeedHead.size + CreateAccountWithSeedTail.size, 0),
+        }
 
     def process_Transfer(
         self,
@@ -93,11 +65,12 @@ class _SystemProgramParser(Program[ParsedInstructions]):
         decoded_data: bytes,
     ) -> Transfer:
         instr: Instruction = tx.message.instructions[instruction_index]
-        data = TransferData.decode(decoded_data)
+        (lamports,) = TransferData.unpack(decoded_data)
         accounts = instr.accounts
 
-        from_account = tx.all_accounts[accounts[0]] if len(accounts) > 0 else None
-        to_account = tx.all_accounts[accounts[1]] if len(accounts) > 1 else None
+        keys = tx.all_accounts
+        from_account = keys[accounts[0]] if len(accounts) > 0 else None
+        to_account = keys[accounts[1]] if len(accounts) > 1 else None
 
         return Transfer(
             program_id=self.program_id,
@@ -105,7 +78,7 @@ class _SystemProgramParser(Program[ParsedInstructions]):
             instruction_name=INSTR_TRANSFER_SOL,
             from_account=from_account,
             to_account=to_account,
-            lamports=int(data["lamports"]),
+            lamports=lamports,
         )
 
     def process_CreateAccount(
@@ -113,14 +86,22 @@ class _SystemProgramParser(Program[ParsedInstructions]):
         tx: Transaction,
         instruction_index: int,
         decoded_data: bytes,
-    ) -> createAccount:
+    ) -> Union[createAccount, ParseError]:
         instr: Instruction = tx.message.instructions[instruction_index]
         accounts = instr.accounts
 
-        parsed = CreateAccountWithSeedData.decode(decoded_data)
+        base, seed_length = CreateAccountWithSeedHead.unpack(decoded_data)
+        seed_start = CreateAccountWithSeedHead.size
+        size = seed_start + seed_length + CreateAccountWithSeedTail.size
+        if len(decoded_data) < size:
+            reason = f"Expected {size} bytes of data for a {seed_length}-byte seed, got {len(decoded_data)}"
+            return self.parse_error(instruction_index, self.desc(decoded_data), SHORT_DATA, reason)
+        seed = decoded_data[seed_start : seed_start + seed_length].decode("utf-8", errors="replace")
+        lamports, space, owner = CreateAccountWithSeedTail.unpack(decoded_data, seed_start + seed_length)
 
-        who = tx.all_accounts[accounts[0]] if len(accounts) > 0 else None
-        new_account = tx.all_accounts[accounts[1]] if len(accounts) > 1 else None
+        keys = tx.all_accounts
+        who = keys[accounts[0]] if len(accounts) > 0 else None
+        new_account = keys[accounts[1]] if len(accounts) > 1 else None
 
         return createAccount(
             program_id=self.program_id,
@@ -128,11 +109,11 @@ class _SystemProgramParser(Program[ParsedInstructions]):
             instruction_name=INSTR_CREATE_ACCOUNT_WITH_SEED,
             who=who,
             new_account=new_account,
-            base=parsed["base"],
-            seed=parsed["seed"],
-            lamports=parsed["lamports"],
-            space=parsed["space"],
-            owner=parsed["owner"],
+            base=base,
+            seed=seed,
+            lamports=lamports,
+            space=space,
+            owner=owner,
         )
 
 
@@ -1,10 +1,9 @@
 from dataclasses import dataclass
 from typing import List, Optional, Union
 
-import qbase58 as base58
-
 from soltxs.normalizer.models import Instruction, Transaction
-from soltxs.parser.models import ParsedInstruction, Program
+from soltxs.parser.layouts import Layout
+from soltxs.parser.models import SHORT_DATA, ParsedInstruction, ParseError, Program
 from soltxs.parser.parsers.constants import (
     INSTR_INITIALIZE_ACCOUNT,
     INSTR_TRANSFER,
@@ -45,30 +44,51 @@ class Unknown(ParsedInstruction):
 ParsedInstructions = Union[InitAccount, Transfer, TransferChecked, Unknown]
 
 
+TransferData = Layout([("discriminator", "padding_u8"), ("amount", "u64")])
+TransferCheckedData = Layout([("discriminator", "padding_u8"), ("amount", "u64"), ("decimals", "u8")])
+
+
 class _TokenProgramParser(Program[ParsedInstructions]):
     def __init__(self):
         self.program_id = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
         self.program_name = "TokenProgram"
+        self.parsed_types = (InitAccount, Transfer, TransferChecked, Unknown)
 
         self.desc = lambda d: d[0]
+        self.desc_size = 1
         self.desc_map = {
             1: self.process_InitAccount,
             3: self.process_Transfer,
             9: self.process_Unknown,
             12: self.process_TransferChecked,
         }
-
-    def route_instruction(self, tx: Transaction, instr_dict: dict) -> ParsedInstructions:
-        raw_data = base58.decode(instr_dict["data"])
+        self.desc_sizes = {1: (1, 4), 3: (TransferData.size, 2), 12: (TransferCheckedData.size, 3)}
+
+    def route_instruction(self, tx: Transaction, instr: Instruction) -> Union[ParsedInstructions, ParseError]:
+        """
+        Parses an inner instruction of the Token program, invoked by another program.
+
+        Notes:
+            Failures come back as 'ParseError' records without an instruction
+            index, for the calling parser to report as its own (see
+            'Program.inner_error'), so a malformed inner instruction never
+            raises.
+        """
+        raw_data = instr.decoded_data
+        if len(raw_data) < self.desc_size:
+            return self.parse_error(None, None, SHORT_DATA, "Instruction has no descriminator")
         descriminator = self.desc(raw_data)
         parser_func = self.desc_map.get(descriminator)
         if not parser_func:
-            raise NotImplementedError(f"Unknown {self.__class__.__name__} descriminator: {descriminator}")
+            return self._unknown_discriminator(None, descriminator, True)
+        invalid = self._check(tx, instr, descriminator, raw_data)
+        if invalid is not None:
+            return self.parse_error(None, descriminator, *invalid)
         return parser_func(
             tx=tx,
             instruction_index=None,
             decoded_data=raw_data,
-            custom_accounts=instr_dict["accounts"],
+            custom_accounts=instr.accounts,
         )
 
     def process_InitAccount(
@@ -84,10 +104,11 @@ class _TokenProgramParser(Program[ParsedInstructions]):
             instr: Instruction = tx.message.instructions[instruction_index]
             accounts = instr.accounts
 
-        account = tx.all_accounts[accounts[0]]
-        mint = tx.all_accounts[accounts[1]]
-        owner = tx.all_accounts[accounts[2]]
-        rent_sysvar = tx.all_accounts[accounts[3]]
+        keys = tx.all_accounts
+        account = keys[accounts[0]]
+        mint = keys[accounts[1]]
+        owner = keys[accounts[2]]
+        rent_sysvar = keys[accounts[3]]
 
         return InitAccount(
             program_id=self.program_id,
@@ -113,13 +134,15 @@ class _TokenProgramParser(Program[ParsedInstructions]):
             instr = tx.message.instructions[instruction_index]
             accounts = instr.accounts
 
+        keys = tx.all_accounts
+        (amount,) = TransferData.unpack(decoded_data)
         return Transfer(
             program_id=self.program_id,
             program_name=self.program_name,
             instruction_name=INSTR_TRANSFER_CHECKED,
-            from_account=tx.all_accounts[accounts[0]],
-            to=tx.all_accounts[accounts[1]],
-            amount=int.from_bytes(decoded_data[1:9], byteorder="little", signed=False),
+            from_account=keys[accounts[0]],
+            to=keys[accounts[1]],
+            amount=amount,
         )
 
     def process_TransferChecked(
@@ -135,15 +158,17 @@ class _TokenProgramParser(Program[ParsedInstructions]):
             instr: Instruction = tx.message.instructions[instruction_index]
             accounts = instr.accounts
 
+        keys = tx.all_accounts
+        amount, decimals = TransferCheckedData.unpack(decoded_data)
         return TransferChecked(
             program_id=self.program_id,
             program_name=self.program_name,
             instruction_name="TransferChecked",
-            from_account=tx.all_accounts[accounts[0]],
-            mint=tx.all_accounts[accounts[1]],
-            to=tx.all_accounts[accounts[2]],
-            amount=int.from_bytes(decoded_data[1:9], byteorder="little", signed=False),
-            decimals=int.from_bytes(decoded_data[9:17], byteorder="little", signed=False),
+            from_account=keys[accounts[0]],
+            mint=keys[accounts[1]],
+            to=keys[accounts[2]],
+            amount=amount,
+            decimals=decimals,
         )
 
     def process_Unknown(
@@ -18,6 +18,7 @@ class _UnknownParser(Program):
     def __init__(self, program_id: str):
         self.program_id = program_id
         self.program_name = "Unknown"
+        self.parsed_types = (Unknown,)
 
         self.desc = lambda d: True
         self.desc_map = {True: self.process_Unknown}
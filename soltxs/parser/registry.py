@@ -0,0 +1,161 @@
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Type, Union
+
+from soltxs import plugins
+from soltxs.parser.models import ParsedInstruction, Program
+
+# Built-in programs: program ID -> "module:attribute" of the parser singleton.
+BUILTIN = {
+    "11111111111111111111111111111111": "soltxs.parser.parsers.systemProgram:SystemProgramParser",
+    "ComputeBudget111111111111111111111111111111": "soltxs.parser.parsers.computeBudget:ComputeBudgetParser",
+    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA": "soltxs.parser.parsers.tokenProgram:TokenProgramParser",
+    "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8": "soltxs.parser.parsers.raydiumAMM:RaydiumAMMParser",
+    "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P": "soltxs.parser.parsers.pumpfun:PumpFunParser",
+}
+
+# Targets whose parsers only produce types defined in their own module, none of them subclassing
+# another target's types; 'producers' can match these by module without importing them.
+SELF_CONTAINED = frozenset(BUILTIN.values())
+
+
+class ProgramRegistry(Mapping):
+    """
+    Program ID -> parser mapping that imports each parser on first use.
+
+    Notes:
+        Programs are registered as "module:attribute" targets and only
+        imported the first time their program ID is looked up, so importing
+        soltxs does not pay for parsers (schemas, discriminator tables) a
+        process never meets. Third-party packages add programs through the
+        'entry_point_group' entry points, named by program ID and pointing
+        at the parser:
+
+            [project.entry-points."soltxs.parsers"]
+            MyProgram1111111111111111111111111111111111 = "my_package.parser:MyProgramParser"
+
+        Entry points are read once, on the first lookup of a program ID
+        that is not registered (or the first iteration); built-in and
+        explicitly registered programs take precedence over them.
+
+    Args:
+        targets: Initial program ID -> "module:attribute" targets.
+        entry_point_group: Entry point group to read, or None for none.
+    """
+
+    def __init__(self, targets: Optional[Dict[str, str]] = None, entry_point_group: Optional[str] = None):
+        self.entry_point_group = entry_point_group
+        # Bumped whenever programs are added or removed, so derived data (parse plans) can be cached.
+        self.version = 0
+        # Program ID -> parser or target, in registration order; loaded parsers are cached in '_handlers'.
+        self._entries: Dict[str, Union[Program, str]] = dict(targets or {})
+        self._handlers: Dict[str, Program] = {}
+        self._discovered = entry_point_group is None
+
+    def register(self, program_id: str, handler: Union[Program, str]) -> Union[Program, str]:
+        """
+        Adds or replaces the parser of a program.
+
+        Args:
+            program_id: The program ID.
+            handler: The parser singleton, or a "module:attribute" target to
+                import on first use.
+
+        Returns:
+            The registered handler or target.
+        """
+        self._entries[program_id] = handler
+        self._handlers.pop(program_id, None)
+        if not isinstance(handler, str):
+            self._handlers[program_id] = handler
+        self.version += 1
+        return handler
+
+    def unregister(self, program_id: str):
+        """
+        Removes a program from the registry.
+        """
+        del self._entries[program_id]
+        self._handlers.pop(program_id, None)
+        self.version += 1
+
+    def get(self, program_id: str, default: Optional[Program] = None) -> Optional[Program]:
+        handler = self._handlers.get(program_id)
+        if handler is not None:
+            return handler
+
+        if not self._discovered:
+            self._discover()
+        entry = self._entries.get(program_id)
+        if entry is None:
+            return default
+        handler = self._handlers[program_id] = plugins.load(entry) if isinstance(entry, str) else entry
+        return handler
+
+    def __getitem__(self, program_id: str) -> Program:
+        handler = self.get(program_id)
+        if handler is None:
+            raise KeyError(program_id)
+        return handler
+
+    def __contains__(self, program_id: object) -> bool:
+        self._discover()
+        return program_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._entries)
+
+    def is_loaded(self, program_id: str) -> bool:
+        """
+        Whether the parser of a program has been imported.
+        """
+        return program_id in self._handlers
+
+    def producers(self, wanted: Type[ParsedInstruction]) -> List[str]:
+        """
+        Returns the program IDs whose parsers produce 'wanted' (or a subclass of it).
+
+        Notes:
+            Built-in parsers not loaded yet are matched by the module defining
+            'wanted', without importing them, as each produces only types of
+            its own module. Any other pending target (a plugin) could produce
+            a subclass of 'wanted' defined anywhere, so it is imported to check
+            its types, as are the built-in parsers when 'wanted' is defined
+            outside all of their modules (e.g. a shared base class).
+        """
+        self._discover()
+        pending = {}
+        for program_id, entry in list(self._entries.items()):
+            if program_id in self._handlers:
+                continue
+            if entry in SELF_CONTAINED:
+                pending[program_id] = plugins.module_of(entry)
+            else:
+                self.get(program_id)
+        if pending and wanted.__module__ not in pending.values():
+            for program_id in pending:
+                self.get(program_id)
+            pending = {}
+
+        found = []
+        for program_id in self._entries:
+            handler = self._handlers.get(program_id)
+            if handler is None:
+                if pending[program_id] == wanted.__module__:
+                    found.append(program_id)
+            elif any(issubclass(t, wanted) for t in handler.parsed_types):
+                found.append(program_id)
+        return found
+
+    def _discover(self):
+        if self._discovered:
+            return
+        self._discovered = True
+        for program_id, target in plugins.entry_points(self.entry_point_group):
+            if program_id not in self._entries:
+                self._entries[program_id] = target
+                self.version += 1
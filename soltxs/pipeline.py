@@ -0,0 +1,60 @@
+from typing import Any, FrozenSet, Optional, Tuple
+
+from soltxs import normalizer, parser, resolver
+from soltxs.resolver.models import ProcessError, Resolve
+
+# Pipeline stages, as reported by 'ProcessError.stage'.
+NORMALIZE = "normalize"
+PARSE = "parse"
+RESOLVE = "resolve"
+
+# Default parse plan, and the registry state it was built from, see 'plan'.
+_plan: Optional[FrozenSet[str]] = None
+_plan_key: Optional[Tuple[int, FrozenSet[type]]] = None
+
+
+def plan() -> Optional[FrozenSet[str]]:
+    """
+    Returns the default parse plan: the programs whose instructions the registered resolvers read.
+
+    Notes:
+        Built once and reused until a program or a resolver is registered
+        or removed, so the entry points do not rebuild it per transaction.
+    """
+    global _plan, _plan_key
+    required = resolver.required_types()
+    key = _plan_key
+    if key is None or key[1] is not required or key[0] != parser.id_to_handler.version:
+        programs = parser.plan(required)
+        _plan, _plan_key = programs, (parser.id_to_handler.version, required)
+        return programs
+    return _plan
+
+
+def run(payload: Any, programs: Optional[FrozenSet[str]], tolerant: bool = False) -> Resolve:
+    """
+    Runs normalize -> parse -> resolve over one raw payload.
+
+    Notes:
+        In tolerant mode nothing is raised: instructions that fail to parse
+        in a known way become 'ParseError' records, returned by the parsers
+        (so the rest of the transaction still resolves), and a payload that
+        fails outright, or hits an unexpected error, resolves to a
+        'ProcessError' naming the failed stage. This is the only exception
+        handler; tolerant parsing costs a few bounds checks per parsed
+        instruction over strict parsing.
+    """
+    if not tolerant:
+        return resolver.resolve(parser.parse(normalizer.normalize(payload), programs=programs))
+
+    stage = NORMALIZE
+    signature = None
+    try:
+        tx = normalizer.normalize(payload)
+        signature = tx.signatures[0] if tx.signatures else None
+        stage = PARSE
+        parsed = parser.parse(tx, programs=programs, tolerant=True)
+        stage = RESOLVE
+        return resolver.resolve(parsed)
+    except Exception as exc:
+        return ProcessError(stage=stage, signature=signature, error=type(exc).__name__, reason=str(exc))
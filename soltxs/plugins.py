@@ -0,0 +1,63 @@
+import importlib
+from typing import Any, List, Tuple
+
+# Entry point groups read by the default registries.
+PARSERS_GROUP = "soltxs.parsers"
+RESOLVERS_GROUP = "soltxs.resolvers"
+
+# Whether the registries look up third-party programs and resolvers in entry points, see 'disable'.
+enabled = True
+
+
+def load(target: str) -> Any:
+    """
+    Imports a "module:attribute" target and returns the attribute.
+    """
+    module, _, attr = target.partition(":")
+    if not attr:
+        raise ValueError(f"Target must be of the form 'module:attribute', got '{target}'.")
+    return getattr(importlib.import_module(module), attr)
+
+
+def module_of(target: str) -> str:
+    """
+    Returns the module part of a "module:attribute" target, without importing it.
+    """
+    return target.partition(":")[0]
+
+
+def entry_points(group: str) -> List[Tuple[str, str]]:
+    """
+    Returns the (name, "module:attribute") pairs that installed packages declare in an entry point group.
+
+    Notes:
+        Nothing is imported besides 'importlib.metadata' itself, which is
+        only loaded here because it is slow to import. Returns nothing when
+        entry points are disabled.
+    """
+    if not enabled:
+        return []
+
+    from importlib.metadata import entry_points as _entry_points
+
+    return [(ep.name, ep.value) for ep in _entry_points(group=group)]
+
+
+def enable():
+    """
+    Makes the registries load third-party programs and resolvers declared in entry points.
+    """
+    global enabled
+    enabled = True
+
+
+def disable():
+    """
+    Restricts the registries to the built-in and explicitly registered programs and resolvers.
+
+    Notes:
+        Entry points are read on first use of each registry; call this
+        before that to also skip importing 'importlib.metadata'.
+    """
+    global enabled
+    enabled = False
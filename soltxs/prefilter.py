@@ -0,0 +1,238 @@
+import math
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import qbase58 as base58
+
+from soltxs import normalizer, pipeline
+from soltxs.constants import VOTE_PROGRAM_ID
+from soltxs.normalizer.pubkey import Pubkey
+
+# Rejection reasons, in the order they are checked.
+FAILED = "failed"
+VOTE = "vote"
+PROGRAM = "program"
+WALLET = "wallet"
+
+# Watchlists at least this large default to a Bloom filter.
+BLOOM_THRESHOLD = 100_000
+
+Key = Union[str, bytes]
+
+# Differs between processes whose string hashes differ, see 'BloomFilter'.
+_SEED = hash("soltxs.prefilter")
+
+
+def _raw(key: Key) -> bytes:
+    return key if isinstance(key, bytes) else base58.decode(key)
+
+
+def _text(key: Key) -> str:
+    return str(Pubkey.from_bytes(key)) if isinstance(key, bytes) else key
+
+
+def _hashes(key: Key) -> Tuple[int, int]:
+    """
+    Returns the two base hashes of a key: its first 16 bytes if raw, its 'hash()' halves if text.
+    """
+    if isinstance(key, bytes):
+        return int.from_bytes(key[:8], "little"), int.from_bytes(key[8:16], "little") | 1
+    h = hash(key)
+    return h & 0xFFFFFFFF, (h >> 32 & 0xFFFFFFFF) | 1
+
+
+class AddressSet:
+    """
+    Exact set of addresses, matching both base58 text and raw 32-byte keys.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, addresses: Iterable[str]):
+        keys = set()
+        for address in addresses:
+            keys.add(address)
+            keys.add(_raw(address))
+        self._keys = frozenset(keys)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._keys
+
+    def intersects(self, keys: Iterable[Key]) -> bool:
+        return not self._keys.isdisjoint(keys)
+
+
+class BloomFilter:
+    """
+    Bloom filter over 32-byte addresses, matching both base58 text and raw keys.
+
+    Notes:
+        Every address is indexed in two bit arrays, one per key form, so a
+        check never converts between base58 and bytes. Each takes about 1.2
+        bytes per address at a 1% false-positive rate, against well over
+        100 bytes per address for a set of strings. There are no false
+        negatives. Public keys are uniformly random, so the first 16 bytes
+        of a raw key serve directly as the two base hashes (double hashing);
+        text keys use the halves of their (cached) string hash instead.
+
+        String hashes are salted per process, so a filter unpickled in a
+        process with another hash seed drops its text bit array and
+        base58-decodes text keys to check them against the raw one.
+    """
+
+    __slots__ = ("size", "hashes", "count", "_bits", "_text_bits", "_seed")
+
+    def __init__(self, addresses: Iterable[str], capacity: Optional[int] = None, error_rate: float = 0.01):
+        addresses = list(addresses)
+        capacity = max(capacity or len(addresses), 1)
+
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._text_bits: Optional[bytearray] = bytearray(len(self._bits))
+        self._seed = _SEED
+
+        for address in addresses:
+            self.add(address)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._seed != _SEED:
+            self._text_bits = None
+
+    def _set(self, bits: bytearray, key: Key):
+        h1, h2 = _hashes(key)
+        size = self.size
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def add(self, address: Key):
+        self._set(self._bits, _raw(address))
+        if self._text_bits is not None:
+            self._set(self._text_bits, _text(address))
+        self.count += 1
+
+    def __contains__(self, key: Key) -> bool:
+        if isinstance(key, bytes):
+            bits = self._bits
+        elif self._text_bits is not None:
+            bits = self._text_bits
+        else:
+            bits, key = self._bits, base58.decode(key)
+
+        h1, h2 = _hashes(key)
+        size = self.size
+        # Same positions as '_set', stepped incrementally.
+        pos, step = h1 % size, h2 % size
+        for _ in range(self.hashes):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+            pos += step
+            if pos >= size:
+                pos -= size
+        return True
+
+    def intersects(self, keys: Iterable[Key]) -> bool:
+        return any(k in self for k in keys)
+
+
+class Prefilter:
+    """
+    Rejects uninteresting transactions from the raw payload, before normalization.
+
+    Notes:
+        Only the account keys (static and loaded) and the error status are
+        read from the payload; no transaction object is built. Raw JSON
+        bytes and serialized updates are decoded first (see
+        'normalizer.load'), so decode them once up front when the payloads
+        that pass are processed afterwards. Checks run
+        cheapest first: failed transactions, vote transactions, then
+        transactions touching none of 'programs', then transactions touching
+        none of the watched 'wallets'. Program matching looks at every
+        account key, so it may keep a few transactions that only pass the
+        program as an account, but never drops one that invokes it.
+
+    Args:
+        programs: Program IDs a transaction must touch. Defaults to the
+            programs the registered resolvers need; an empty collection
+            disables the check.
+        wallets: Watched addresses a transaction must touch, if any.
+        skip_failed: Reject transactions with an error status.
+        skip_votes: Reject vote transactions.
+        bloom: Store 'wallets' in a Bloom filter instead of a set. Defaults
+            to True for watchlists of 'BLOOM_THRESHOLD' addresses or more.
+    """
+
+    def __init__(
+        self,
+        programs: Optional[Iterable[str]] = None,
+        wallets: Optional[Iterable[str]] = None,
+        skip_failed: bool = True,
+        skip_votes: bool = True,
+        bloom: Optional[bool] = None,
+    ):
+        if programs is None:
+            programs = pipeline.plan()
+
+        self.programs = AddressSet(programs) if programs else None
+        self.skip_failed = skip_failed
+        self.votes = AddressSet([VOTE_PROGRAM_ID]) if skip_votes else None
+
+        self.wallets: Optional[Union[AddressSet, BloomFilter]] = None
+        if wallets is not None:
+            wallets = list(wallets)
+            if bloom is None:
+                bloom = len(wallets) >= BLOOM_THRESHOLD
+            self.wallets = BloomFilter(wallets) if bloom else AddressSet(wallets)
+
+        self.total = 0
+        self.rejected: Dict[str, int] = {FAILED: 0, VOTE: 0, PROGRAM: 0, WALLET: 0}
+
+    def __call__(self, payload: Any) -> bool:
+        return self.check(payload)
+
+    def check(self, payload: Any) -> bool:
+        """
+        Whether a raw payload (decoded or JSON bytes/str, or a Yellowstone update) should be processed.
+        """
+        self.total += 1
+        reason = self.reject_reason(payload)
+        if reason is None:
+            return True
+        self.rejected[reason] += 1
+        return False
+
+    def reject_reason(self, payload: Any) -> Optional[str]:
+        """
+        Returns why a raw payload would be rejected, or None if it passes. Does not update the stats.
+        """
+        payload = normalizer.load(payload)
+        source = normalizer.detect(payload)
+        if self.skip_failed and source.failed(payload):
+            return FAILED
+
+        keys = source.raw_keys(payload)
+        if self.votes is not None and self.votes.intersects(keys):
+            return VOTE
+        if self.programs is not None and not self.programs.intersects(keys):
+            return PROGRAM
+        if self.wallets is not None and not self.wallets.intersects(keys):
+            return WALLET
+        return None
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the number of checked payloads and, per reason, the share that was rejected.
+        """
+        total = self.total
+        ratios = {reason: count / total if total else 0.0 for reason, count in self.rejected.items()}
+        passed = total - sum(self.rejected.values())
+        return {"total": total, "passed": passed / total if total else 0.0, **ratios}
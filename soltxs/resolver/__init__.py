@@ -1,16 +1,37 @@
-from typing import List
+from typing import FrozenSet, List, Optional, Type, Union
 
-from soltxs import parser
+from soltxs import instrumentation, parser, plugins
 from soltxs.resolver import models, resolvers
+from soltxs.resolver.registry import ResolverRegistry
+
+# Default registry. Resolvers are tried in order; the first one to return a result wins.
+# Built-in resolvers (and the parsers they read) are imported on first use.
+registry = ResolverRegistry(fallback=resolvers.unknown.UnknownResolver, entry_point_group=plugins.RESOLVERS_GROUP)
+registry.register("soltxs.resolver.resolvers.pumpfun:PumpFunResolver")
+registry.register("soltxs.resolver.resolvers.raydium:RaydiumResolver")
+
+
+def register(resolver: Union[models.Resolver, str], index: Optional[int] = None) -> Union[models.Resolver, str]:
+    """
+    Adds a resolver to the default registry. See 'ResolverRegistry.register'.
+    """
+    return registry.register(resolver, index=index)
+
+
+def required_types() -> FrozenSet[Type[parser.models.ParsedInstruction]]:
+    """
+    Returns every parsed instruction type that some registered resolver reads.
+    """
+    return registry.required_types
 
 
 def resolve(parsed: List[parser.models.ParsedInstruction]) -> models.Resolve:
     """
     Translate a list of parsed instructions into a final interpretation.
     """
-    for transformer in (resolvers.pumpfun.PumpFunResolver, resolvers.raydium.RaydiumResolver):
-        result = transformer.resolve(parsed)
-        if result is not None:
-            return result
-
-    return resolvers.unknown.UnknownResolver.resolve(parsed)
+    if instrumentation.enabled:
+        start = instrumentation.clock()
+        result = registry.resolve(parsed)
+        instrumentation.record(instrumentation.RESOLVE, result.__class__.__name__, instrumentation.clock() - start)
+        return result
+    return registry.resolve(parsed)
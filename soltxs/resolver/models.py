@@ -1,6 +1,6 @@
 import abc
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple, Type
 
 from soltxs import parser
 
@@ -10,7 +10,24 @@ class Resolve:
     pass
 
 
+@dataclass(slots=True)
+class ProcessError(Resolve):
+    """
+    A payload that could not be processed, returned in place of its resolution in tolerant mode.
+    """
+
+    # Pipeline stage that failed: 'normalize', 'parse' or 'resolve'.
+    stage: str
+    signature: Optional[str]
+    error: str
+    reason: str
+
+
 class Resolver(abc.ABC):
+    # Parsed instruction types this resolver reads. Instructions of other
+    # types may be skipped entirely during parsing.
+    requires: Tuple[Type[parser.models.ParsedInstruction], ...] = ()
+
     @abc.abstractmethod
     def resolve(self, instructions: List[parser.models.ParsedInstruction]) -> Optional[Resolve]:
         raise NotImplementedError
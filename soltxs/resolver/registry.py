@@ -0,0 +1,171 @@
+from typing import Dict, FrozenSet, List, Optional, Tuple, Type, Union
+
+from soltxs import instrumentation, parser, plugins
+from soltxs.resolver.models import Resolve, Resolver
+
+
+class ResolverRegistry:
+    """
+    Ordered set of resolvers, dispatched by parsed instruction type.
+
+    Notes:
+        'resolve' classifies the parsed instructions once into a
+        type -> positions index. Only resolvers with at least one required
+        type present are invoked, and each receives just the instructions
+        of its required types, in their original order. Resolve cost
+        therefore depends on the resolvers that apply to a transaction, not
+        on how many are registered. An instruction matches every required
+        type in its MRO, so requiring a base class also receives the
+        instructions of its subclasses; the matches of each concrete type
+        are looked up once and cached.
+
+        Resolvers can be registered as "module:attribute" targets, which are
+        imported on first use of the registry. Third-party packages add
+        resolvers through the 'entry_point_group' entry points, appended
+        after the registered ones in name order:
+
+            [project.entry-points."soltxs.resolvers"]
+            my_resolver = "my_package.resolver:MyResolver"
+
+    Args:
+        fallback: Resolver used when no registered resolver produces a result.
+        entry_point_group: Entry point group to read, or None for none.
+    """
+
+    def __init__(self, fallback: Resolver, entry_point_group: Optional[str] = None):
+        self.fallback = fallback
+        self.entry_point_group = entry_point_group
+        self._resolvers: List[Union[Resolver, str]] = []
+        self._required: Optional[FrozenSet[Type[parser.models.ParsedInstruction]]] = None
+        # Concrete parsed instruction type -> the required types in its MRO.
+        self._kinds: Dict[type, Tuple[type, ...]] = {}
+        self._discovered = entry_point_group is None
+        self._pending = not self._discovered
+
+    def __iter__(self):
+        self._load()
+        return iter(self._resolvers)
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._resolvers)
+
+    def register(self, resolver: Union[Resolver, str], index: Optional[int] = None) -> Union[Resolver, str]:
+        """
+        Adds a resolver to the registry.
+
+        Args:
+            resolver: The resolver, or a "module:attribute" target to import on
+                first use. It must declare the types it reads in 'requires'.
+            index: Position in the resolution order. Appends by default; earlier
+                resolvers take precedence.
+
+        Returns:
+            The registered resolver or target.
+        """
+        if isinstance(resolver, str):
+            self._pending = True
+        else:
+            self._check(resolver)
+        if resolver in self._resolvers:
+            self._resolvers.remove(resolver)
+
+        self._resolvers.insert(len(self._resolvers) if index is None else index, resolver)
+        self._reset()
+        return resolver
+
+    def unregister(self, resolver: Union[Resolver, str]):
+        """
+        Removes a resolver (or a target not imported yet) from the registry.
+        """
+        if resolver not in self._resolvers:
+            self._load()
+        self._resolvers.remove(resolver)
+        self._reset()
+
+    @staticmethod
+    def _check(resolver: Resolver):
+        if not resolver.requires:
+            raise ValueError(f"{resolver.__class__.__name__} must declare the instruction types it requires.")
+
+    def _load(self):
+        """
+        Reads the entry points, once, and imports the resolvers registered as targets.
+        """
+        if not self._pending:
+            return
+        self._pending = False
+
+        if not self._discovered:
+            self._discovered = True
+            for _, target in sorted(plugins.entry_points(self.entry_point_group)):
+                if target not in self._resolvers:
+                    self._resolvers.append(target)
+
+        loaded: List[Resolver] = []
+        for entry in self._resolvers:
+            resolver = plugins.load(entry) if isinstance(entry, str) else entry
+            self._check(resolver)
+            if resolver not in loaded:
+                loaded.append(resolver)
+        self._resolvers = loaded
+        self._reset()
+
+    def _reset(self):
+        self._required = None
+        self._kinds = {}
+
+    def _kinds_of(self, cls: type) -> Tuple[type, ...]:
+        """
+        Returns the required types 'cls' matches, walking its MRO on first sight.
+        """
+        required = self.required_types
+        kinds = self._kinds[cls] = tuple(t for t in cls.__mro__ if t in required)
+        return kinds
+
+    @property
+    def required_types(self) -> FrozenSet[Type[parser.models.ParsedInstruction]]:
+        """
+        Returns every parsed instruction type that some registered resolver reads.
+        """
+        self._load()
+        if self._required is None:
+            self._required = frozenset(t for r in self._resolvers for t in r.requires)
+        return self._required
+
+    def resolve(self, parsed: List[parser.models.ParsedInstruction]) -> Resolve:
+        """
+        Runs the first applicable resolver that produces a result.
+        """
+        if self._pending:
+            self._load()
+
+        by_type: Dict[type, List[int]] = {}
+        kinds = self._kinds
+        for position, instr in enumerate(parsed):
+            cls = type(instr)
+            matched = kinds.get(cls)
+            if matched is None:
+                matched = self._kinds_of(cls)
+            for kind in matched:
+                by_type.setdefault(kind, []).append(position)
+
+        for resolver in self._resolvers:
+            matches = [by_type[t] for t in resolver.requires if t in by_type]
+            if not matches:
+                continue
+
+            # An instruction matching several required types is only passed once.
+            positions = matches[0] if len(matches) == 1 else sorted({p for m in matches for p in m})
+            candidates = [parsed[p] for p in positions]
+            if instrumentation.enabled:
+                start = instrumentation.clock()
+                result = resolver.resolve(candidates)
+                name = resolver.__class__.__name__.lstrip("_")
+                instrumentation.record(instrumentation.RESOLVER, name, instrumentation.clock() - start)
+            else:
+                result = resolver.resolve(candidates)
+            if result is not None:
+                return result
+
+        return self.fallback.resolve(parsed)
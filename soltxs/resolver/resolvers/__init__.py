@@ -1 +1,10 @@
-from . import pumpfun, raydium, unknown
+import importlib
+
+# Resolver modules are imported on first attribute access (e.g. 'resolvers.pumpfun'), not with the package.
+_MODULES = ("pumpfun", "raydium", "unknown")
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
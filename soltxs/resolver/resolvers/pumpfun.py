@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from soltxs import parser
+from soltxs.normalizer import pubkey
 from soltxs.resolver.models import Resolve, Resolver
 from soltxs.constants import TREAT_AS_SOL, BUY, SELL
 
@@ -17,18 +18,20 @@ class PumpFun(Resolve):
 
 
 class _PumpFunResolver(Resolver):
+    requires = (parser.parsers.pumpfun.Buy, parser.parsers.pumpfun.Sell)
+
     def resolve(self, instructions: List[parser.models.ParsedInstruction]) -> Optional[Resolve]:
         # We look for exactly one PumpFun (Buy or Sell) instruction.
-        instrs = [i for i in instructions if isinstance(i, (parser.parsers.pumpfun.Buy, parser.parsers.pumpfun.Sell))]
+        instrs = [i for i in instructions if isinstance(i, self.requires)]
         if len(instrs) == 1:
             instr = instrs[0]
 
             # TREAT_AS_SOL logic:
             # if to_token is in TREAT_AS_SOL => SELL
             # else if from_token is in TREAT_AS_SOL => BUY
-            if instr.to_token in TREAT_AS_SOL:
+            if pubkey.text(instr.to_token) in TREAT_AS_SOL:
                 direction = SELL
-            elif instr.from_token in TREAT_AS_SOL:
+            elif pubkey.text(instr.from_token) in TREAT_AS_SOL:
                 direction = BUY
             else:
                 # If neither is TREAT_AS_SOL, fallback
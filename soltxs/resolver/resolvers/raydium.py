@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from soltxs import parser
+from soltxs.normalizer import pubkey
 from soltxs.resolver.models import Resolve, Resolver
 from soltxs.constants import TREAT_AS_SOL, BUY, SELL
 
@@ -20,17 +21,19 @@ class Raydium(Resolve):
 
 
 class _RaydiumResolver(Resolver):
+    requires = (parser.parsers.raydiumAMM.Swap,)
+
     def resolve(self, instructions: List[parser.models.ParsedInstruction]) -> Optional[Resolve]:
         # We'll look for exactly one Raydium swap instruction.
-        instrs = [i for i in instructions if isinstance(i, parser.parsers.raydiumAMM.Swap)]
+        instrs = [i for i in instructions if isinstance(i, self.requires)]
         if len(instrs) == 1:
             instr = instrs[0]
 
             # If to_token is in TREAT_AS_SOL => user ended with more SOL => SELL
             # Else if from_token is in TREAT_AS_SOL => user spent SOL => BUY
-            if instr.to_token in TREAT_AS_SOL:
+            if pubkey.text(instr.to_token) in TREAT_AS_SOL:
                 direction = SELL
-            elif instr.from_token in TREAT_AS_SOL:
+            elif pubkey.text(instr.from_token) in TREAT_AS_SOL:
                 direction = BUY
             else:
                 # If neither is in TREAT_AS_SOL, fallback or default
@@ -0,0 +1,389 @@
+import json
+import os
+import struct
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from soltxs import batch, pipeline
+from soltxs.constants import BUY, SELL
+from soltxs.parser.layouts import Layout
+from soltxs.resolver.models import Resolve
+from soltxs.resolver.resolvers.pumpfun import PumpFun
+from soltxs.resolver.resolvers.raydium import Raydium
+from soltxs.resolver.resolvers.unknown import Unknown
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Record kinds. 'OTHER' rows (errors, custom resolutions) travel back pickled, see 'RecordBatch'.
+UNKNOWN = 0
+PUMPFUN = 1
+RAYDIUM = 2
+OTHER = 255
+
+_KINDS = {Unknown: UNKNOWN, PumpFun: PUMPFUN, Raydium: RAYDIUM}
+_TYPES = {BUY: 0, SELL: 1}
+_TYPE_NAMES = {code: name for name, code in _TYPES.items()}
+
+# One fixed-size record per transaction, 128 bytes.
+RECORD = Layout(
+    [
+        ("kind", "u8"),
+        ("type", "u8"),
+        ("reserved", "padding_u16"),
+        ("reserved", "padding_u32"),
+        ("who", "pubkey"),
+        ("from_token", "pubkey"),
+        ("to_token", "pubkey"),
+        ("from_amount", "f64"),
+        ("to_amount", "f64"),
+        ("minimum_amount_out", "f64"),
+    ]
+)
+
+# NumPy view of 'RECORD'; addresses stay raw 32-byte keys.
+RECORD_DTYPE = [
+    ("kind", "u1"),
+    ("type", "u1"),
+    ("reserved", "V6"),
+    ("who", "S32"),
+    ("from_token", "S32"),
+    ("to_token", "S32"),
+    ("from_amount", "<f8"),
+    ("to_amount", "<f8"),
+    ("minimum_amount_out", "<f8"),
+]
+
+_COUNT = struct.Struct("<I")
+
+
+def _encode(payload: Any) -> bytes:
+    """
+    Returns the raw bytes of a payload, as 'normalize' accepts them.
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode()
+    if isinstance(payload, dict):
+        return json.dumps(payload, separators=(",", ":")).encode()
+    # Yellowstone protobuf message.
+    return payload.SerializeToString()
+
+
+class RingBuffer:
+    """
+    Shared-memory ring of fixed-size slots, each holding a chunk of length-prefixed payloads.
+
+    Notes:
+        A slot starts with the payload count and one u32 length per payload
+        (room for 'capacity' of them), followed by the payload bytes back to
+        back. The parent writes a chunk into a free slot and only sends the
+        slot index to a worker, which reads the payloads as memoryviews of
+        the shared segment, without copying them. Slots are reused in
+        submission order.
+
+    Args:
+        slots: Number of slots.
+        slot_size: Bytes per slot, header included.
+        capacity: Maximum number of payloads per slot.
+        name: Name of an existing segment to attach to. A new one is
+            created by default.
+    """
+
+    def __init__(self, slots: int, slot_size: int, capacity: int, name: Optional[str] = None):
+        self.slots = slots
+        self.slot_size = slot_size
+        self.capacity = capacity
+        self.header_size = _COUNT.size * (capacity + 1)
+        if slot_size <= self.header_size:
+            raise ValueError(f"slot_size must be larger than the {self.header_size}-byte slot header.")
+
+        self._lengths = struct.Struct(f"<{capacity}I")
+        self.owner = name is None
+        self.memory = SharedMemory(name=name, create=self.owner, size=slots * slot_size if self.owner else 0)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    @property
+    def payload_size(self) -> int:
+        """
+        Bytes available for payloads in one slot.
+        """
+        return self.slot_size - self.header_size
+
+    def write(self, slot: int, payloads: List[bytes]):
+        """
+        Writes a chunk of raw payloads into a slot.
+
+        Raises:
+            ValueError: If the chunk does not fit the slot.
+        """
+        if len(payloads) > self.capacity or sum(map(len, payloads)) > self.payload_size:
+            raise ValueError("Chunk does not fit in a ring buffer slot.")
+
+        buf = self.memory.buf
+        base = slot * self.slot_size
+        lengths = [len(p) for p in payloads]
+        _COUNT.pack_into(buf, base, len(payloads))
+        self._lengths.pack_into(buf, base + _COUNT.size, *lengths, *[0] * (self.capacity - len(payloads)))
+
+        offset = base + self.header_size
+        for payload, length in zip(payloads, lengths):
+            buf[offset : offset + length] = payload
+            offset += length
+
+    def read(self, slot: int) -> List[memoryview]:
+        """
+        Returns the payloads of a slot as memoryviews of the segment.
+
+        Notes:
+            The views must be released before the segment is closed.
+        """
+        buf = self.memory.buf
+        base = slot * self.slot_size
+        (count,) = _COUNT.unpack_from(buf, base)
+        lengths = self._lengths.unpack_from(buf, base + _COUNT.size)[:count]
+
+        views = []
+        offset = base + self.header_size
+        for length in lengths:
+            views.append(buf[offset : offset + length])
+            offset += length
+        return views
+
+    def close(self):
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+class RecordBatch:
+    """
+    Resolved transactions of one chunk, as fixed-layout 'RECORD' rows.
+
+    Notes:
+        PumpFun, Raydium and unknown resolutions are packed into 128-byte
+        records; anything else ('ProcessError', resolutions of custom
+        resolvers, addresses that are not 32-byte keys) is an 'OTHER' row
+        whose object came back pickled in 'extras'. Iterating rebuilds the
+        resolution objects; 'columns' exposes the records to NumPy without
+        building any object.
+    """
+
+    __slots__ = ("records", "extras")
+
+    def __init__(self, records: bytes, extras: Dict[int, Resolve]):
+        self.records = records
+        self.extras = extras
+
+    def __len__(self) -> int:
+        return len(self.records) // RECORD.size
+
+    def __getitem__(self, index: int) -> Resolve:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        extra = self.extras.get(index)
+        if extra is not None:
+            return extra
+        return _decode(RECORD.unpack(self.records, index * RECORD.size))
+
+    def __iter__(self) -> Iterator[Resolve]:
+        return (self[i] for i in range(len(self)))
+
+    def columns(self) -> Dict[str, "np.ndarray"]:
+        """
+        Returns the records as NumPy columns keyed by field name (raw 32-byte keys for addresses).
+        """
+        if np is None:
+            raise ImportError("Columnar output requires numpy: pip install 'soltxs[numpy]'.")
+        rows = np.frombuffer(self.records, dtype=RECORD_DTYPE)
+        return {name: rows[name] for name, _ in RECORD_DTYPE if name != "reserved"}
+
+
+def _decode(values: List[Any]) -> Resolve:
+    kind, direction, who, from_token, to_token, from_amount, to_amount, minimum_amount_out = values
+    if kind == PUMPFUN:
+        return PumpFun(_TYPE_NAMES[direction], who, from_token, from_amount, to_token, to_amount)
+    if kind == RAYDIUM:
+        return Raydium(_TYPE_NAMES[direction], who, from_token, from_amount, to_token, to_amount, minimum_amount_out)
+    return Unknown()
+
+
+_BLANK = {kind: bytes([kind]) + bytes(RECORD.size - 1) for kind in (UNKNOWN, OTHER)}
+
+
+def _pack(result: Resolve, buf: memoryview, offset: int) -> bool:
+    """
+    Writes a resolution as a record. Returns False (and writes an 'OTHER' row) if it has no record form.
+    """
+    kind = _KINDS.get(type(result))
+    if kind == UNKNOWN:
+        buf[offset : offset + RECORD.size] = _BLANK[UNKNOWN]
+        return True
+    if kind is not None and result.type in _TYPES:
+        try:
+            RECORD.pack_into(
+                buf,
+                offset,
+                kind,
+                _TYPES[result.type],
+                result.who,
+                result.from_token,
+                result.to_token,
+                result.from_amount,
+                result.to_amount,
+                getattr(result, "minimum_amount_out", 0.0),
+            )
+            return True
+        except (TypeError, ValueError, struct.error):
+            pass
+    buf[offset : offset + RECORD.size] = _BLANK[OTHER]
+    return False
+
+
+# Worker-side views of the parent's segments, set by '_attach'.
+_ring: Optional[RingBuffer] = None
+_results: Optional[SharedMemory] = None
+
+
+def _attach(ring_name: str, slots: int, slot_size: int, capacity: int, results_name: str):
+    """
+    Worker initializer: attaches to the parent's segments and warms the parsers.
+    """
+    global _ring, _results
+    _ring = RingBuffer(slots, slot_size, capacity, name=ring_name)
+    _results = SharedMemory(name=results_name)
+    batch._warm()
+
+
+def _process_slot(slot: int, programs: Optional[FrozenSet[str]], tolerant: bool) -> Dict[int, Resolve]:
+    """
+    Runs the pipeline over the payloads of a ring slot and writes the records to the results segment.
+
+    Returns:
+        The resolutions that have no record form, by position in the chunk.
+    """
+    extras = {}
+    buf = _results.buf
+    offset = slot * _ring.capacity * RECORD.size
+    payloads = _ring.read(slot)
+    try:
+        for i, payload in enumerate(payloads):
+            result = pipeline.run(payload, programs, tolerant)
+            if not _pack(result, buf, offset + i * RECORD.size):
+                extras[i] = result
+    finally:
+        for payload in payloads:
+            payload.release()
+    return extras
+
+
+def _chunks(payloads: Iterable[Any], chunksize: int, max_bytes: int) -> Iterator[List[bytes]]:
+    chunk: List[bytes] = []
+    size = 0
+    for payload in payloads:
+        raw = _encode(payload)
+        if len(raw) > max_bytes:
+            raise ValueError(f"Payload of {len(raw)} bytes does not fit in a slot; raise 'slot_size'.")
+        if len(chunk) == chunksize or size + len(raw) > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(raw)
+        size += len(raw)
+    if chunk:
+        yield chunk
+
+
+def process_batches(
+    payloads: Iterable[Any],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    max_in_flight: Optional[int] = None,
+    programs: Optional[Iterable[str]] = None,
+    tolerant: bool = False,
+    slot_size: int = 4 << 20,
+) -> Iterator[RecordBatch]:
+    """
+    Resolves many raw Solana transactions across worker processes through shared memory.
+
+    Notes:
+        Raw payload bytes are written into a shared-memory 'RingBuffer' with
+        one slot per in-flight chunk, and workers normalize straight from
+        it. Results are written back as fixed-size 'RECORD' rows into a
+        second segment, so only slot indexes and the rare objects without a
+        record form are pickled. Batches are yielded in input order; each
+        copies its records out of shared memory, so the slot can be reused.
+        Payloads are best given as raw bytes: decoded dicts are re-encoded
+        as JSON first, which costs about as much as pickling them.
+
+    Args:
+        payloads: Raw payloads (JSON bytes/str, decoded dicts or Yellowstone
+            updates, serialized or not).
+        workers: Number of worker processes. Defaults to 'os.cpu_count()'.
+        chunksize: Maximum number of payloads per chunk.
+        max_in_flight: Number of ring slots, i.e. of chunks in flight.
+            Defaults to twice the number of workers.
+        programs: Program IDs to parse. Defaults to the resolvers' parse plan.
+        tolerant: Return a 'ProcessError' for payloads that fail instead of
+            raising, see 'soltxs.process'.
+        slot_size: Bytes per ring slot. A chunk is cut short when its
+            payloads would overflow it; a single larger payload raises.
+
+    Returns:
+        An iterator over one 'RecordBatch' per chunk.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+
+    if programs is None:
+        programs = pipeline.plan()
+    if programs is not None:
+        programs = frozenset(programs)
+    run = partial(_process_slot, programs=programs, tolerant=tolerant)
+
+    workers = max(workers or os.cpu_count() or 1, 1)
+    slots = max_in_flight or workers * 2
+    record_size = chunksize * RECORD.size
+
+    ring = RingBuffer(slots, slot_size, chunksize)
+    results = SharedMemory(create=True, size=slots * record_size)
+    pending: Deque[Tuple[int, int, Future]] = deque()
+    free = deque(range(slots))
+
+    def collect() -> RecordBatch:
+        slot, count, future = pending.popleft()
+        extras = future.result()
+        start = slot * record_size
+        free.append(slot)
+        return RecordBatch(bytes(results.buf[start : start + count * RECORD.size]), extras)
+
+    try:
+        initargs = (ring.name, slots, slot_size, chunksize, results.name)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=initargs) as pool:
+            try:
+                for chunk in _chunks(payloads, chunksize, ring.payload_size):
+                    if not free:
+                        yield collect()
+                    slot = free.popleft()
+                    ring.write(slot, chunk)
+                    pending.append((slot, len(chunk), pool.submit(run, slot)))
+
+                while pending:
+                    yield collect()
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+    finally:
+        ring.close()
+        results.close()
+        results.unlink()
@@ -0,0 +1,210 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from soltxs import normalizer, parser, pipeline, resolver
+from soltxs.normalizer.models import Transaction
+from soltxs.parser.addons.platform_identifier import enrich
+from soltxs.resolver.resolvers.pumpfun import PumpFun
+from soltxs.resolver.resolvers.raydium import Raydium
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Low-cardinality or heavily repeated columns, stored dictionary-encoded.
+DICTIONARY_COLUMNS = ("platform", "platform_address", "program", "type", "who", "from_token", "to_token")
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _schema() -> "pa.Schema":
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [
+            ("signature", pa.string()),
+            ("slot", pa.uint64()),
+            ("block_time", pa.int64()),
+            ("platform", dictionary),
+            ("platform_address", dictionary),
+            ("program", dictionary),
+            ("type", dictionary),
+            ("who", dictionary),
+            ("from_token", dictionary),
+            ("from_amount", pa.float64()),
+            ("to_token", dictionary),
+            ("to_amount", pa.float64()),
+            ("minimum_amount_out", pa.float64()),
+        ]
+    )
+
+
+class SwapSink:
+    """
+    Buffers resolved PumpFun/Raydium swaps and writes them as Parquet or Arrow IPC files.
+
+    Notes:
+        Rows are buffered column-wise and written one row group (Parquet) or
+        record batch (Arrow) at a time, every 'row_group_size' rows. Mint,
+        wallet and other repeated string columns are dictionary-encoded.
+        Parquet stores a dictionary per row group, so each batch is encoded
+        on its own; Arrow IPC files keep a vocabulary for the current file
+        and only write the values new to each batch (dictionary deltas).
+        Once a file holds 'rows_per_file' rows, the next batch rolls over
+        to a new file. Files are named '<prefix>-<n>.parquet' (or '.arrow')
+        under 'directory'.
+
+    Example:
+        with SwapSink("out/", row_group_size=100_000, rows_per_file=10_000_000) as sink:
+            for payload in payloads:
+                sink.process(payload)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        format: str = "parquet",
+        prefix: str = "swaps",
+        row_group_size: int = 65_536,
+        rows_per_file: Optional[int] = None,
+        compression: str = "zstd",
+    ):
+        if pa is None:
+            raise ImportError("SwapSink requires pyarrow: pip install 'soltxs[arrow]'.")
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported format '{format}', expected one of: {', '.join(FORMATS)}.")
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1.")
+
+        self.directory = Path(directory)
+        self.format = format
+        self.prefix = prefix
+        self.row_group_size = row_group_size
+        self.rows_per_file = rows_per_file
+        self.compression = compression
+        self.schema = _schema()
+        self.paths: List[Path] = []
+
+        self._writer = None
+        self._file_rows = 0
+        self._vocab: Dict[str, Dict[str, int]] = {}
+        self._rows: Dict[str, List[Any]] = {name: [] for name in self.schema.names}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "SwapSink":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._rows["signature"])
+
+    def add(self, tx: Transaction, resolved: resolver.models.Resolve) -> bool:
+        """
+        Buffers one resolved transaction.
+
+        Args:
+            tx: The normalized transaction, for its signature, slot, block time and platform.
+            resolved: Its resolution. Anything but a PumpFun or Raydium swap is ignored.
+
+        Returns:
+            Whether a row was added.
+        """
+        if not isinstance(resolved, (PumpFun, Raydium)):
+            return False
+
+        platform_address, platform = enrich(tx)
+
+        rows = self._rows
+        rows["signature"].append(tx.signatures[0] if tx.signatures else None)
+        rows["slot"].append(tx.slot)
+        rows["block_time"].append(tx.blockTime)
+        rows["platform"].append(platform)
+        rows["platform_address"].append(platform_address)
+        rows["program"].append(resolved.__class__.__name__)
+        rows["type"].append(resolved.type)
+        rows["who"].append(resolved.who)
+        rows["from_token"].append(resolved.from_token)
+        rows["from_amount"].append(resolved.from_amount)
+        rows["to_token"].append(resolved.to_token)
+        rows["to_amount"].append(resolved.to_amount)
+        rows["minimum_amount_out"].append(getattr(resolved, "minimum_amount_out", None))
+
+        if len(self) >= self.row_group_size:
+            self.flush()
+        return True
+
+    def process(self, payload: Any) -> resolver.models.Resolve:
+        """
+        Normalizes, parses and resolves a raw payload, buffering it if it is a swap.
+        """
+        tx = normalizer.normalize(payload)
+        resolved = resolver.resolve(parser.parse(tx, programs=pipeline.plan()))
+        self.add(tx, resolved)
+        return resolved
+
+    def flush(self):
+        """
+        Writes the buffered rows as one row group / record batch.
+        """
+        if not len(self):
+            return
+
+        if self._writer is not None and self.rows_per_file and self._file_rows >= self.rows_per_file:
+            self._close_file()
+        if self._writer is None:
+            self._open_file()
+
+        table = pa.table(
+            {name: self._column(name, values) for name, values in self._rows.items()},
+            schema=self.schema,
+        )
+        if self.format == "parquet":
+            self._writer.write_table(table, row_group_size=len(table))
+        else:
+            self._writer.write_table(table, max_chunksize=len(table))
+
+        self._file_rows += len(table)
+        for values in self._rows.values():
+            values.clear()
+
+    def close(self):
+        """
+        Flushes the remaining rows and closes the current file.
+        """
+        self.flush()
+        if self._writer is not None:
+            self._close_file()
+
+    def _column(self, name: str, values: List[Any]) -> "pa.Array":
+        if name not in DICTIONARY_COLUMNS:
+            return pa.array(values, type=self.schema.field(name).type)
+
+        if self.format == "parquet":
+            # Each row group carries its own dictionary page, holding only the values it uses.
+            return pa.array([None if v is None else str(v) for v in values], pa.string()).dictionary_encode()
+
+        # Growing per-file vocabulary, so the IPC writer only emits each batch's new values as a delta.
+        vocab = self._vocab.setdefault(name, {})
+        # Keyed by text, so an address carried as a string and as a 'Pubkey' is one value.
+        indices = [None if v is None else vocab.setdefault(str(v), len(vocab)) for v in values]
+        dictionary = pa.array(list(vocab), pa.string())
+        return pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()), dictionary)
+
+    def _open_file(self):
+        path = self.directory / f"{self.prefix}-{len(self.paths):05d}{FORMATS[self.format]}"
+        if self.format == "parquet":
+            self._writer = pq.ParquetWriter(path, self.schema, compression=self.compression)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression, emit_dictionary_deltas=True)
+            self._writer = pa.ipc.new_file(path, self.schema, options=options)
+        self.paths.append(path)
+
+    def _close_file(self):
+        self._writer.close()
+        self._writer = None
+        self._file_rows = 0
+        self._vocab.clear()
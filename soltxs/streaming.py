@@ -0,0 +1,73 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional
+
+from soltxs import pipeline, resolver
+
+_DONE = object()
+
+
+async def process_stream(
+    payloads: AsyncIterable[dict],
+    executor: Optional[Executor] = None,
+    max_pending: int = 64,
+    programs: Optional[Iterable[str]] = None,
+    tolerant: bool = False,
+) -> AsyncIterator[resolver.models.Resolve]:
+    """
+    Resolves an async stream of Solana transactions off the event loop.
+
+    Notes:
+        Each payload is normalized, parsed and resolved in 'executor' while
+        the event loop keeps running. At most 'max_pending' payloads are in
+        flight; once that many are pending, the source is no longer read
+        until the consumer catches up, so a slow consumer applies
+        backpressure instead of growing memory. Results are yielded in
+        input order. A thread executor keeps the loop responsive; use a
+        process executor to also spread the CPU work across cores.
+
+    Args:
+        payloads: Async iterable of raw RPC or Geyser transaction payloads.
+        executor: Executor running the pipeline. Defaults to the loop's
+            default thread pool.
+        max_pending: Maximum number of payloads in flight.
+        programs: Program IDs to parse. Defaults to the resolvers' parse plan.
+        tolerant: Yield a 'ProcessError' for payloads that fail instead of
+            raising, see 'soltxs.process'.
+
+    Returns:
+        An async iterator over the resolved transactions.
+    """
+    if max_pending < 1:
+        raise ValueError("max_pending must be at least 1.")
+
+    if programs is None:
+        programs = pipeline.plan()
+    if programs is not None:
+        programs = frozenset(programs)
+    run = partial(pipeline.run, programs=programs, tolerant=tolerant)
+
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    async def produce():
+        try:
+            async for payload in payloads:
+                await pending.put(loop.run_in_executor(executor, run, payload))
+        except Exception as e:
+            failed = loop.create_future()
+            failed.set_exception(e)
+            await pending.put(failed)
+        await pending.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (future := await pending.get()) is not _DONE:
+            yield await future
+    finally:
+        producer.cancel()
+        while not pending.empty():
+            future = pending.get_nowait()
+            if future is not _DONE:
+                future.cancel()
@@ -1,7 +1,9 @@
 import json
 from pathlib import Path
+from types import SimpleNamespace as PB
 
 import pytest
+import qbase58 as base58
 
 DATA_DIR = Path(__file__).parent / ".data"
 
@@ -20,3 +22,154 @@ def load_data():
             return json.loads(f.read())
 
     return _fetch_json
+
+
+@pytest.fixture()
+def serialize():
+    """
+    Provides a callable that serializes an RPC response's JSON transaction to the wire format.
+    """
+    return _serialize
+
+
+@pytest.fixture()
+def to_protobuf():
+    """
+    Provides a callable that mirrors a modified-Geyser JSON payload as a Yellowstone message.
+    """
+    return _to_protobuf
+
+
+def _compact_u16(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _array(items: bytes) -> bytes:
+    return _compact_u16(len(items)) + items
+
+
+def _key(address: str) -> bytes:
+    # The unified system program ID decodes to 32 zero bytes.
+    return bytes(32) if set(address) == {"1"} else base58.decode(address)
+
+
+def _serialize(tx: dict, versioned: bool) -> bytes:
+    """
+    Serializes the JSON-encoded transaction of an RPC response to the wire format.
+    """
+    message = tx["message"]
+    header = message["header"]
+
+    out = bytearray(_compact_u16(len(tx["signatures"])))
+    for signature in tx["signatures"]:
+        out += base58.decode(signature)
+
+    if versioned:
+        out.append(0x80)
+    out += bytes(
+        [header["numRequiredSignatures"], header["numReadonlySignedAccounts"], header["numReadonlyUnsignedAccounts"]]
+    )
+    out += _compact_u16(len(message["accountKeys"])) + b"".join(_key(k) for k in message["accountKeys"])
+    out += base58.decode(message["recentBlockhash"])
+
+    out += _compact_u16(len(message["instructions"]))
+    for instr in message["instructions"]:
+        out.append(instr["programIdIndex"])
+        out += _array(bytes(instr["accounts"]))
+        out += _array(base58.decode(instr["data"]))
+
+    if versioned:
+        lookups = message.get("addressTableLookups", [])
+        out += _compact_u16(len(lookups))
+        for lookup in lookups:
+            out += base58.decode(lookup["accountKey"])
+            out += _array(bytes(lookup["writableIndexes"]))
+            out += _array(bytes(lookup["readonlyIndexes"]))
+
+    return bytes(out)
+
+
+def _instruction(i: dict) -> PB:
+    return PB(
+        program_id_index=i["programIdIndex"],
+        accounts=bytes(i.get("accounts", [])),
+        data=base58.decode(i["data"]) if i["data"] else b"",
+        stack_height=i.get("stackHeight"),
+    )
+
+
+def _token_balance(tb: dict) -> PB:
+    amount = tb["uiTokenAmount"]
+    return PB(
+        account_index=tb["accountIndex"],
+        mint=tb["mint"],
+        owner=tb["owner"],
+        program_id=tb.get("programId", ""),
+        ui_token_amount=PB(
+            ui_amount=amount.get("uiAmount") or 0.0,
+            decimals=amount["decimals"],
+            amount=amount["amount"],
+            ui_amount_string=amount["uiAmountString"],
+        ),
+    )
+
+
+def _to_protobuf(data: dict) -> PB:
+    """
+    Mirrors a modified-Geyser JSON payload as a Yellowstone 'SubscribeUpdate' message.
+    """
+    info = data["transaction"]["transaction"]
+    meta, tx = info["meta"], info["transaction"]
+    message = tx["message"]
+
+    return PB(
+        filters=["filter"],
+        transaction=PB(
+            slot=data["transaction"]["slot"],
+            transaction=PB(
+                signature=base58.decode(tx["signatures"][0]),
+                is_vote=False,
+                transaction=PB(
+                    signatures=[base58.decode(s) for s in tx["signatures"]],
+                    message=PB(
+                        account_keys=[_key(k) for k in message["accountKeys"]],
+                        recent_blockhash=base58.decode(message["recentBlockhash"]),
+                        instructions=[_instruction(i) for i in message["instructions"]],
+                        address_table_lookups=[
+                            PB(
+                                account_key=base58.decode(lu["accountKey"]),
+                                writable_indexes=bytes(lu.get("writableIndexes", [])),
+                                readonly_indexes=bytes(lu.get("readonlyIndexes", [])),
+                            )
+                            for lu in message.get("addressTableLookups", [])
+                        ],
+                    ),
+                ),
+                meta=PB(
+                    err=None,
+                    fee=meta["fee"],
+                    pre_balances=meta["preBalances"],
+                    post_balances=meta["postBalances"],
+                    inner_instructions=[
+                        PB(index=g["index"], instructions=[_instruction(i) for i in g["instructions"]])
+                        for g in meta["innerInstructions"]
+                    ],
+                    log_messages=meta["logMessages"],
+                    pre_token_balances=[_token_balance(tb) for tb in meta["preTokenBalances"]],
+                    post_token_balances=[_token_balance(tb) for tb in meta["postTokenBalances"]],
+                    loaded_writable_addresses=[base58.decode(a) for a in meta.get("loadedWritableAddresses", [])],
+                    loaded_readonly_addresses=[base58.decode(a) for a in meta.get("loadedReadonlyAddresses", [])],
+                    compute_units_consumed=meta.get("computeUnitsConsumed"),
+                ),
+                index=info["index"],
+            ),
+        ),
+    )
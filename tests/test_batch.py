@@ -0,0 +1,30 @@
+from soltxs import process, process_many
+
+
+def test_process_many_in_process(load_data):
+    """
+    Ensures the serial path yields the same results as 'process', in order.
+    """
+    payloads = [
+        load_data("pumpfun_buy_rpc.json"),
+        load_data("raydium_amm_v4_geyser.json"),
+        load_data("pumpfun_sell_rpc.json"),
+    ]
+
+    results = list(process_many(payloads, workers=0, chunksize=2))
+    assert results == [process(p) for p in payloads]
+
+
+def test_process_many_worker_pool(load_data):
+    """
+    Ensures the process pool keeps input order with several chunks in flight.
+    """
+    payloads = [
+        load_data("pumpfun_buy_rpc.json"),
+        load_data("raydium_amm_v4_rpc.json"),
+        load_data("pumpfun_sell_rpc.json"),
+        load_data("pumpfun_create_rpc.json"),
+    ] * 3
+
+    results = list(process_many(payloads, workers=2, chunksize=1, max_in_flight=2))
+    assert results == [process(p) for p in payloads]
@@ -0,0 +1,82 @@
+import base64
+import json
+
+import pytest
+
+from soltxs import normalize, normalize_block, parse
+
+FIXTURES = ["pumpfun_buy_rpc.json", "pumpfun_sell_rpc.json", "raydium_amm_v4_rpc.json"]
+
+
+def _block(load_data, serialize=None) -> dict:
+    transactions = []
+    for name in FIXTURES:
+        result = load_data(name)["result"]
+        raw_tx = result["transaction"]
+        if serialize is not None:
+            raw_tx = [base64.b64encode(serialize(raw_tx, versioned=True)).decode(), "base64"]
+        transactions.append({"meta": result["meta"], "transaction": raw_tx, "version": 0})
+
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {
+            "blockHeight": 1,
+            "blockTime": 1_700_000_000,
+            "blockhash": "11111111111111111111111111111111",
+            "parentSlot": 99,
+            "previousBlockhash": "11111111111111111111111111111111",
+            "transactions": transactions,
+        },
+    }
+
+
+def _expected(load_data):
+    for name in FIXTURES:
+        data = load_data(name)
+        data["result"]["slot"] = 100
+        data["result"]["blockTime"] = 1_700_000_000
+        yield normalize(data)
+
+
+@pytest.mark.parametrize("encode", [False, True])
+def test_normalize_block(load_data, serialize, encode):
+    """
+    Test that block transactions normalize like the matching single-transaction responses.
+    """
+    block = _block(load_data, serialize if encode else None)
+    txs = list(normalize_block(block, slot=100))
+
+    assert txs == list(_expected(load_data))
+    assert [parse(tx) for tx in txs] == [parse(tx) for tx in _expected(load_data)]
+    assert list(normalize_block(json.dumps(block).encode(), slot=100)) == txs
+
+
+def test_block_interning(load_data):
+    """
+    Test that addresses repeated across a block's transactions share one instance.
+    """
+    block = _block(load_data)
+    # Decoded JSON gives every occurrence its own string.
+    block["result"]["transactions"].append(json.loads(json.dumps(block["result"]["transactions"][0])))
+
+    txs = list(normalize_block(block, slot=100))
+    assert block["result"]["transactions"][-1]["transaction"]["message"]["accountKeys"][0] is not txs[0].all_accounts[0]
+    assert all(a is b for a, b in zip(txs[0].all_accounts, txs[-1].all_accounts))
+
+
+def test_block_errors(load_data):
+    """
+    Test that blocks are rejected by 'normalize' and incomplete blocks by 'normalize_block'.
+    """
+    block = _block(load_data)
+    with pytest.raises(ValueError, match="normalize_block"):
+        normalize(block)
+
+    with pytest.raises(ValueError):
+        list(normalize_block({"jsonrpc": "2.0", "result": None, "id": 1}, slot=100))
+
+    del block["result"]["transactions"]
+    block["result"]["signatures"] = []
+    with pytest.raises(ValueError):
+        list(normalize_block(block, slot=100))
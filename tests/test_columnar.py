@@ -0,0 +1,47 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from soltxs import columnar, process  # noqa: E402
+
+FIXTURES = [
+    "pumpfun_buy_rpc.json",
+    "pumpfun_sell_rpc.json",
+    "raydium_amm_v4_rpc.json",
+    "raydium_amm_v4_geyser.json",
+    "pumpfun_create_rpc.json",
+]
+
+
+def test_swap_columns_match_resolved(load_data):
+    """
+    Ensures every swap becomes one row whose vectorized fields match the resolver output.
+    """
+    payloads = [load_data(f) for f in FIXTURES]
+    columns = columnar.swaps(payloads)
+
+    resolved = [process(p) for p in payloads]
+    swaps = [r for r in resolved if hasattr(r, "from_amount")]
+
+    assert len(columns["signature"]) == len(swaps) == len(payloads)
+    assert columns["from_amount_raw"].dtype == np.uint64
+    for i, r in enumerate(swaps):
+        assert columns["type"][i] == r.type
+        assert columns["who"][i] == r.who
+        assert columns["from_token"][i] == r.from_token
+        assert columns["to_token"][i] == r.to_token
+        assert columns["from_amount"][i] == pytest.approx(r.from_amount)
+        assert columns["to_amount"][i] == pytest.approx(r.to_amount)
+
+    records = columnar.to_records(columns)
+    assert records.shape == (len(payloads),)
+    assert records[2].program == "RaydiumAMM"
+
+
+def test_empty_batch():
+    """
+    Ensures an empty batch yields empty, correctly typed columns.
+    """
+    columns = columnar.swaps([])
+    assert all(len(c) == 0 for c in columns.values())
+    assert columns["to_amount"].dtype == np.float64
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from soltxs import normalize, process
+from soltxs.normalizer import decoders
+
+
+@pytest.fixture()
+def restore_decoder():
+    original = decoders.loads
+    yield
+    decoders.set_decoder(original)
+
+
+@pytest.mark.parametrize("backend", sorted(decoders.backends()))
+def test_raw_payloads(load_data, restore_decoder, backend):
+    """
+    Test that bytes, memoryview and str payloads normalize like decoded dicts.
+    """
+    decoders.set_decoder(backend)
+    data = load_data("pumpfun_buy_rpc.json")
+    raw = json.dumps(data).encode()
+
+    expected = normalize(data)
+    assert normalize(raw) == expected
+    assert normalize(memoryview(raw)) == expected
+    assert normalize(raw.decode()) == expected
+    assert process(raw) == process(data)
+
+
+def test_custom_decoder(load_data, restore_decoder):
+    """
+    Test that any callable can be plugged in as the decoder.
+    """
+    calls = []
+
+    def loads(raw):
+        calls.append(raw)
+        return json.loads(raw)
+
+    decoders.set_decoder(loads)
+    normalize(json.dumps(load_data("raydium_amm_v4_geyser.json")))
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        decoders.set_decoder("not-a-backend")
+
+
+def test_default_decoder_is_lazy(monkeypatch, restore_decoder):
+    """
+    Test that the default backend is chosen on first decode, so a backend patched in later is used.
+    """
+    calls = []
+    monkeypatch.setattr(decoders, "backends", lambda: {"patched": lambda raw: calls.append(raw) or json.loads(raw)})
+    decoders.set_decoder(None)
+
+    assert decoders.decode('{"a": 1}') == {"a": 1}
+    assert decoders.loads is not None and calls == ['{"a": 1}']
@@ -0,0 +1,60 @@
+import base64
+import copy
+import json
+
+from soltxs import Deduplicator, normalize
+
+
+def test_dedup_across_sources(load_data):
+    """
+    Test that only the first copy of a transaction passes, whatever its format.
+    """
+    rpc = load_data("pumpfun_buy_rpc.json")
+    geyser = load_data("pumpfun_buy_geyser.json")
+    other = load_data("pumpfun_sell_rpc.json")
+    signature = normalize(rpc).signatures[0]
+    assert normalize(geyser).signatures[0] == signature
+
+    dedup = Deduplicator()
+    assert dedup.check(geyser, source="a")
+    assert not dedup.check(rpc, source="b")
+    assert not dedup.check(geyser, source="a")
+    assert dedup.check(other, source="b")
+
+    assert dedup.first_source(signature) == "a"
+    stats = dedup.stats()
+    assert stats["a"]["first"] == 1 and stats["a"]["duplicates"] == 1
+    assert stats["b"]["first"] == 1 and stats["b"]["duplicates"] == 1
+    assert stats["b"]["lag"]["count"] == 1
+
+
+def test_dedup_wire_signature(load_data, serialize):
+    """
+    Test that the first signature of a base64 transaction is read without decoding the rest.
+    """
+    data = load_data("raydium_amm_v4_rpc.json")
+    wire = copy.deepcopy(data)
+    raw = serialize(data["result"]["transaction"], versioned=True)
+    wire["result"]["transaction"] = [base64.b64encode(raw).decode(), "base64"]
+
+    dedup = Deduplicator()
+    assert dedup.check(data)
+    assert not dedup.check(wire)
+    assert not dedup.check(json.dumps(wire).encode())
+
+
+def test_dedup_bounds():
+    """
+    Test that the window is bounded by count and by slot horizon.
+    """
+    dedup = Deduplicator(max_size=2, slot_horizon=10)
+    assert dedup.record("a", 100)
+    assert dedup.record("b", 100)
+    assert dedup.record("c", 101)
+    assert len(dedup) == 2 and "a" not in dedup
+
+    assert dedup.record("d", 111)
+    assert "b" not in dedup and "c" in dedup
+    assert dedup.record("e", 200)
+    assert list(dedup._seen) == ["e"]
+    assert dedup.record("a", 200)
@@ -0,0 +1,52 @@
+import pytest
+
+from soltxs import instrumentation, normalize, parse, resolve
+
+
+@pytest.fixture()
+def metrics():
+    events = []
+    yield instrumentation.enable(sink=events.append), events
+    instrumentation.disable()
+    instrumentation.metrics.reset()
+
+
+def test_stage_and_parser_metrics(load_data, metrics):
+    """
+    Ensures every stage, parser and discriminator is counted and timed.
+    """
+    agg, events = metrics
+
+    resolve(parse(normalize(load_data("pumpfun_buy_rpc.json"))))
+    snapshot = agg.snapshot()
+
+    assert snapshot["counters"]["normalize/rpc"] == 1
+    assert snapshot["counters"]["parse/parse"] == 1
+    assert snapshot["counters"]["resolve/PumpFun"] == 1
+    assert snapshot["counters"]["resolver/PumpFunResolver"] == 1
+    assert snapshot["counters"]["route/ComputeBudget/2"] == 1
+    assert any(key.startswith("route/PumpFun/") for key in snapshot["counters"])
+    assert snapshot["histograms"]["normalize/rpc"]["count"] == 1
+    assert len(events) == sum(snapshot["counters"].values())
+
+
+def test_unknown_discriminator_is_counted(load_data, metrics):
+    """
+    Ensures unknown discriminators are counted before the parser raises.
+    """
+    agg, _ = metrics
+
+    tx = normalize(load_data("raydium_amm_v4_rpc.json"))
+    tx.message.instructions[0]._decoded = b"\xff"
+
+    with pytest.raises(NotImplementedError):
+        parse(tx)
+    assert agg.snapshot()["counters"]["unknown_discriminator/ComputeBudget/255"] == 1
+
+
+def test_disabled_records_nothing(load_data):
+    """
+    Ensures nothing is recorded while instrumentation is disabled.
+    """
+    resolve(parse(normalize(load_data("raydium_amm_v4_rpc.json"))))
+    assert instrumentation.metrics.snapshot() == {"counters": {}, "histograms": {}}
@@ -0,0 +1,120 @@
+import sys
+import threading
+
+import pytest
+
+from soltxs import normalize, process
+from soltxs.normalizer import interning
+
+
+@pytest.fixture()
+def interner():
+    yield interning.enable(max_size=1_000, ids=True)
+    interning.disable()
+
+
+def test_interned_addresses(load_data, interner):
+    """
+    Test that repeated addresses share one instance across transactions.
+    """
+    data = load_data("pumpfun_buy_rpc.json")
+    first = normalize(data)
+    misses = interner.misses
+    assert misses == len(interner)
+
+    hits = interner.hits
+    second = normalize(load_data("pumpfun_buy_rpc.json"))
+    assert interner.misses == misses
+    assert interner.hits - hits >= len(second.all_accounts)
+
+    for a, b in zip(first.all_accounts, second.all_accounts):
+        assert a is b
+    assert first.meta.postTokenBalances[0].mint is second.meta.postTokenBalances[0].mint
+
+    resolved = process(data)
+    misses = interner.misses
+    again = process(load_data("pumpfun_buy_rpc.json"))
+    assert interner.misses == misses
+    assert resolved.who is again.who
+    assert resolved.to_token is again.to_token
+
+    # Interning never changes the results.
+    interning.disable()
+    assert normalize(data) == first
+    assert process(data) == resolved
+
+
+def test_lru_eviction():
+    """
+    Test that the table stays bounded and evicts the least recently used address.
+    """
+    table = interning.Interner(max_size=2, ids=True)
+    a, b = table.intern("a"), table.intern("b")
+    assert table.id_of("a") == 0
+    table.intern("c")
+
+    assert len(table) == 2
+    assert "b" not in table
+    assert table.address(table.id_of("a")) is a
+    assert table.address(1) is None
+    assert table.id_of("c") == 2
+    assert table.intern(b) is b
+
+
+def test_shared_between_threads():
+    """
+    Test that threads interning through one small table never see a half-done eviction.
+    """
+    table = interning.Interner(max_size=8, ids=True)
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(5_000):
+                table.intern_all([str((i + offset) % 13), str(i % 11)])
+                table.id_of(str(i % 7))
+        except Exception as e:
+            errors.append(e)
+
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch)
+
+    assert errors == []
+    assert len(table) == 8
+    assert table.hits + table.misses == 4 * 5_000 * 3
+
+
+def test_scope_is_local():
+    """
+    Test that a scoped table only interns for the thread that installed it.
+    """
+    table = interning.Interner()
+
+    with interning.scope(table) as scoped:
+        assert scoped is table
+        interning.intern("mine")
+        thread = threading.Thread(target=interning.intern_all, args=(["theirs"],))
+        thread.start()
+        thread.join()
+
+    assert "mine" in table and "theirs" not in table
+    assert interning.intern("after") == "after" and "after" not in table
+
+
+def test_disabled_passthrough():
+    """
+    Test that interning is a no-op while disabled.
+    """
+    keys = ["a", "b"]
+    assert interning.intern_all(keys) is keys
+    assert interning.intern(None) is None
+    with pytest.raises(ValueError):
+        interning.Interner(ids=False).id_of("a")
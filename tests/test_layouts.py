@@ -0,0 +1,57 @@
+import os
+import struct
+
+import pytest
+import qbase58 as base58
+import qborsh
+
+from soltxs.normalizer import pubkey
+from soltxs.parser.layouts import Layout
+from soltxs.parser.parsers.pumpfun import SwapData
+
+
+@qborsh.schema
+class BorshSwapData:
+    mint: qborsh.PubKey
+    sol_amount: qborsh.U64
+    token_amount: qborsh.U64
+    is_buy: qborsh.Bool
+    user: qborsh.PubKey
+    timestamp: qborsh.I64
+    virtual_sol_reserves: qborsh.U64
+    virtual_token_reserves: qborsh.U64
+
+
+def test_layout_matches_borsh():
+    """
+    Test that a fixed layout decodes exactly like the equivalent qborsh schema.
+    """
+    payload = os.urandom(32) + struct.pack("<QQ?", 5, 7, True) + os.urandom(32) + struct.pack("<qQQ", -1, 2, 3)
+    event = b"\x00" * 16 + payload
+
+    assert SwapData.size == len(payload)
+    assert SwapData.decode(event, 16) == BorshSwapData.decode(payload)
+
+
+def test_layout_padding_and_pubkeys():
+    """
+    Test that padding is skipped and pubkey fields follow the address mode.
+    """
+    layout = Layout([("discriminator", "padding_u32"), ("owner", "pubkey"), ("lamports", "u64")])
+    raw_key = os.urandom(32)
+    data = b"\x02\x00\x00\x00" + raw_key + struct.pack("<Q", 42) + b"trailing"
+
+    assert layout.names == ("owner", "lamports")
+    assert layout.unpack(data) == [base58.encode(raw_key), 42]
+
+    pubkey.enable()
+    try:
+        owner, _ = layout.unpack(data)
+        assert isinstance(owner, pubkey.Pubkey) and owner.raw == raw_key
+    finally:
+        pubkey.disable()
+
+    with pytest.raises(struct.error):
+        layout.unpack(data[:10])
+    with pytest.raises(ValueError):
+        Layout([("x", "u128")])
@@ -1,6 +1,6 @@
 import pytest
 from soltxs import normalize
-from soltxs.normalizer.models import Transaction
+from soltxs.normalizer.models import AccountTable, InnerInstructions, Instruction, Transaction
 
 
 def test_rpc_transaction():
@@ -131,3 +131,112 @@ def test_equal_transaction(load_data):
     tx2.blockTime = None
 
     assert tx1 == tx2
+
+
+def test_account_table(load_data):
+    """
+    Test that the account table is built once and maps indices and addresses both ways.
+    """
+    tx = normalize(load_data("raydium_amm_v4_rpc.json"))
+    table = tx.account_table
+
+    assert tx.account_table is table
+    assert tx.all_accounts is table.keys
+    assert len(table) == (
+        len(tx.message.accountKeys) + len(tx.loadedAddresses.writable) + len(tx.loadedAddresses.readonly)
+    )
+    for i, address in enumerate(table):
+        assert table[i] == address
+        assert table.index_of(address) == table.keys.index(address)
+    assert table.index_of("NotAnAccount") is None
+    assert table.get(len(table)) is None
+
+    # A duplicated address resolves to its first position, like the linear lookup.
+    duplicated = AccountTable(("A", "B", "A"))
+    assert duplicated.index_of("A") == 0
+
+
+def test_inner_instructions(load_data):
+    """
+    Test that inner instructions are typed and indexed by top-level instruction.
+    """
+    tx = normalize(load_data("pumpfun_buy_geyser.json"))
+
+    group = tx.meta.innerInstructions[0]
+    assert isinstance(group, InnerInstructions)
+    assert all(isinstance(i, Instruction) for i in group.instructions)
+    assert tx.meta.inner_instructions_for(group.index) is group.instructions
+    assert tx.meta.inner_instructions_for(len(tx.message.instructions)) == []
+
+
+def test_instruction_decode_cache(load_data):
+    """
+    Test that instruction data is decoded once and that predecode covers inner instructions.
+    """
+    tx = normalize(load_data("pumpfun_buy_rpc.json"))
+
+    instr = tx.message.instructions[0]
+    assert instr.decoded_data is instr.decoded_data
+
+    tx.predecode()
+    inner = [i for group in tx.meta.innerInstructions for i in group.instructions]
+    assert all(i._decoded is not None for i in tx.message.instructions + inner)
+
+
+def test_token_balance_index(load_data):
+    """
+    Test that token balances can be looked up by mint, account index and address.
+    """
+    tx = normalize(load_data("raydium_amm_v4_rpc.json"))
+    index = tx.meta.token_index
+
+    for tb in tx.meta.postTokenBalances:
+        assert index.mint_decimals(tb.mint) == tb.uiTokenAmount.decimals
+        assert index.balances[tb.accountIndex][1] is tb
+        assert index.latest(tb.accountIndex) is tb
+        assert tx.token_balance(tx.all_accounts[tb.accountIndex]) is tb
+
+    assert index.mint_decimals("NotAMint") is None
+    assert tx.token_balance("NotAnAccount") is None
+
+
+def test_lazy_transaction(load_data):
+    """
+    Test that a lazy view only builds sections on access and matches the eager result.
+    """
+    data = load_data("raydium_amm_v4_geyser.json")
+    view = normalize(data, lazy=True)
+
+    assert isinstance(view, Transaction)
+    assert view._sections == {}
+
+    assert view.slot == data["transaction"]["slot"]
+    assert "meta" not in view._sections
+
+    # Reading one metadata field builds neither the token balances nor the logs.
+    assert view.meta.fee == data["transaction"]["transaction"]["meta"]["fee"]
+    assert set(view.meta._sections) == {"fee"}
+
+    eager = normalize(data)
+    assert view == eager and eager == view
+    assert view.meta == eager.meta
+    assert type(view.materialize().meta) is type(eager.meta)
+    assert view.materialize() == eager
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_account_keys_are_copied(load_data, lazy):
+    """
+    Test that a transaction does not share its account keys with the payload.
+    """
+    data = load_data("pumpfun_buy_rpc.json")
+    raw_keys = data["result"]["transaction"]["message"]["accountKeys"]
+    original = list(raw_keys)
+    tx = normalize(data, lazy=lazy)
+
+    assert tx.message.accountKeys == original
+    assert tx.message.accountKeys is not raw_keys
+    tx.message.accountKeys.append("Extra111")
+    raw_keys[0] = "Changed111"
+    assert raw_keys[1:] == original[1:]
+    assert tx.message.accountKeys[:-1] == original
@@ -73,3 +73,59 @@ def test_enrichment_platform_not_found():
     platform_addr, platform_name = enrich(tx)
     assert platform_name is None
     assert platform_addr is None
+
+
+def test_parse_plan(load_data):
+    """
+    Ensures a parse plan only keeps the programs producing the requested types
+    and that filtered parsing skips every other instruction.
+    """
+    from soltxs import normalize, parse
+    from soltxs.parser import plan
+    from soltxs.parser.parsers.raydiumAMM import RaydiumAMMParser, Swap
+    from soltxs.parser.parsers.unknown import Unknown
+
+    programs = plan([Swap])
+    assert programs == {RaydiumAMMParser.program_id}
+    assert plan([Unknown]) is None
+
+    tx = normalize(load_data("raydium_amm_v4_rpc.json"))
+    parsed = parse(tx, programs=programs)
+    assert [type(p) for p in parsed] == [Swap]
+
+    decoded = [instr._decoded is not None for instr in tx.message.instructions]
+    assert decoded.count(True) == 1
+
+    assert parsed[0] == next(p for p in parse(tx) if isinstance(p, Swap))
+
+
+def test_default_plan_is_cached():
+    """
+    Ensures the default parse plan is reused until a program or resolver is registered.
+    """
+    from soltxs import parser, pipeline, resolver
+    from soltxs.parser.parsers.computeBudget import ComputeBudgetParser, SetComputeUnitLimit
+    from soltxs.resolver.models import Resolver
+
+    plan = pipeline.plan()
+    assert pipeline.plan() is plan
+    assert ComputeBudgetParser.program_id not in plan
+
+    class _LimitResolver(Resolver):
+        requires = (SetComputeUnitLimit,)
+
+        def resolve(self, instructions):
+            return None
+
+    limit = resolver.register(_LimitResolver())
+    try:
+        assert ComputeBudgetParser.program_id in pipeline.plan()
+    finally:
+        resolver.registry.unregister(limit)
+    assert pipeline.plan() == plan
+
+    parser.register("MyProgram111", "soltxs.parser.parsers.computeBudget:ComputeBudgetParser")
+    try:
+        assert pipeline.plan() is not plan
+    finally:
+        parser.id_to_handler.unregister("MyProgram111")
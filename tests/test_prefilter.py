@@ -0,0 +1,74 @@
+import base64
+import copy
+import json
+import pickle
+
+import qbase58 as base58
+
+from soltxs import Prefilter
+from soltxs.constants import VOTE_PROGRAM_ID
+from soltxs.prefilter import BloomFilter
+
+WALLET = "Geu1Jtgp2vkWmBq9KL4FozLFx1LAEjpntEfjFuWf6QW7"
+
+
+def test_prefilter_reasons(load_data):
+    """
+    Test that failed, vote and unrelated transactions are rejected from the raw payload.
+    """
+    prefilter = Prefilter()
+    data = load_data("pumpfun_buy_rpc.json")
+    assert prefilter.check(data)
+
+    failed = copy.deepcopy(data)
+    failed["result"]["meta"]["err"] = {"InstructionError": [0, "Custom"]}
+    assert prefilter.reject_reason(failed) == "failed"
+
+    vote = copy.deepcopy(data)
+    vote["result"]["transaction"]["message"]["accountKeys"].append(VOTE_PROGRAM_ID)
+    assert prefilter.reject_reason(vote) == "vote"
+
+    assert prefilter.reject_reason(data) is None
+    assert Prefilter(programs=["TokenzQdBNbLqP5VEhdkAS6EPFLC1PE1n4hhgEAjfAGK"]).reject_reason(data) == "program"
+
+    assert not prefilter.check(failed)
+    stats = prefilter.stats()
+    assert stats["total"] == 2
+    assert stats["passed"] == stats["failed"] == 0.5
+
+
+def test_prefilter_formats(load_data, serialize, to_protobuf):
+    """
+    Test that raw-bytes formats match addresses given as text.
+    """
+    prefilter = Prefilter(wallets=[WALLET])
+    geyser = load_data("pumpfun_buy_geyser.json")
+    rpc = load_data("pumpfun_buy_rpc.json")
+
+    wire = copy.deepcopy(rpc)
+    raw = serialize(rpc["result"]["transaction"], versioned=True)
+    wire["result"]["transaction"] = [base64.b64encode(raw).decode(), "base64"]
+
+    for payload in (geyser, rpc, wire, to_protobuf(geyser), json.dumps(rpc).encode()):
+        assert prefilter.check(payload)
+    for payload in (wire, to_protobuf(geyser)):
+        assert Prefilter(wallets=["So11111111111111111111111111111111111111111"]).reject_reason(payload) == "wallet"
+
+
+def test_bloom_filter():
+    """
+    Test that the Bloom filter has no false negatives, for text and raw keys.
+    """
+    bloom = BloomFilter([WALLET, "So11111111111111111111111111111111111111112"])
+    assert WALLET in bloom
+    assert bloom.intersects([bytes(32), base58.decode(WALLET)])
+    assert len(bloom) == 2
+
+    # A filter unpickled under another string hash seed falls back to the raw keys.
+    assert WALLET in pickle.loads(pickle.dumps(bloom))
+    state = bloom.__getstate__()
+    state["_seed"] += 1
+    moved = BloomFilter.__new__(BloomFilter)
+    moved.__setstate__(state)
+    assert moved._text_bits is None
+    assert WALLET in moved and base58.decode(WALLET) in moved
@@ -0,0 +1,89 @@
+import dataclasses
+
+import pytest
+
+from soltxs import normalize, parse, process
+from soltxs.normalizer import pubkey
+from soltxs.normalizer.pubkey import Pubkey
+
+WSOL = "So11111111111111111111111111111111111111112"
+
+
+def _text(value):
+    """
+    Replaces every Pubkey in a (nested) result by its base58 string.
+    """
+    if isinstance(value, Pubkey):
+        return str(value)
+    if dataclasses.is_dataclass(value):
+        return (type(value), tuple(_text(getattr(value, f.name)) for f in dataclasses.fields(value)))
+    if isinstance(value, (list, tuple)):
+        return [_text(v) for v in value]
+    if isinstance(value, dict):
+        return {_text(k): _text(v) for k, v in value.items()}
+    return value
+
+
+def test_pubkey_interop():
+    """
+    Test that a Pubkey compares, orders and hashes by its bytes, whichever form it was built from.
+    """
+    from_text = Pubkey.from_str(WSOL)
+    from_bytes = Pubkey.from_bytes(from_text.raw)
+
+    assert from_bytes._text is None
+    assert from_bytes == from_text
+    assert hash(from_bytes) == hash(from_text) == hash(from_text.raw)
+    assert {from_text: 1}[from_bytes] == 1
+    assert from_bytes != WSOL
+    assert str(from_bytes) == WSOL
+
+    system = Pubkey.from_bytes(bytes(32))
+    assert str(system) == "11111111111111111111111111111111"
+    assert Pubkey.from_str(str(system)).raw == bytes(32)
+    assert system < from_text <= from_bytes
+    assert sorted([from_text, system]) == [system, from_text]
+
+    with pytest.raises(ValueError):
+        Pubkey.from_bytes(b"\x01" * 31)
+
+
+@pytest.mark.parametrize("name", ["pumpfun_buy_rpc.json", "pumpfun_sell_rpc.json", "raydium_amm_v4_geyser.json"])
+def test_pubkey_transactions(load_data, name):
+    """
+    Test that parsing and resolving with Pubkey addresses gives the same results.
+    """
+    data = load_data(name)
+    expected = _text((parse(normalize(data)), process(data)))
+
+    pubkey.enable()
+    try:
+        tx = normalize(data)
+        assert all(isinstance(k, Pubkey) for k in tx.all_accounts)
+        assert _text((parse(tx), process(data))) == expected
+    finally:
+        pubkey.disable()
+
+
+@pytest.mark.parametrize(
+    "name", ["pumpfun_buy_rpc.json", "pumpfun_sell_rpc.json", "raydium_amm_v4_rpc.json", "raydium_amm_v4_geyser.json"]
+)
+def test_pubkey_resolved_mints(load_data, name):
+    """
+    Test that resolved swaps only carry Pubkeys, matching the transaction's mints (or the WSOL mint).
+    """
+    data = load_data(name)
+
+    pubkey.enable()
+    try:
+        tx = normalize(data)
+        resolved = process(data)
+    finally:
+        pubkey.disable()
+
+    mints = {b.mint for b in tx.meta.preTokenBalances + tx.meta.postTokenBalances}
+    tokens = [resolved.from_token, resolved.to_token]
+    assert all(isinstance(t, Pubkey) for t in tokens + [resolved.who])
+    assert all(t in mints or t == Pubkey.from_str(WSOL) for t in tokens)
+    if name.startswith("raydium"):
+        assert set(tokens) <= mints
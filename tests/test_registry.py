@@ -0,0 +1,131 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from soltxs import normalize, parse, parser, plugins
+from soltxs.parser.parsers.pumpfun import Buy, PumpFunParser
+from soltxs.parser.parsers.raydiumAMM import RaydiumAMMParser, Swap
+from soltxs.parser.registry import BUILTIN, ProgramRegistry
+from soltxs.resolver.registry import ResolverRegistry
+from soltxs.resolver.resolvers.pumpfun import PumpFun, PumpFunResolver
+from soltxs.resolver.resolvers.unknown import UnknownResolver
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_import_is_lazy(load_data):
+    """
+    Ensures importing soltxs loads no parser, and processing a payload only loads what it needs.
+    """
+    script = (
+        "import json, sys, soltxs\n"
+        "before = sorted(m for m in sys.modules if m.startswith('soltxs.parser.parsers.'))\n"
+        "soltxs.plugins.disable()\n"
+        f"soltxs.process(json.loads(open({str(ROOT / 'tests/.data/pumpfun_buy_rpc.json')!r}).read()))\n"
+        "after = sorted(m for m in sys.modules if m.startswith('soltxs.parser.parsers.'))\n"
+        "optional = ['soltxs.metrics', 'orjson', 'msgspec'] + [\n"
+        "    f'soltxs.normalizer.normalizers.{n}' for n in ('block', 'lazy', 'wire', 'yellowstone')\n"
+        "]\n"
+        "print(json.dumps([before, after, 'asyncio' in sys.modules, 'multiprocessing' in sys.modules,\n"
+        "                  [m for m in optional if m in sys.modules]]))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    before, after, asyncio, multiprocessing, optional = json.loads(out.stdout)
+
+    assert before == []
+    assert "soltxs.parser.parsers.pumpfun" in after
+    assert "soltxs.parser.parsers.systemProgram" not in after
+    assert not asyncio and not multiprocessing
+    assert optional == []
+
+
+def test_program_registry_loads_on_first_lookup():
+    """
+    Ensures targets are imported on lookup and matched by module in 'producers' without importing.
+    """
+    registry = ProgramRegistry(BUILTIN)
+    assert not registry.is_loaded(PumpFunParser.program_id)
+    assert registry.producers(Buy) == [PumpFunParser.program_id]
+    assert not registry.is_loaded(PumpFunParser.program_id)
+
+    assert registry.get(PumpFunParser.program_id) is PumpFunParser
+    assert registry.is_loaded(PumpFunParser.program_id)
+    assert registry.producers(Buy) == [PumpFunParser.program_id]
+    assert registry.get("Unknown111") is None
+    with pytest.raises(KeyError):
+        registry["Unknown111"]
+
+    registry.unregister(RaydiumAMMParser.program_id)
+    assert RaydiumAMMParser.program_id not in registry
+    assert len(registry) == len(BUILTIN) - 1
+
+
+def test_program_registry_plugin_subclass(monkeypatch, tmp_path):
+    """
+    Ensures a lazily registered plugin producing a subclass of a built-in type is found by 'producers'.
+    """
+    (tmp_path / "my_amm.py").write_text(
+        "from dataclasses import dataclass\n"
+        "from soltxs.parser.parsers.raydiumAMM import Swap, _RaydiumAMMParser\n"
+        "@dataclass(slots=True)\n"
+        "class MySwap(Swap):\n"
+        "    pool: str = ''\n"
+        "MyAMMParser = _RaydiumAMMParser()\n"
+        "MyAMMParser.program_id = 'MyAMM111'\n"
+        "MyAMMParser.parsed_types = (MySwap,)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "my_amm", raising=False)
+
+    registry = ProgramRegistry(BUILTIN)
+    registry.register("MyAMM111", "my_amm:MyAMMParser")
+    assert registry.producers(Swap) == [RaydiumAMMParser.program_id, "MyAMM111"]
+    assert not registry.is_loaded(RaydiumAMMParser.program_id)
+    assert registry.is_loaded("MyAMM111")
+    assert registry.producers(Buy) == [PumpFunParser.program_id]
+
+    monkeypatch.setattr(parser, "id_to_handler", registry)
+    assert parser.plan([Swap]) == {RaydiumAMMParser.program_id, "MyAMM111"}
+    monkeypatch.delitem(sys.modules, "my_amm")
+
+
+def test_program_registry_entry_points(monkeypatch, load_data):
+    """
+    Ensures third-party programs are read from entry points, without overriding registered ones.
+    """
+    declared = [
+        ("MyProgram111", "soltxs.parser.parsers.raydiumAMM:RaydiumAMMParser"),
+        (PumpFunParser.program_id, "soltxs.parser.parsers.unknown:UnknownProgramParser"),
+    ]
+    monkeypatch.setattr(plugins, "entry_points", lambda group: declared if group == "test.parsers" else [])
+
+    registry = ProgramRegistry(BUILTIN, entry_point_group="test.parsers")
+    assert registry.get(PumpFunParser.program_id) is PumpFunParser
+    assert registry.get("MyProgram111") is RaydiumAMMParser
+    assert list(registry)[-1] == "MyProgram111"
+
+    monkeypatch.undo()
+    monkeypatch.setattr(plugins, "enabled", False)
+    assert plugins.entry_points(plugins.PARSERS_GROUP) == []
+
+
+def test_resolver_registry_targets(monkeypatch, load_data):
+    """
+    Ensures resolvers registered as targets or entry points are imported on first use, in order.
+    """
+    monkeypatch.setattr(
+        plugins, "entry_points", lambda group: [("pumpfun", "soltxs.resolver.resolvers.pumpfun:PumpFunResolver")]
+    )
+    registry = ResolverRegistry(fallback=UnknownResolver, entry_point_group="test.resolvers")
+    registry.register("soltxs.resolver.resolvers.raydium:RaydiumResolver")
+
+    parsed = parse(normalize(load_data("pumpfun_buy_rpc.json")))
+    assert isinstance(registry.resolve(parsed), PumpFun)
+    assert [r.__class__.__name__ for r in registry] == ["_RaydiumResolver", "_PumpFunResolver"]
+    assert set(PumpFunResolver.requires) <= registry.required_types
+
+    with pytest.raises(ValueError):
+        plugins.load("soltxs.resolver.resolvers.pumpfun")
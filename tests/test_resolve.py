@@ -62,3 +62,71 @@ def test_resolve_no_match():
     ]
     result = resolve(unknown_instructions)
     assert isinstance(result, UnknownResolve)
+
+
+def test_registry_dispatch(load_data):
+    """
+    Ensures a user resolver can be registered without editing the package and
+    that only resolvers whose required types are present get invoked.
+    """
+    from dataclasses import dataclass
+
+    from soltxs.parser.parsers.computeBudget import SetComputeUnitLimit
+    from soltxs.resolver.models import Resolver
+    from soltxs.resolver.registry import ResolverRegistry
+    from soltxs.resolver.resolvers.pumpfun import PumpFunResolver
+    from soltxs.resolver.resolvers.unknown import UnknownResolver
+
+    @dataclass(slots=True)
+    class ComputeLimit(Resolve):
+        limit: int
+
+    calls = []
+
+    class _ComputeLimitResolver(Resolver):
+        requires = (SetComputeUnitLimit,)
+
+        def resolve(self, instructions):
+            calls.append(instructions)
+            return ComputeLimit(limit=instructions[0].compute_unit_limit)
+
+    registry = ResolverRegistry(fallback=UnknownResolver)
+    registry.register(PumpFunResolver)
+    registry.register(_ComputeLimitResolver())
+
+    parsed = parse(normalize(load_data("raydium_amm_v4_rpc.json")))
+    outcome = registry.resolve(parsed)
+    assert isinstance(outcome, ComputeLimit)
+    assert calls == [[i for i in parsed if isinstance(i, SetComputeUnitLimit)]]
+
+    assert registry.required_types == set(PumpFunResolver.requires) | {SetComputeUnitLimit}
+    assert registry.resolve([]) == UnknownResolver.resolve([])
+    assert len(calls) == 1
+
+
+def test_registry_dispatch_subclasses(load_data):
+    """
+    Ensures resolvers requiring a base class receive instructions of its subclasses, once each.
+    """
+    from soltxs.parser.models import ParsedInstruction
+    from soltxs.parser.parsers.computeBudget import SetComputeUnitLimit
+    from soltxs.resolver.models import Resolver
+    from soltxs.resolver.registry import ResolverRegistry
+    from soltxs.resolver.resolvers.unknown import UnknownResolver
+
+    calls = []
+
+    class _AnyResolver(Resolver):
+        requires = (ParsedInstruction, SetComputeUnitLimit)
+
+        def resolve(self, instructions):
+            calls.append(instructions)
+            return None
+
+    registry = ResolverRegistry(fallback=UnknownResolver)
+    registry.register(_AnyResolver())
+
+    parsed = parse(normalize(load_data("raydium_amm_v4_rpc.json")))
+    registry.resolve(parsed)
+    registry.resolve(parsed)
+    assert calls == [parsed, parsed]
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from soltxs import process, process_many, shm
+from soltxs.resolver.models import ProcessError
+from soltxs.resolver.resolvers.pumpfun import PumpFun
+
+
+def _raw(load_data, *names):
+    return [json.dumps(load_data(name)).encode() for name in names]
+
+
+def test_ring_buffer_roundtrip():
+    """
+    Ensures payloads written into a slot are read back intact, and oversized chunks are rejected.
+    """
+    ring = shm.RingBuffer(slots=2, slot_size=256, capacity=4)
+    try:
+        ring.write(1, [b'{"a": 1}', b"", b"xyz"])
+        views = ring.read(1)
+        assert [bytes(v) for v in views] == [b'{"a": 1}', b"", b"xyz"]
+        for view in views:
+            view.release()
+
+        with pytest.raises(ValueError):
+            ring.write(0, [b"x" * ring.payload_size, b"y"])
+    finally:
+        ring.close()
+
+
+def test_record_roundtrip(load_data):
+    """
+    Ensures swap resolutions survive packing into a record, and others are flagged 'OTHER'.
+    """
+    result = process(load_data("pumpfun_buy_rpc.json"))
+    buf = bytearray(shm.RECORD.size * 2)
+
+    assert shm._pack(result, memoryview(buf), 0)
+    error = ProcessError(stage="normalize", signature=None, error="ValueError", reason="bad")
+    assert not shm._pack(error, memoryview(buf), shm.RECORD.size)
+
+    records = shm.RecordBatch(bytes(buf), {1: error})
+    assert list(records) == [result, error]
+    assert records[-1] is error and records[-2] == result
+    with pytest.raises(IndexError):
+        records[-3]
+    assert list(records.columns()["kind"]) == [shm.PUMPFUN, shm.OTHER]
+
+
+def test_process_many_shm(load_data):
+    """
+    Ensures the shared-memory transport matches 'process', in order, across several ring slots.
+    """
+    payloads = _raw(
+        load_data, "pumpfun_buy_rpc.json", "raydium_amm_v4_rpc.json", "pumpfun_sell_rpc.json", "pumpfun_create_rpc.json"
+    ) * 3
+    payloads.append(b'{"not": "a transaction"}')
+
+    results = list(process_many(payloads, workers=2, chunksize=2, max_in_flight=2, transport="shm", tolerant=True))
+    assert results[:-1] == [process(p) for p in payloads[:-1]]
+    assert isinstance(results[0], PumpFun)
+    assert isinstance(results[-1], ProcessError)
+
+    batches = list(shm.process_batches(payloads[:4], workers=2, chunksize=3, slot_size=20 << 10))
+    assert [len(b) for b in batches] == [2, 2]
+
+    assert list(process_many(payloads[:-1], workers=1, transport="shm")) == results[:-1]
+    with pytest.raises(ValueError):
+        list(process_many(payloads, workers=2, transport="pipe"))
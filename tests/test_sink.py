@@ -0,0 +1,88 @@
+import dataclasses
+import hashlib
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from soltxs import normalize, process  # noqa: E402
+from soltxs.normalizer import pubkey  # noqa: E402
+from soltxs.sink import SwapSink  # noqa: E402
+
+FIXTURES = ["pumpfun_buy_rpc.json", "pumpfun_sell_rpc.json", "raydium_amm_v4_rpc.json"]
+
+
+def test_parquet_row_groups_and_rolling(load_data, tmp_path):
+    """
+    Ensures swaps are written in row groups, roll over to new files and keep dictionary columns.
+    """
+    payloads = [load_data(f) for f in FIXTURES] * 4
+
+    with SwapSink(tmp_path, row_group_size=3, rows_per_file=6) as sink:
+        for payload in payloads:
+            sink.process(payload)
+
+    assert [p.name for p in sink.paths] == ["swaps-00000.parquet", "swaps-00001.parquet"]
+    assert [pq.ParquetFile(p).metadata.num_row_groups for p in sink.paths] == [2, 2]
+
+    table = pa.concat_tables([pq.read_table(p) for p in sink.paths])
+    assert table.num_rows == len(payloads)
+    assert pa.types.is_dictionary(table.schema.field("who").type)
+    assert table.column("program").to_pylist()[:3] == ["PumpFun", "PumpFun", "Raydium"]
+    assert table.column("platform").to_pylist()[2] == "BullX"
+    assert table.column("minimum_amount_out").to_pylist()[0] is None
+
+
+def test_arrow_ipc(load_data, tmp_path):
+    """
+    Ensures Arrow IPC output reads back with one record batch per flushed group.
+    """
+    with SwapSink(tmp_path, format="arrow", row_group_size=2) as sink:
+        for name in FIXTURES + ["pumpfun_create_rpc.json"]:
+            sink.process(load_data(name))
+
+    reader = pa.ipc.open_file(sink.paths[0])
+    assert reader.num_record_batches == 2
+    table = reader.read_all()
+    assert table.num_rows == 4
+    assert table.column("type").to_pylist() == ["buy", "sell", "buy", "buy"]
+
+
+def test_arrow_vocabulary_by_text(load_data, tmp_path):
+    """
+    Ensures an address seen as a string and as a Pubkey is a single Arrow dictionary value.
+    """
+    payload = load_data("pumpfun_buy_rpc.json")
+    with SwapSink(tmp_path, format="arrow", row_group_size=10) as sink:
+        sink.process(payload)
+        pubkey.enable()
+        try:
+            sink.process(payload)
+        finally:
+            pubkey.disable()
+
+    batch = pa.ipc.open_file(sink.paths[0]).get_batch(0)
+    for name in ("who", "from_token", "to_token"):
+        assert len(batch.column(name).dictionary) == 1
+    assert batch.column("who").to_pylist()[0] == batch.column("who").to_pylist()[1]
+
+
+def test_parquet_dictionaries_per_row_group(load_data, tmp_path):
+    """
+    Ensures each Parquet row group only stores the dictionary values it uses, so size stays flat.
+    """
+    payload = load_data("pumpfun_buy_rpc.json")
+    tx, resolved = normalize(payload), process(payload)
+
+    with SwapSink(tmp_path, row_group_size=50) as sink:
+        for i in range(1000):
+            wallet = hashlib.sha256(str(i).encode()).hexdigest()[:44]
+            sink.add(tx, dataclasses.replace(resolved, who=wallet))
+
+    metadata = pq.ParquetFile(sink.paths[0]).metadata
+    who = metadata.schema.to_arrow_schema().get_field_index("who")
+    sizes = [metadata.row_group(i).column(who).total_uncompressed_size for i in range(metadata.num_row_groups)]
+    assert len(sizes) == 20
+    assert max(sizes) < 2 * sizes[0]
+    assert pq.read_table(sink.paths[0]).column("who").to_pylist()[-1] == wallet
@@ -0,0 +1,53 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from soltxs import process, process_stream
+
+
+async def _fake_producer(payloads, pulled):
+    for payload in payloads:
+        pulled.append(payload)
+        await asyncio.sleep(0)
+        yield payload
+
+
+def test_process_stream_in_order(load_data):
+    """
+    Ensures streamed results match 'process' and keep the input order.
+    """
+    payloads = [load_data("pumpfun_buy_geyser.json"), load_data("raydium_amm_v4_geyser.json")] * 5
+
+    async def consume():
+        return [r async for r in process_stream(_fake_producer(payloads, []), max_pending=3)]
+
+    assert asyncio.run(consume()) == [process(p) for p in payloads]
+
+
+def test_process_stream_backpressure(load_data):
+    """
+    Ensures a slow consumer stops the source from being read ahead without bound.
+    """
+    payloads = [load_data("pumpfun_sell_rpc.json")] * 20
+    max_pending = 2
+
+    async def consume():
+        pulled, lag = [], []
+        async for _ in process_stream(_fake_producer(payloads, pulled), max_pending=max_pending):
+            await asyncio.sleep(0.001)
+            lag.append(len(pulled))
+        return [pulled_count - (i + 1) for i, pulled_count in enumerate(lag)]
+
+    assert max(asyncio.run(consume())) <= max_pending + 1
+
+
+def test_process_stream_process_executor(load_data):
+    """
+    Ensures the pipeline can be offloaded to a process pool.
+    """
+    payloads = [load_data("pumpfun_buy_rpc.json"), load_data("raydium_amm_v4_rpc.json")]
+
+    async def consume():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return [r async for r in process_stream(_fake_producer(payloads, []), executor=executor)]
+
+    assert asyncio.run(consume()) == [process(p) for p in payloads]
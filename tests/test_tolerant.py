@@ -0,0 +1,147 @@
+import pytest
+import qbase58 as base58
+
+from soltxs import normalize, parse, parser, process, process_many
+from soltxs.parser.models import (
+    ACCOUNT_OUT_OF_RANGE,
+    MISSING_DECIMALS,
+    SHORT_DATA,
+    UNKNOWN_DISCRIMINATOR,
+    ParseError,
+)
+from soltxs.resolver.models import ProcessError
+from soltxs.resolver.resolvers.pumpfun import PumpFun
+
+
+def _unknown_discriminator(data: dict) -> dict:
+    # Instruction 0 is a ComputeBudget instruction; 0x09 is not a discriminator it handles.
+    data["result"]["transaction"]["message"]["instructions"][0]["data"] = base58.encode(b"\x09")
+    return data
+
+
+def test_tolerant_parse(load_data):
+    """
+    Test that failing instructions become error records and parsing continues.
+    """
+    tx = normalize(_unknown_discriminator(load_data("pumpfun_buy_rpc.json")))
+    with pytest.raises(NotImplementedError):
+        parse(tx)
+
+    parsed = parse(tx, tolerant=True)
+    error = parsed[0]
+    assert isinstance(error, ParseError)
+    assert error.program_name == "ComputeBudget"
+    assert (error.instruction_index, error.discriminator, error.error) == (0, "9", "UnknownDiscriminator")
+    assert parsed[1:] == parse(normalize(load_data("pumpfun_buy_rpc.json")))[1:]
+
+
+def test_tolerant_parser_failure(load_data):
+    """
+    Test that an exception raised by a parser is recorded with its reason.
+    """
+    data = load_data("pumpfun_buy_rpc.json")
+    data["result"]["meta"]["preTokenBalances"] = []
+    data["result"]["meta"]["postTokenBalances"] = []
+
+    errors = [p for p in parse(normalize(data), tolerant=True) if isinstance(p, ParseError)]
+    assert [(e.program_name, e.error) for e in errors] == [("PumpFun", MISSING_DECIMALS)]
+    assert "decimals" in errors[0].reason
+    with pytest.raises(ValueError, match="decimals"):
+        parse(normalize(data))
+
+
+def test_tolerant_malformed_instructions(load_data):
+    """
+    Test that short data and out-of-range accounts are recorded without reaching the parser.
+    """
+    data = load_data("raydium_amm_v4_rpc.json")
+    instructions = data["result"]["transaction"]["message"]["instructions"]
+    instructions[1]["data"] = ""  # ComputeBudget, which reads a one-byte discriminator
+    instructions[4]["data"] = base58.encode(b"\x09\x01")  # Raydium swap, missing both amounts
+    instructions[6]["accounts"] = [0, 250]  # System transfer
+    instructions[9]["programIdIndex"] = 250
+    tx = normalize(data)
+
+    parsed = parse(tx, tolerant=True)
+    errors = {p.instruction_index: (p.program_name, p.error) for p in parsed if isinstance(p, ParseError)}
+    assert errors == {
+        1: ("ComputeBudget", SHORT_DATA),
+        4: ("RaydiumAMM", SHORT_DATA),
+        6: ("System Program", ACCOUNT_OUT_OF_RANGE),
+        9: ("Unknown", ACCOUNT_OUT_OF_RANGE),
+    }
+    assert len(parsed) == len(instructions)
+    assert parsed[2] == parse(normalize(load_data("raydium_amm_v4_rpc.json")))[2]
+
+    # Strict parsing skips the checks and fails where the first parser trips.
+    with pytest.raises(IndexError):
+        parse(tx)
+
+
+def test_tolerant_inner_instructions(load_data):
+    """
+    Test that a malformed inner instruction fails only the instruction invoking it.
+    """
+    data = load_data("raydium_amm_v4_rpc.json")
+    inner = data["result"]["meta"]["innerInstructions"][0]["instructions"]
+    transfer = inner[0]["data"]
+    inner[0]["data"] = base58.encode(b"\x11")  # Token SyncNative, not handled
+    tx = normalize(data)
+    with pytest.raises(NotImplementedError):
+        parse(tx)
+
+    parsed = parse(tx, tolerant=True)
+    error = parsed[4]
+    assert (error.program_name, error.instruction_index, error.error) == ("RaydiumAMM", 4, UNKNOWN_DISCRIMINATOR)
+    assert "Inner instruction 0 (TokenProgram)" in error.reason
+    expected = parse(normalize(load_data("raydium_amm_v4_rpc.json")))
+    assert parsed[:4] + parsed[5:] == expected[:4] + expected[5:]
+
+    inner[0]["data"] = transfer
+    inner[1]["accounts"] = [0, 250, 1]
+    errors = [p for p in parse(normalize(data), tolerant=True) if isinstance(p, ParseError)]
+    assert [(e.instruction_index, e.error) for e in errors] == [(4, ACCOUNT_OUT_OF_RANGE)]
+
+    inner[0]["data"] = base58.encode(b"\x03")
+    errors = [p for p in parse(normalize(data), tolerant=True) if isinstance(p, ParseError)]
+    assert [(e.instruction_index, e.error) for e in errors] == [(4, SHORT_DATA)]
+
+    inner[0]["programIdIndex"] = 250
+    errors = [p for p in parse(normalize(data), tolerant=True) if isinstance(p, ParseError)]
+    assert [(e.instruction_index, e.error) for e in errors] == [(4, ACCOUNT_OUT_OF_RANGE)]
+
+
+def test_tolerant_truncated_create(load_data, capfd):
+    """
+    Test that a PumpFun create whose strings overrun its data is recorded, without a decoder error.
+    """
+    data = load_data("pumpfun_create_rpc.json")
+    instruction = data["result"]["transaction"]["message"]["instructions"][3]
+    instruction["data"] = base58.encode(base58.decode(instruction["data"])[:40])
+    tx = normalize(data)
+
+    parsed = parse(tx, tolerant=True)
+    assert (parsed[3].program_name, parsed[3].error) == ("PumpFun", SHORT_DATA)
+    assert not isinstance(parsed[5], ParseError)
+    assert capfd.readouterr().err == ""
+    with pytest.raises(ValueError, match="overrun"):
+        parse(tx)
+
+
+def test_tolerant_process(load_data):
+    """
+    Test that tolerant processing resolves past bad instructions and returns payload errors inline.
+    """
+    expected = process(load_data("pumpfun_buy_rpc.json"))
+    assert isinstance(expected, PumpFun)
+
+    data = _unknown_discriminator(load_data("pumpfun_buy_rpc.json"))
+    every_program = parser.id_to_handler.keys()
+    with pytest.raises(NotImplementedError):
+        process(data, programs=every_program)
+    assert process(data, programs=every_program, tolerant=True) == expected
+
+    results = list(process_many([load_data("pumpfun_buy_rpc.json"), {"bad": 1}], workers=0, tolerant=True))
+    assert results[0] == expected
+    assert isinstance(results[1], ProcessError)
+    assert (results[1].stage, results[1].error, results[1].signature) == ("normalize", "ValueError", None)
@@ -0,0 +1,35 @@
+import base64
+import copy
+
+import pytest
+
+from soltxs import normalize, parse
+
+
+@pytest.mark.parametrize("fixture", ["raydium_amm_v4_rpc.json", "pumpfun_buy_rpc.json", "pumpfun_create_rpc.json"])
+def test_base64_matches_json(load_data, serialize, fixture):
+    """
+    Test that a base64-encoded v0 transaction normalizes exactly like the JSON encoding.
+    """
+    data = load_data(fixture)
+    wire = copy.deepcopy(data)
+    raw = serialize(data["result"]["transaction"], versioned=True)
+    wire["result"]["transaction"] = [base64.b64encode(raw).decode(), "base64"]
+
+    wire_tx = normalize(wire)
+    assert wire_tx == normalize(data)
+    assert parse(wire_tx) == parse(normalize(data))
+
+
+def test_base64_legacy(load_data, serialize):
+    """
+    Test that legacy (unversioned) transactions decode without address table lookups.
+    """
+    data = load_data("pumpfun_sell_rpc.json")
+    data["result"]["transaction"]["message"]["addressTableLookups"] = []
+    wire = copy.deepcopy(data)
+    raw = serialize(data["result"]["transaction"], versioned=False)
+    wire["result"]["transaction"] = [base64.b64encode(raw).decode(), "base64"]
+
+    assert normalize(wire) == normalize(data)
+    assert normalize(wire, lazy=True).message == normalize(data).message
@@ -0,0 +1,66 @@
+import dataclasses
+
+import qbase58 as base58
+import pytest
+
+from soltxs import normalize, parse, process
+from soltxs.normalizer import pubkey
+from soltxs.normalizer.models import RawInstruction
+from soltxs.normalizer.pubkey import Pubkey
+
+
+@pytest.mark.parametrize("fixture", ["pumpfun_buy_geyser.json", "raydium_amm_v4_geyser.json"])
+def test_protobuf_matches_json(load_data, to_protobuf, fixture):
+    """
+    Test that a protobuf update normalizes, parses and resolves like its JSON counterpart.
+    """
+    data = load_data(fixture)
+    update = to_protobuf(data)
+
+    pb_tx = normalize(update)
+    json_tx = normalize(data)
+
+    assert pb_tx == json_tx
+    assert all(isinstance(i, RawInstruction) for i in pb_tx.message.instructions)
+    assert parse(pb_tx) == parse(json_tx)
+    assert process(update.transaction) == process(data)
+
+
+def test_raw_instruction_skips_base58(load_data, to_protobuf):
+    """
+    Test that protobuf instruction data is used as-is and only encoded on demand.
+    """
+    tx = normalize(to_protobuf(load_data("pumpfun_buy_geyser.json")))
+    instr = tx.message.instructions[0]
+
+    parse(tx)
+    assert instr._data is None
+    assert base58.decode(instr.data) == instr.decoded_data
+
+
+def test_serialized_update_needs_message_class():
+    """
+    Test that serialized protobuf bytes are detected and need the generated classes.
+    """
+    with pytest.raises(ValueError, match="set_message_class"):
+        normalize(b"\x22\x00")
+
+
+def test_protobuf_pubkeys(load_data, to_protobuf):
+    """
+    Test that protobuf account keys stay raw bytes when Pubkey addresses are enabled.
+    """
+    data = load_data("raydium_amm_v4_geyser.json")
+    expected = process(data)
+
+    pubkey.enable()
+    try:
+        tx = normalize(to_protobuf(data))
+        assert all(isinstance(k, Pubkey) and k._raw is not None for k in tx.all_accounts)
+        assert tx.message.accountKeys == normalize(data).message.accountKeys
+        resolved = process(to_protobuf(data).transaction)
+        assert isinstance(resolved.who, Pubkey)
+        tokens = {"from_token": str(resolved.from_token), "to_token": str(resolved.to_token)}
+        assert dataclasses.replace(resolved, who=str(resolved.who), **tokens) == expected
+    finally:
+        pubkey.disable()